@@ -76,9 +76,82 @@ class MT_Preferences(AddonPreferences):
         default=False,
     )
 
+    texture_encoder: EnumProperty(
+        name="Texture Encoder",
+        description=(
+            "What turns images into DDS/.tex data.\n"
+            "texconv is the bundled Windows DLL; the NumPy encoder runs anywhere, "
+            "including headless Blender on Linux, but is slower and its BC7 a "
+            "little lower quality"
+        ),
+        items=[
+            ('AUTO', "Auto", "texconv where its DLL loads, the NumPy encoder elsewhere"),
+            ('TEXCONV', "texconv", "Always the bundled texconv DLL (Windows only)"),
+            ('NUMPY', "NumPy", "Always the built-in NumPy encoder, for the formats it "
+                               "covers (BC1/BC3/BC4/BC5/BC7 and plain 8-bit)"),
+        ],
+        default='AUTO',
+    )
+    numpy_bc7_quality: EnumProperty(
+        name="NumPy BC7 Quality",
+        description="How many BC7 modes the NumPy encoder tries per block",
+        items=[
+            ('FAST', "Fast", "One mode; quickest, fine for smooth textures"),
+            ('NORMAL', "Normal", "Adds separate-alpha and two-subset modes"),
+            ('EXHAUSTIVE', "Exhaustive", "Every mode and several partition shapes; "
+                                         "several times slower"),
+        ],
+        default='NORMAL',
+    )
+    gdeflate_threads: IntProperty(
+        name="GDeflate Threads",
+        description=(
+            "Threads compressing MHWS/RE9 .tex mips in parallel. 0 uses one per "
+            "CPU core. The output is identical for any value"
+        ),
+        default=0, min=0, max=64,
+    )
+    texture_workers: IntProperty(
+        name="Texture Workers",
+        description=(
+            "Textures the MDF processor composes and encodes at once. 0 uses half "
+            "the CPU cores, at most 4. Each one in flight holds its images in memory"
+        ),
+        default=0, min=0, max=32,
+    )
+
+    slot_texture_cache: BoolProperty(
+        name="Cache Processed Textures",
+        description=(
+            "Remember each texture the MDF processor writes, keyed by its source "
+            "images and settings, and copy it back into place on the next Process "
+            "instead of composing and encoding it again when nothing changed"
+        ),
+        default=True,
+    )
+
+    share_identical_textures: BoolProperty(
+        name="Share Identical Textures",
+        description=(
+            "When several material slots of one Process would produce the same "
+            "texture -- same sources and settings, or the same composed pixels -- "
+            "write it once and point every one of those slots at that file"
+        ),
+        default=True,
+    )
+
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "show_console_on_batch_export")
+        row = layout.row()
+        row.prop(self, "texture_encoder")
+        sub = row.row()
+        sub.active = self.texture_encoder != 'TEXCONV'
+        sub.prop(self, "numpy_bc7_quality")
+        layout.prop(self, "gdeflate_threads")
+        layout.prop(self, "texture_workers")
+        layout.prop(self, "slot_texture_cache")
+        layout.prop(self, "share_identical_textures")
         addon_updater_ops.update_settings_ui(self, context)
         # Under the updater UI, because it is the updater's merge-never-delete
         # behaviour that creates the leftovers -- see core/stale_cleanup.py.
@@ -0,0 +1,26 @@
+"""Read one addon preference from code that also runs outside Blender.
+
+The texture pipeline's bpy-free modules (tex_file, tex_encoder, slot_cache,
+the processor's worker settings) each want a preference when they run inside
+Blender and a default when they do not.  ``pref`` is that lookup in one place.
+Getting at the preferences catches only what "there are none to read" raises:
+
+* ``ImportError``    -- no ``bpy``: scripts, benchmarks, worker processes
+* ``KeyError``       -- the addon is not registered (yet)
+* ``AttributeError`` -- no preferences on this context
+
+The attribute itself is read outside that guard, so a misspelt preference
+name fails loudly instead of quietly becoming the default.
+
+Reads ``bpy`` when present, so call it on the main thread.
+"""
+
+
+def pref(name, default):
+    """The addon preference *name*, or *default* where there is none to read."""
+    try:
+        from .console_export import get_preferences
+        prefs = get_preferences()
+    except (ImportError, AttributeError, KeyError):
+        return default
+    return getattr(prefs, name)
@@ -0,0 +1,207 @@
+"""Batch conversion behind the drag & drop operators, on a worker pool.
+
+Dropping a folder of textures used to convert them one after another inside a
+single ``execute`` -- each a blocking texconv or NumPy encode on the main
+thread, with Blender frozen until the last one finished.  Here every dropped
+file is one job on a StagePipeline (core/stage_pipeline.py): the operator
+drives a BatchRun from a modal timer, so progress and per-file results show up
+while the pool works, and Esc drops whatever has not started.
+
+Jobs are bpy-free, like the texture processor's worker stage:
+
+* to DDS -- the NumPy encoder reads PNG/TGA/DDS itself; a source only
+  Blender can decode (JPG/BMP/TIFF, an interlaced PNG) is loaded on the main
+  thread by BatchRun first.  texconv reads every format on its own.  Backend
+  and BC7 quality are the preferences, read once on the main thread.
+* to PNG -- bcn_decode covers what texconv's R8G8B8A8 decode does for the
+  formats it knows; the rest (BC2, BC6H) still go through texconv.
+
+Outputs are written to a temporary name and renamed into place, so a
+cancelled or failed job never leaves half a file next to its source.
+"""
+
+import collections
+import functools
+import os
+import shutil
+import tempfile
+import time
+
+from .stage_pipeline import StagePipeline
+
+
+# ── Jobs (no bpy) ────────────────────────────────────────────────────────────
+
+def _replace_into(out_path, write):
+    """``write(tmp)`` to a sibling temporary, then rename it to *out_path*."""
+    tmp = out_path + '.part'
+    try:
+        write(tmp)
+        os.replace(tmp, out_path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return out_path
+
+
+def to_dds(src, out_path, dxgi_format_name, generate_mips=True, backend=None, quality=None,
+           pixels=None):
+    """Convert *src* to a DDS at *out_path*.  *pixels*: the source already
+    loaded (tex_encoder.load_rgba), for one only Blender can read."""
+    from . import dds_file, tex_encoder
+
+    if tex_encoder.pick_backend(dxgi_format_name, backend) == 'TEXCONV':
+        temp_dir = tempfile.mkdtemp(prefix="tex_drop_")
+        try:
+            dds_path = tex_encoder.convert_to_dds(src, dxgi_format_name, temp_dir,
+                                                  generate_mips=generate_mips, backend='TEXCONV')
+            return _replace_into(out_path, lambda tmp: shutil.copy2(dds_path, tmp))
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    if pixels is None:
+        pixels = tex_encoder.load_rgba(src, blender=False)
+    dds = tex_encoder.encode_array(pixels, dxgi_format_name, generate_mips, quality=quality)
+    return _replace_into(out_path, lambda tmp: dds_file.write_dds(dds, tmp))
+
+
+def to_png(src, out_path):
+    """Decode mip 0 of the DDS *src* to an 8-bit PNG at *out_path* -- stored
+    bytes, no gamma conversion (texconv_native.convert_to_png's contract)."""
+    from . import bcn_decode, dds_file, image_io
+
+    dds = dds_file.read_dds(src)
+    if bcn_decode.can_decode(dds.dxgi_format):
+        pixels = bcn_decode.decode_dds(dds)
+        return _replace_into(out_path, lambda tmp: image_io.write_png(tmp, pixels))
+
+    from . import texconv_native
+    temp_dir = tempfile.mkdtemp(prefix="tex_drop_png_")
+    try:
+        png_path = texconv_native.convert_to_png(src, temp_dir)
+        return _replace_into(out_path, lambda tmp: shutil.copy2(png_path, tmp))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class BatchJob:
+    """One dropped file: ``convert(src, out_path, pixels=...)`` plus whether
+    its source has to be loaded on the main thread first."""
+
+    __slots__ = ('src', 'out_path', 'convert', 'load_here')
+
+    def __init__(self, src, out_path, convert, load_here=False):
+        self.src = src
+        self.out_path = out_path
+        self.convert = convert
+        self.load_here = load_here
+
+    @property
+    def name(self):
+        return os.path.basename(self.src)
+
+
+def dds_jobs(entries, generate_mips, backend, quality):
+    """BatchJobs for ``(src, dxgi format)`` pairs, each written next to its
+    source as ``<stem>.dds``.  *backend*/*quality*: tex_encoder.preferences(),
+    read on the main thread."""
+    from . import image_io, tex_encoder
+    jobs = []
+    for src, fmt in entries:
+        convert = functools.partial(to_dds, dxgi_format_name=fmt, generate_mips=generate_mips,
+                                    backend=backend, quality=quality)
+        numpy = tex_encoder.pick_backend(fmt, backend) == 'NUMPY'
+        readable = image_io.can_read(src) or src.lower().endswith('.dds')
+        jobs.append(BatchJob(src, os.path.splitext(src)[0] + ".dds", convert,
+                             load_here=numpy and not readable))
+    return jobs
+
+
+def png_jobs(paths):
+    return [BatchJob(src, os.path.splitext(src)[0] + ".png", to_png) for src in paths]
+
+
+# ── Driver (main thread) ─────────────────────────────────────────────────────
+
+class BatchRun:
+    """A batch of BatchJobs on a StagePipeline, advanced by step() from a
+    modal timer (or a loop, in execute).  results holds ``(job, error)`` per
+    finished file, error None on success, in completion order."""
+
+    def __init__(self, jobs, workers):
+        self.total = len(jobs)
+        self.pipeline = StagePipeline(workers)
+        self.max_in_flight = self.pipeline.workers * 2
+        self.results = []
+        self.last = None
+        self._jobs = collections.deque(jobs)
+        self._started = time.time()
+
+    @property
+    def cancelled(self):
+        return self.pipeline.cancelled
+
+    @property
+    def handled(self):
+        return len(self.results)
+
+    @property
+    def failed(self):
+        return [(job, err) for job, err in self.results if err is not None]
+
+    @property
+    def done(self):
+        return sum(1 for _job, err in self.results if err is None)
+
+    def step(self, budget):
+        """Submit and collect for about *budget* seconds.  False once every
+        job has finished."""
+        deadline = time.time() + budget
+        self.pipeline.poll()
+        while (self._jobs and not self.cancelled
+               and self.pipeline.pending < self.max_in_flight and time.time() < deadline):
+            self._submit(self._jobs.popleft())
+        self.pipeline.poll()
+        return bool(self._jobs) or self.pipeline.pending > 0
+
+    def _submit(self, job):
+        work = functools.partial(job.convert, job.src, job.out_path)
+        if job.load_here:
+            from . import tex_encoder
+            try:
+                work = functools.partial(work, pixels=tex_encoder.load_rgba(job.src))
+            except Exception as err:
+                self._finished(job, None, err)
+                return
+        self.pipeline.submit(work, on_done=functools.partial(self._finished, job))
+
+    def _finished(self, job, _result, err):
+        from concurrent.futures import CancelledError
+        from . import image_io
+        if isinstance(err, CancelledError):
+            return
+        if isinstance(err, image_io.UnsupportedImage) and not job.load_here:
+            # Only Blender reads it after all (an interlaced PNG): again, with
+            # the source loaded here this time.
+            job.load_here = True
+            self._jobs.appendleft(job)
+            return
+        self.results.append((job, err))
+        self.last = (job, err)
+        if err is None:
+            print(f"[Tex Drop] OK {job.name} -> {os.path.basename(job.out_path)}")
+        else:
+            print(f"[Tex Drop] FAIL {job.name}: {err}")
+
+    def cancel(self):
+        self._jobs.clear()
+        self.pipeline.cancel()
+
+    def finish(self):
+        self.pipeline.drain()
+        self.pipeline.close()
+        print(f"[Tex Drop] {self.done}/{self.total} converted in "
+              f"{time.time() - self._started:.2f}s")
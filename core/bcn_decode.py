@@ -0,0 +1,542 @@
+"""Block-compressed (BCn) texture decoding in NumPy -- no texconv, no temp files.
+
+The texture repack (``core/mdf_port_tex.py``) used to read a .tex, write it back
+out as a DDS, have texconv decode that to a PNG, and load the PNG into a Blender
+image just to get at the pixels: two disk writes and a Windows-only DLL call per
+texture.  Everything that round trip produced is computable straight from the
+mip bytes, so this module does exactly that.
+
+Decoding is block-parallel: each format's fields are pulled out of *every* 4x4
+block at once with array shifts and masks, so the Python-level work is per field,
+never per block or per pixel.  BC7's eight modes are grouped and each group is
+decoded in one pass.
+
+Layouts and tables follow the public Direct3D 11 block-compression spec
+(https://learn.microsoft.com/windows/win32/direct3d11/bc7-format-mode-reference);
+the partition and anchor tables are the spec's own, stored here as 16-bit subset
+masks for the two-subset shapes to keep them legible.
+
+Like ``texconv_native.convert_to_png`` this never gamma-converts: an _SRGB format
+decodes to its stored values, unchanged.  Signed formats (BC4/BC5_SNORM) are
+mapped from -1..1 back into 0..1 -- the inverse of the ``-x2bias`` the encode
+side applies -- so every result is a plain 0..1 image.
+
+Free of ``bpy``.  Arrays come back top row first, as stored in the file; callers
+feeding Blender-ordered code (``image_to_array`` is bottom row first) flip them.
+"""
+
+import numpy as np
+
+from . import dxgi_format as dxgi
+
+_F = dxgi.DXGI_FORMAT
+
+# ── BC7 tables ───────────────────────────────────────────────────────────────
+
+#: Per mode: (subsets, partition bits, rotation bits, index-selection bits,
+#: colour bits, alpha bits, endpoint p-bits, shared p-bits, index bits,
+#: secondary index bits).  Straight from the spec's mode table.
+BC7_MODES = (
+    (3, 4, 0, 0, 4, 0, 1, 0, 3, 0),
+    (2, 6, 0, 0, 6, 0, 0, 1, 3, 0),
+    (3, 6, 0, 0, 5, 0, 0, 0, 2, 0),
+    (2, 6, 0, 0, 7, 0, 1, 0, 2, 0),
+    (1, 0, 2, 1, 5, 6, 0, 0, 2, 3),
+    (1, 0, 2, 0, 7, 8, 0, 0, 2, 2),
+    (1, 0, 0, 0, 7, 7, 1, 0, 4, 0),
+    (2, 6, 0, 0, 5, 5, 1, 0, 2, 0),
+)
+
+#: Two-subset shapes, bit *i* = subset of pixel *i*.
+_P2_MASKS = (
+    0xCCCC, 0x8888, 0xEEEE, 0xECC8, 0xC880, 0xFEEC, 0xFEC8, 0xEC80,
+    0xC800, 0xFFEC, 0xFE80, 0xE800, 0xFFE8, 0xFF00, 0xFFF0, 0xF000,
+    0xF710, 0x008E, 0x7100, 0x08CE, 0x008C, 0x7310, 0x3100, 0x8CCE,
+    0x088C, 0x3110, 0x6666, 0x366C, 0x17E8, 0x0FF0, 0x718E, 0x399C,
+    0xAAAA, 0xF0F0, 0x5A5A, 0x33CC, 0x3C3C, 0x55AA, 0x9696, 0xA55A,
+    0x73CE, 0x13C8, 0x324C, 0x3BDC, 0x6996, 0xC33C, 0x9966, 0x0660,
+    0x0272, 0x04E4, 0x4E40, 0x2720, 0xC936, 0x936C, 0x39C6, 0x639C,
+    0x9336, 0x9CC6, 0x817E, 0xE718, 0xCCF0, 0x0FCC, 0x7744, 0xEE22,
+)
+
+#: Three-subset shapes, one row of 16 subset numbers per shape.
+_P3_ROWS = (
+    '0011001102212222', '0001001122112221', '0000200122112211', '0222002200110111',
+    '0000000011221122', '0011001100220022', '0022002211111111', '0011001122112211',
+    '0000000011112222', '0000111111112222', '0000111122222222', '0012001200120012',
+    '0112011201120112', '0122012201220122', '0011011211221222', '0011200122002220',
+    '0001001101121122', '0111001120012200', '0000112211221122', '0022002200221111',
+    '0111011102220222', '0001000122212221', '0000001101220122', '0000110022102210',
+    '0122012200110000', '0012001211222222', '0110122112210110', '0000011012211221',
+    '0022110211020022', '0110011020022222', '0011012201220011', '0000200022112221',
+    '0000000211221222', '0222002200120011', '0011001200220222', '0120012001200120',
+    '0000111122220000', '0120120120120120', '0120201212010120', '0011220011220011',
+    '0011112222000011', '0101010122222222', '0000000021212121', '0022112200221122',
+    '0022001100220011', '0220122102201221', '0101222222220101', '0000212121212121',
+    '0101010101012222', '0222011102220111', '0002111200021112', '0000211221122112',
+    '0222011101110222', '0002111211120002', '0110011001102222', '0000000021122112',
+    '0110011022222222', '0022001100110022', '0022112211220022', '0000000000002112',
+    '0002000100020001', '0222122202221222', '0101222222222222', '0111201122012220',
+)
+
+#: Anchor pixel of subset 1 in each two-subset shape.
+_A2 = (
+    15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15,
+    15, 2, 8, 2, 2, 8, 8, 15, 2, 8, 2, 2, 8, 8, 2, 2,
+    15, 15, 6, 8, 2, 8, 15, 15, 2, 8, 2, 2, 2, 15, 15, 6,
+    6, 2, 6, 8, 15, 15, 2, 2, 15, 15, 15, 15, 15, 2, 2, 15,
+)
+#: Anchor pixels of subsets 1 and 2 in each three-subset shape.
+_A3A = (
+    3, 3, 15, 15, 8, 3, 15, 15, 8, 8, 6, 6, 6, 5, 3, 3,
+    3, 3, 8, 15, 3, 3, 6, 10, 5, 8, 8, 6, 8, 5, 15, 15,
+    8, 15, 3, 5, 6, 10, 8, 15, 15, 3, 15, 5, 15, 15, 15, 15,
+    3, 15, 5, 5, 5, 8, 5, 10, 5, 10, 8, 13, 15, 12, 3, 3,
+)
+_A3B = (
+    15, 8, 8, 3, 15, 15, 3, 8, 15, 15, 15, 15, 15, 15, 15, 8,
+    15, 8, 15, 3, 15, 8, 15, 8, 3, 15, 6, 10, 15, 15, 10, 8,
+    15, 3, 15, 10, 10, 8, 9, 10, 6, 15, 8, 15, 3, 6, 6, 8,
+    15, 3, 15, 15, 15, 15, 15, 15, 15, 15, 15, 15, 3, 15, 15, 8,
+)
+
+
+def _build_partitions():
+    one = np.zeros((64, 16), dtype=np.uint8)
+    two = np.array([[(m >> i) & 1 for i in range(16)] for m in _P2_MASKS], dtype=np.uint8)
+    three = np.array([[int(c) for c in row] for row in _P3_ROWS], dtype=np.uint8)
+    return {1: one, 2: two, 3: three}
+
+
+def _build_anchor_masks():
+    one = np.zeros((64, 16), dtype=bool)
+    one[:, 0] = True
+    two = one.copy()
+    two[np.arange(64), _A2] = True
+    three = one.copy()
+    three[np.arange(64), _A3A] = True
+    three[np.arange(64), _A3B] = True
+    return {1: one, 2: two, 3: three}
+
+
+#: ``{subset count: (64, 16) uint8}`` -- subset of each pixel, per shape.
+BC7_PARTITIONS = _build_partitions()
+#: ``{subset count: (64, 16) bool}`` -- pixels whose index drops its top bit.
+BC7_ANCHORS = _build_anchor_masks()
+
+#: Interpolation weights (out of 64) per index bit count.
+BC7_WEIGHTS = {
+    2: np.array([0, 21, 43, 64], dtype=np.int16),
+    3: np.array([0, 9, 18, 27, 37, 46, 55, 64], dtype=np.int16),
+    4: np.array([0, 4, 9, 13, 17, 21, 26, 30, 34, 38, 43, 47, 51, 55, 60, 64], dtype=np.int16),
+}
+
+
+# ── Bit access ───────────────────────────────────────────────────────────────
+# A 128-bit block is held as two uint64 halves, so any field is one or two
+# whole-array shifts.  Every BC7 field is at most 8 bits, and every index
+# section but mode 4's fits in 64, so a 64-bit window at a fixed offset is all
+# the reader ever needs.
+
+_U64 = np.uint64
+
+
+def split_blocks(blocks):
+    """(n, 16) uint8 -> (lo, hi) uint64 halves of each 128-bit block."""
+    q = np.ascontiguousarray(blocks).view('<u8')
+    return q[:, 0].copy(), q[:, 1].copy()
+
+
+def window(lo, hi, pos):
+    """Bits pos..pos+63 of every block, zero-filled past bit 127."""
+    if pos == 0:
+        return lo
+    if pos < 64:
+        return (lo >> _U64(pos)) | (hi << _U64(64 - pos))
+    if pos == 64:
+        return hi
+    return hi >> _U64(pos - 64)
+
+
+def read_bits(lo, hi, pos, n):
+    """*n* bits at bit offset *pos* of every block."""
+    return (window(lo, hi, pos) & _U64((1 << n) - 1)).astype(np.int32)
+
+
+def _expand(v, bits):
+    """Endpoint of *bits* precision -> 8 bits by bit replication."""
+    v = v << (8 - bits)
+    return v | (v >> bits)
+
+
+# ── Block layout ─────────────────────────────────────────────────────────────
+
+def _blocks_of(data, width, height, block_bytes):
+    bw, bh = max(1, (width + 3) // 4), max(1, (height + 3) // 4)
+    need = bw * bh * block_bytes
+    buf = np.frombuffer(data, dtype=np.uint8, count=need)
+    return buf.reshape(bw * bh, block_bytes), bw, bh
+
+
+def _assemble(texels, bw, bh, width, height):
+    """Block texels -> (height, width, 4), cropping the padding blocks carry
+    for sizes that are not multiples of 4.
+
+    Takes interleaved ``(n_blocks, 16, 4)`` or channel-planar ``(4, n_blocks,
+    16)``; either way the reorder is a single copy.
+    """
+    if texels.shape[0] == 4 and texels.ndim == 3 and texels.shape[2] == 16:
+        img = texels.reshape(4, bh, bw, 4, 4).transpose(1, 3, 2, 4, 0)
+    else:
+        img = texels.reshape(bh, bw, 4, 4, 4).transpose(0, 2, 1, 3, 4)
+    return img.reshape(bh * 4, bw * 4, 4)[:height, :width]
+
+
+# ── Palette lookup ───────────────────────────────────────────────────────────
+# Every format below builds a small per-block palette and then picks from it
+# with 16 indices per block.  Flattening both into one fancy-index is several
+# times faster than take_along_axis over the same shapes, and keeping the
+# palettes uint8 means only the final image is ever widened to float.
+
+def _to_u8(palette):
+    return np.rint(np.clip(palette, 0.0, 1.0) * 255.0).astype(np.uint8)
+
+
+def _pick(palette, sel):
+    """palette (n, K) or (n, K, 4) uint8 + sel (n, 16) -> (n, 16[, 4])."""
+    n, k = palette.shape[:2]
+    flat = sel.astype(np.intp) + (np.arange(n, dtype=np.intp) * k)[:, None]
+    if palette.ndim == 3:
+        # RGBA8 entries move as one uint32 each.
+        packed = np.ascontiguousarray(palette).view('<u4').reshape(-1)
+        return packed[flat].view(np.uint8).reshape(n, 16, 4)
+    return palette.reshape(-1)[flat]
+
+
+# ── BC1 / BC3 colour ─────────────────────────────────────────────────────────
+
+def _decode_bc1_colour(blocks8, punchthrough):
+    """(n, 8) BC1-layout colour blocks -> (n, 16, 4) uint8.
+
+    *punchthrough* selects BC1's 3-colour + transparent mode when c0 <= c1;
+    BC3's colour half always uses the 4-colour interpolation.
+    """
+    c = blocks8[:, :4].copy().view('<u2')
+    c0, c1 = c[:, 0].astype(np.int32), c[:, 1].astype(np.int32)
+    idx = blocks8[:, 4:8].copy().view('<u4')[:, 0]
+
+    def rgb(v):
+        return np.stack([((v >> 11) & 31) / 31.0, ((v >> 5) & 63) / 63.0, (v & 31) / 31.0],
+                        axis=-1).astype(np.float32)
+
+    e0, e1 = rgb(c0), rgb(c1)
+    n = blocks8.shape[0]
+    palette = np.empty((n, 4, 4), dtype=np.float32)
+    palette[:, 0, :3] = e0
+    palette[:, 1, :3] = e1
+    palette[:, :, 3] = 1.0
+    four = (c0 > c1) if punchthrough else np.ones(n, dtype=bool)
+    palette[:, 2, :3] = np.where(four[:, None], (2 * e0 + e1) / 3.0, (e0 + e1) / 2.0)
+    palette[:, 3, :3] = np.where(four[:, None], (e0 + 2 * e1) / 3.0, 0.0)
+    palette[:, 3, 3] = np.where(four, 1.0, 0.0)
+
+    sel = (idx[:, None] >> (2 * np.arange(16, dtype=np.uint32))) & 3
+    return _pick(_to_u8(palette), sel)
+
+
+# ── BC4-style single channel (also BC3 alpha, BC5 both halves) ──────────────
+
+def _decode_bc4_channel(blocks8, signed=False):
+    """(n, 8) BC4 blocks -> (n, 16) uint8 (signed: remapped from -1..1)."""
+    if signed:
+        e = blocks8[:, :2].view(np.int8).astype(np.float32)
+        e = np.maximum(e, -127.0) / 127.0
+    else:
+        e = blocks8[:, :2].astype(np.float32) / 255.0
+    a0, a1 = e[:, 0:1], e[:, 1:2]
+
+    i = np.arange(1, 7, dtype=np.float32)
+    eight = ((7 - i) * a0 + i * a1) / 7.0                    # 6 interpolated
+    j = np.arange(1, 5, dtype=np.float32)
+    six = ((5 - j) * a0 + j * a1) / 5.0                      # 4 interpolated
+    lo, hi = (-1.0, 1.0) if signed else (0.0, 1.0)
+    n = blocks8.shape[0]
+    palette = np.empty((n, 8), dtype=np.float32)
+    palette[:, 0:1] = a0
+    palette[:, 1:2] = a1
+    mode8 = (a0 > a1)[:, 0]
+    palette[mode8, 2:8] = eight[mode8]
+    palette[~mode8, 2:6] = six[~mode8]
+    palette[~mode8, 6] = lo
+    palette[~mode8, 7] = hi
+    if signed:
+        palette = (palette + 1.0) * 0.5
+
+    bits = np.zeros(n, dtype=np.uint64)
+    for k in range(6):
+        bits |= blocks8[:, 2 + k].astype(np.uint64) << np.uint64(8 * k)
+    sel = (bits[:, None] >> (np.uint64(3) * np.arange(16, dtype=np.uint64))) & np.uint64(7)
+    return _pick(_to_u8(palette), sel)
+
+
+# ── BC7 ──────────────────────────────────────────────────────────────────────
+
+def _build_index_layouts():
+    """``{(subsets, bits): ((64, 16) offsets, (64, 16) masks)}`` as uint64.
+
+    Anchor pixels store one bit fewer, so where each pixel's index starts
+    within the section depends on the block's partition shape.  Tabulated
+    once here, every block's layout is then a row lookup.
+    """
+    layouts = {}
+    for ns, anchors in BC7_ANCHORS.items():
+        for bits in (2, 3, 4):
+            widths = bits - anchors.astype(np.int64)
+            offsets = np.cumsum(widths, axis=1) - widths
+            layouts[ns, bits] = (offsets.astype(np.uint64),
+                                 ((1 << widths) - 1).astype(np.uint64))
+    return layouts
+
+
+_INDEX_LAYOUTS = _build_index_layouts()
+
+
+def read_indices(lo, hi, pos, bits, ns=1, part=None):
+    """All 16 indices of an index section starting at bit *pos* -> (n, 16)."""
+    offsets, masks = _INDEX_LAYOUTS[ns, bits]
+    if ns > 1:
+        offsets, masks = offsets[part], masks[part]
+    else:
+        offsets, masks = offsets[0], masks[0]
+    section = window(lo, hi, pos)[:, None]
+    return ((section >> offsets) & masks).astype(np.intp)
+
+
+def _per_pixel(values, flat):
+    """(n, subsets, 4) int16 -> (n, 16, 4), picking each pixel's subset.
+
+    The four channels travel as one uint64 so the gather runs once.
+    """
+    n = values.shape[0]
+    packed = np.ascontiguousarray(values).view('<u8').reshape(-1)
+    return packed[flat].view(np.int16).reshape(n, 16, 4)
+
+
+def _interpolate(base, d, weights):
+    """One channel of the spec's ``((64 - w) * e0 + w * e1 + 32) >> 6``.
+
+    Rearranged as ``(e0 * 64 + 32 + w * (e1 - e0)) >> 6`` so only one
+    full-size product is formed; at most 64 * 255 + 32 before the shift, so
+    int16 holds it exactly.
+    """
+    v = weights * d
+    v += base
+    v >>= 6
+    return v.astype(np.uint8)
+
+
+def _decode_bc7_mode(lo, hi, mode):
+    """Decode every block of one BC7 mode -> (4, n, 16) uint8, channel-planar.
+
+    Planar because every step below is then a plain (n, 16) array op; an
+    interleaved (n, 16, 4) layout puts a 4-long axis innermost, and numpy's
+    broadcasting is several times slower over that than over 16.
+    """
+    ns, pb, rb, isb, cb, ab, epb, spb, ib, ib2 = BC7_MODES[mode]
+    n = lo.shape[0]
+    pos = mode + 1
+
+    part = read_bits(lo, hi, pos, pb) if pb else np.zeros(n, dtype=np.int32)
+    pos += pb
+    rot = read_bits(lo, hi, pos, rb) if rb else None
+    pos += rb
+    idx_sel = read_bits(lo, hi, pos, isb) if isb else None
+    pos += isb
+
+    n_ep = ns * 2
+    ep = np.zeros((n, n_ep, 4), dtype=np.int16)
+    for ch in range(3):
+        for e in range(n_ep):
+            ep[:, e, ch] = read_bits(lo, hi, pos, cb)
+            pos += cb
+    if ab:
+        for e in range(n_ep):
+            ep[:, e, 3] = read_bits(lo, hi, pos, ab)
+            pos += ab
+
+    cbits, abits = cb, ab
+    if epb or spb:
+        pbits = np.zeros((n, n_ep), dtype=np.int16)
+        if epb:
+            for e in range(n_ep):
+                pbits[:, e] = read_bits(lo, hi, pos, 1)
+                pos += 1
+        else:
+            for s in range(ns):
+                pbits[:, 2 * s:2 * s + 2] = read_bits(lo, hi, pos, 1)[:, None]
+                pos += 1
+        ep[:, :, :3] = (ep[:, :, :3] << 1) | pbits[:, :, None]
+        cbits += 1
+        if ab:
+            ep[:, :, 3] = (ep[:, :, 3] << 1) | pbits
+            abits += 1
+    ep[:, :, :3] = _expand(ep[:, :, :3], cbits)
+    ep[:, :, 3] = _expand(ep[:, :, 3], abits) if ab else 255
+
+    idx1 = read_indices(lo, hi, pos, ib, ns, part)
+    pos += 16 * ib - ns
+    c_w = a_w = BC7_WEIGHTS[ib][idx1]
+    if ib2:
+        # Modes 4/5: alpha gets its own index set; mode 4's selection bit
+        # swaps which set (2- or 3-bit) drives colour and which alpha.
+        a_w = BC7_WEIGHTS[ib2][read_indices(lo, hi, pos, ib2)]
+        if idx_sel is not None:
+            swap = (idx_sel == 1)[:, None]
+            c_w, a_w = np.where(swap, a_w, c_w), np.where(swap, c_w, a_w)
+
+    e0 = ep[:, 0::2]
+    d = ep[:, 1::2] - e0
+    base = (e0 << 6) + 32
+    if ns > 1:
+        rows = np.arange(n, dtype=np.intp)[:, None] * ns
+        flat = rows + BC7_PARTITIONS[ns][part]
+        base, d = _per_pixel(base, flat), _per_pixel(d, flat)
+
+    out = np.empty((4, n, 16), dtype=np.uint8)
+    for ch in range(3):
+        out[ch] = _interpolate(base[..., ch], d[..., ch], c_w)
+    out[3] = _interpolate(base[..., 3], d[..., 3], a_w) if ab else 255
+
+    if rot is not None:
+        for r in (1, 2, 3):
+            m = np.nonzero(rot == r)[0]
+            if m.size:
+                ch = r - 1
+                out[ch, m], out[3, m] = out[3, m], out[ch, m]
+    return out
+
+
+def _decode_bc7(blocks):
+    """(n, 16) BC7 blocks -> (4, n, 16) uint8, channel-planar."""
+    n = blocks.shape[0]
+    first = blocks[:, 0]
+    # Mode = count of trailing zero bits in the first byte; 0x00 is reserved
+    # and decodes to transparent black, per the spec.
+    mode = np.full(n, 8, dtype=np.int32)
+    for m in range(7, -1, -1):
+        mode[(first & (1 << m)) != 0] = m
+    lo, hi = split_blocks(blocks)
+    planar = None
+    for m in range(8):
+        sel = np.nonzero(mode == m)[0]
+        if sel.size == n:
+            planar = _decode_bc7_mode(lo, hi, m)
+            break
+        if sel.size:
+            if planar is None:
+                planar = np.zeros((4, n, 16), dtype=np.uint8)
+            planar[:, sel] = _decode_bc7_mode(lo[sel], hi[sel], m)
+    if planar is None:
+        planar = np.zeros((4, n, 16), dtype=np.uint8)
+    return planar
+
+
+# ── Uncompressed ─────────────────────────────────────────────────────────────
+
+_UNCOMPRESSED_LAYOUT = {
+    # fmt: (bytes per pixel, channel order into RGBA, signed)
+    _F['R8G8B8A8_TYPELESS']: (4, (0, 1, 2, 3), False),
+    _F['R8G8B8A8_UNORM']: (4, (0, 1, 2, 3), False),
+    _F['R8G8B8A8_UNORM_SRGB']: (4, (0, 1, 2, 3), False),
+    _F['R8G8B8A8_UINT']: (4, (0, 1, 2, 3), False),
+    _F['R8G8B8A8_SNORM']: (4, (0, 1, 2, 3), True),
+    _F['B8G8R8A8_UNORM']: (4, (2, 1, 0, 3), False),
+    _F['B8G8R8A8_TYPELESS']: (4, (2, 1, 0, 3), False),
+    _F['B8G8R8A8_UNORM_SRGB']: (4, (2, 1, 0, 3), False),
+    _F['B8G8R8X8_UNORM']: (4, (2, 1, 0, None), False),
+    _F['B8G8R8X8_TYPELESS']: (4, (2, 1, 0, None), False),
+    _F['B8G8R8X8_UNORM_SRGB']: (4, (2, 1, 0, None), False),
+    _F['R8G8_UNORM']: (2, (0, 1, None, None), False),
+    _F['R8_UNORM']: (1, (0, None, None, None), False),
+    _F['A8_UNORM']: (1, (None, None, None, 0), False),
+}
+
+
+def _decode_uncompressed(data, fmt, width, height):
+    bpp, order, signed = _UNCOMPRESSED_LAYOUT[fmt]
+    raw = np.frombuffer(data, dtype=np.int8 if signed else np.uint8,
+                        count=width * height * bpp).reshape(height, width, bpp)
+    out = np.zeros((height, width, 4), dtype=np.float32)
+    out[:, :, 3] = 1.0
+    for dst, src in enumerate(order):
+        if src is None:
+            continue
+        if signed:
+            out[:, :, dst] = (np.maximum(raw[:, :, src], -127) / 127.0 + 1.0) * 0.5
+        else:
+            out[:, :, dst] = raw[:, :, src] / 255.0
+    return out
+
+
+# ── Entry points ─────────────────────────────────────────────────────────────
+
+_BC1 = {_F['BC1_TYPELESS'], _F['BC1_UNORM'], _F['BC1_UNORM_SRGB']}
+_BC3 = {_F['BC3_TYPELESS'], _F['BC3_UNORM'], _F['BC3_UNORM_SRGB']}
+_BC4 = {_F['BC4_TYPELESS'], _F['BC4_UNORM'], _F['BC4_SNORM']}
+_BC5 = {_F['BC5_TYPELESS'], _F['BC5_UNORM'], _F['BC5_SNORM']}
+_BC7 = {_F['BC7_TYPELESS'], _F['BC7_UNORM'], _F['BC7_UNORM_SRGB']}
+_SIGNED = {_F['BC4_SNORM'], _F['BC5_SNORM']}
+
+
+def can_decode(fmt):
+    """True when decode_mip handles this DXGI format (numeric value)."""
+    return fmt in _BC1 or fmt in _BC3 or fmt in _BC4 or fmt in _BC5 or fmt in _BC7 \
+        or fmt in _UNCOMPRESSED_LAYOUT
+
+
+def decode_mip(data, fmt, width, height):
+    """One mip's bytes -> ``(height, width, 4)`` float32 in 0..1, top row first.
+
+    Single-channel formats come back the way texconv's R8G8B8A8 decode lays them
+    out: BC4 fills R, BC5 fills R/G, the rest are 0 with alpha 1.
+
+    Raises ValueError for a format this module does not decode (BC2, BC6H).
+    """
+    width, height = max(1, int(width)), max(1, int(height))
+    if fmt in _UNCOMPRESSED_LAYOUT:
+        return _decode_uncompressed(data, fmt, width, height)
+
+    if fmt in _BC7:
+        blocks, bw, bh = _blocks_of(data, width, height, 16)
+        texels = _decode_bc7(blocks)
+    elif fmt in _BC1:
+        blocks, bw, bh = _blocks_of(data, width, height, 8)
+        texels = _decode_bc1_colour(blocks, punchthrough=True)
+    elif fmt in _BC3:
+        blocks, bw, bh = _blocks_of(data, width, height, 16)
+        texels = _decode_bc1_colour(blocks[:, 8:], punchthrough=False)
+        texels[:, :, 3] = _decode_bc4_channel(blocks[:, :8])
+    elif fmt in _BC4:
+        blocks, bw, bh = _blocks_of(data, width, height, 8)
+        texels = np.zeros((blocks.shape[0], 16, 4), dtype=np.uint8)
+        texels[:, :, 0] = _decode_bc4_channel(blocks, signed=fmt in _SIGNED)
+        texels[:, :, 3] = 255
+    elif fmt in _BC5:
+        blocks, bw, bh = _blocks_of(data, width, height, 16)
+        texels = np.zeros((blocks.shape[0], 16, 4), dtype=np.uint8)
+        texels[:, :, 0] = _decode_bc4_channel(blocks[:, :8], signed=fmt in _SIGNED)
+        texels[:, :, 1] = _decode_bc4_channel(blocks[:, 8:], signed=fmt in _SIGNED)
+        texels[:, :, 3] = 255
+    else:
+        name = dxgi.DXGI_FORMAT_NAMES.get(fmt, str(fmt))
+        raise ValueError(f"Unsupported format for decoding: {name}")
+
+    img = _assemble(texels, bw, bh, width, height)
+    return np.multiply(img, np.float32(1.0 / 255.0), dtype=np.float32)
+
+
+def decode_dds(dds, level=0):
+    """Mip *level* of a dds_file.DDSFile -> ``(h, w, 4)`` float32, top row first."""
+    w = max(1, dds.width >> level)
+    h = max(1, dds.height >> level)
+    return decode_mip(dds.mips[level], dds.dxgi_format, w, h)
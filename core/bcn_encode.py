@@ -0,0 +1,533 @@
+"""Block-compressed (BCn) texture encoding in NumPy -- the write side of
+``core/bcn_decode.py``, for machines where texconv's DLL is not an option.
+
+texconv is a Windows DLL; a headless Blender on a Linux box has no way to load it,
+so every texture write there failed outright.  This encodes BC1/BC3/BC4/BC5/BC7
+(and the plain 8-bit layouts) itself.  It is not trying to beat DirectXTex on
+quality -- where the DLL loads, ``core/tex_encoder.py`` still prefers it -- only to
+produce correct, reasonable output anywhere NumPy runs.
+
+Like the decoder, work is batched across blocks: endpoint selection, quantisation,
+index assignment and bit packing each run over *every* 4x4 block at once (in
+chunks, to cap memory), never per block.  Endpoints come from each block's
+principal axis, optionally re-fitted by least squares against the indices they
+produced.
+
+BC7 has eight modes, and the quality tier picks how many of them are tried per
+block (the lowest-error result wins):
+
+* ``FAST``       -- mode 6 only: one subset, RGBA together.  Fine for smooth
+  content, and the cheapest mode to search.
+* ``NORMAL``     -- adds mode 5 (alpha on its own index set, which is what the
+  packed slots need: their A channel rarely correlates with RGB) and mode 1
+  with the best-scoring two-subset partition, for hard colour edges.
+* ``EXHAUSTIVE`` -- every mode, the four best partition shapes per two-subset
+  mode, and an extra refinement pass.  Several times slower than NORMAL.
+
+Tables and bit layouts are bcn_decode's; the two modules cannot drift apart.
+
+Never gamma-converts, same contract as ``texconv_native.convert_to_dds``: an
+_SRGB format is a header tag only.  Signed formats take 0..1 input and apply the
+``-x2bias`` mapping (``v * 2 - 1``) that convert_to_dds asks texconv for.
+
+Free of ``bpy``.  Input is ``(h, w, 4)`` uint8, top row first -- file order.
+"""
+
+import numpy as np
+
+from . import dxgi_format as dxgi
+from .bcn_decode import (BC7_ANCHORS, BC7_MODES, BC7_PARTITIONS, BC7_WEIGHTS,
+                         _INDEX_LAYOUTS, _UNCOMPRESSED_LAYOUT, _expand)
+
+_F = dxgi.DXGI_FORMAT
+
+QUALITY_TIERS = ('FAST', 'NORMAL', 'EXHAUSTIVE')
+
+#: BC7 modes tried per tier, in the order they are tried.
+BC7_QUALITY_MODES = {
+    'FAST': (6,),
+    'NORMAL': (6, 5, 1),
+    'EXHAUSTIVE': (6, 5, 4, 7, 1, 3, 0, 2),
+}
+#: Partition shapes fully encoded per multi-subset mode, best-ranked first.
+_PARTITION_CANDIDATES = {'FAST': 1, 'NORMAL': 1, 'EXHAUSTIVE': 4}
+#: Least-squares endpoint re-fits after the first index assignment.
+_REFINE_PASSES = {'FAST': 0, 'NORMAL': 1, 'EXHAUSTIVE': 2}
+
+#: Blocks per batch.  Bounds the temporaries of the widest step (partition
+#: ranking, 64 shapes x 3 subsets x 4 channels per block) to a few tens of MB.
+_CHUNK = 16384
+
+_U64 = np.uint64
+
+
+def _build_anchor_pixels():
+    """``{subsets: (64, subsets)}`` -- the anchor pixel of each subset."""
+    out = {}
+    for ns in (1, 2, 3):
+        table = np.zeros((64, ns), dtype=np.intp)
+        for shape in range(64):
+            for px in np.nonzero(BC7_ANCHORS[ns][shape])[0]:
+                table[shape, BC7_PARTITIONS[ns][shape, px]] = px
+        out[ns] = table
+    return out
+
+
+_ANCHOR_PIXELS = _build_anchor_pixels()
+
+#: Weight-space decision boundaries: an index is the nearest weight, so a
+#: projected position ``t * 64`` falls to it between these midpoints.
+_MIDPOINTS = {bits: (w[:-1] + w[1:]) / 2.0 for bits, w in BC7_WEIGHTS.items()}
+
+
+# ── Block layout ─────────────────────────────────────────────────────────────
+
+def _to_blocks(rgba):
+    """(h, w, 4) -> (n_blocks, 16, 4), row-major blocks.  Edges are padded by
+    repeating the last row/column, so padding never pulls an endpoint away
+    from the real pixels."""
+    h, w = rgba.shape[:2]
+    ph, pw = -h % 4, -w % 4
+    if ph or pw:
+        rgba = np.pad(rgba, ((0, ph), (0, pw), (0, 0)), mode='edge')
+    bh, bw = rgba.shape[0] // 4, rgba.shape[1] // 4
+    return rgba.reshape(bh, 4, bw, 4, 4).transpose(0, 2, 1, 3, 4).reshape(bh * bw, 16, 4)
+
+
+def _chunks(n):
+    for start in range(0, n, _CHUNK):
+        yield slice(start, min(n, start + _CHUNK))
+
+
+# ── Endpoint fitting ─────────────────────────────────────────────────────────
+
+def _principal_endpoints(px, mask):
+    """Extremes of the masked pixels along their principal axis.
+
+    px (n, 16, C) float32, mask (n, 16) bool -> e0, e1 (n, C).  The axis is a
+    few power iterations on the covariance, started from its largest column
+    so an axis orthogonal to grey (red against green, say) is still found.
+    """
+    m = mask[..., None].astype(np.float32)
+    cnt = np.maximum(m.sum(axis=1), 1.0)
+    mean = (px * m).sum(axis=1) / cnt
+    dev = (px - mean[:, None]) * m
+    cov = np.einsum('npi,npj->nij', dev, dev)
+    diag = np.einsum('nii->ni', cov)
+    axis = np.take_along_axis(cov, diag.argmax(axis=1)[:, None, None], axis=2)[..., 0]
+    for _ in range(4):
+        axis = np.einsum('nij,nj->ni', cov, axis)
+        axis /= np.maximum(np.linalg.norm(axis, axis=1, keepdims=True), 1e-12)
+    t = np.einsum('npc,nc->np', dev, axis)
+    t_lo = np.where(mask, t, np.inf).min(axis=1)
+    t_hi = np.where(mask, t, -np.inf).max(axis=1)
+    t_lo = np.where(np.isfinite(t_lo), t_lo, 0.0)[:, None]
+    t_hi = np.where(np.isfinite(t_hi), t_hi, 0.0)[:, None]
+    e0 = np.clip(mean + axis * t_lo, 0.0, 255.0)
+    e1 = np.clip(mean + axis * t_hi, 0.0, 255.0)
+    return e0, e1
+
+
+def _least_squares_endpoints(px, w, mask, e0, e1):
+    """Endpoints minimising the squared error of ``(1 - w) * e0 + w * e1``
+    against the masked pixels, for fixed per-pixel weights *w* in 0..1.
+    Blocks whose weights are degenerate (all one index) keep *e0*/*e1*."""
+    m = mask.astype(np.float32)
+    a = ((1 - w) ** 2 * m).sum(axis=1)
+    b = ((1 - w) * w * m).sum(axis=1)
+    c = (w * w * m).sum(axis=1)
+    x0 = ((1 - w) * m)[..., None] * px
+    x1 = (w * m)[..., None] * px
+    x0, x1 = x0.sum(axis=1), x1.sum(axis=1)
+    det = (a * c - b * b)[:, None]
+    ok = np.abs(det) > 1e-3
+    safe = np.where(ok, det, 1.0)
+    n0 = np.clip((c[:, None] * x0 - b[:, None] * x1) / safe, 0.0, 255.0)
+    n1 = np.clip((a[:, None] * x1 - b[:, None] * x0) / safe, 0.0, 255.0)
+    return np.where(ok, n0, e0), np.where(ok, n1, e1)
+
+
+# ── BC1 / BC3 colour ─────────────────────────────────────────────────────────
+
+def _pack565(rgb):
+    q = np.rint(rgb * (np.array([31.0, 63.0, 31.0]) / 255.0)).astype(np.int32)
+    q = np.clip(q, 0, [31, 63, 31])
+    return (q[:, 0] << 11) | (q[:, 1] << 5) | q[:, 2]
+
+
+def _unpack565(c):
+    return np.stack([((c >> 11) & 31) * (255.0 / 31.0), ((c >> 5) & 63) * (255.0 / 63.0),
+                     (c & 31) * (255.0 / 31.0)], axis=-1).astype(np.float32)
+
+
+def _bc1_indices(px, c0, c1, levels, codes):
+    """Nearest of *levels* (positions 0..1 from c0 to c1) per pixel -> codes."""
+    e0, e1 = _unpack565(c0)[:, None], _unpack565(c1)[:, None]
+    d = e1 - e0
+    dd = np.maximum((d * d).sum(axis=-1), 1e-6)
+    t = ((px - e0) * d).sum(axis=-1) / dd
+    nearest = np.abs(t[..., None] - levels).argmin(axis=-1)
+    return codes[nearest]
+
+
+_BC1_FOUR = (np.array([0.0, 1 / 3, 2 / 3, 1.0], dtype=np.float32), np.array([0, 2, 3, 1]))
+_BC1_THREE = (np.array([0.0, 0.5, 1.0], dtype=np.float32), np.array([0, 2, 1]))
+
+
+def _encode_bc1_colour(blocks, punchthrough, refine):
+    """(n, 16, 4) uint8 -> (n, 8) uint8 BC1 colour blocks.
+
+    *punchthrough*: blocks with any alpha below 128 use BC1's 3-colour mode
+    (c0 <= c1) and index 3 for their transparent pixels.  Otherwise -- and
+    always for BC3's colour half -- the 4-colour mode, c0 > c1.
+    """
+    n = blocks.shape[0]
+    px = blocks[..., :3].astype(np.float32)
+    opaque = blocks[..., 3] >= 128 if punchthrough else np.ones((n, 16), dtype=bool)
+    three = ~opaque.all(axis=1)
+
+    e0, e1 = _principal_endpoints(px, opaque)
+    for it in range(refine + 1):
+        c0, c1 = _pack565(e0), _pack565(e1)
+        # 4-colour blocks need c0 > c1, 3-colour ones c0 <= c1; equal
+        # endpoints decode as 3-colour with index 0 everywhere, fine for both.
+        swap = np.where(three, c0 > c1, c0 < c1)
+        c0, c1 = np.where(swap, c1, c0), np.where(swap, c0, c1)
+        idx = np.where(three[:, None], _bc1_indices(px, c0, c1, *_BC1_THREE),
+                       _bc1_indices(px, c0, c1, *_BC1_FOUR))
+        if it == refine:
+            break
+        level = np.where(three[:, None], np.array([0.0, 1.0, 0.5, 0.0])[idx],
+                         np.array([0.0, 1.0, 1 / 3, 2 / 3])[idx]).astype(np.float32)
+        e0, e1 = _least_squares_endpoints(px, level, opaque, _unpack565(c0), _unpack565(c1))
+    idx = np.where(opaque, idx, 3)
+
+    out = np.empty((n, 8), dtype=np.uint8)
+    out[:, 0:4] = np.stack([c0, c1], axis=1).astype('<u2').view(np.uint8)
+    packed = (idx.astype(np.uint32) << (2 * np.arange(16, dtype=np.uint32))).sum(axis=1)
+    out[:, 4:8] = packed.astype('<u4')[:, None].view(np.uint8)
+    return out
+
+
+# ── BC4-style single channel ─────────────────────────────────────────────────
+
+def _encode_bc4_channel(values, signed=False):
+    """(n, 16) uint8 -> (n, 8) uint8 BC4 blocks (signed: x2bias to SNORM).
+
+    Endpoints are the block's extremes in the 8-value mode (a0 > a1); a flat
+    block writes a0 == a1 with every index 0.
+    """
+    if signed:
+        v = np.rint(values.astype(np.float32) * (254.0 / 255.0) - 127.0)
+    else:
+        v = values.astype(np.float32)
+    a0, a1 = v.max(axis=1), v.min(axis=1)
+    span = np.maximum(a0 - a1, 1e-6)[:, None]
+    step = np.rint((a0[:, None] - v) / span * 7.0).astype(np.int64)
+    # Position 0 is a0, 7 is a1, 1..6 the interpolants -- codes 0, 1, 2..7.
+    idx = np.array([0, 2, 3, 4, 5, 6, 7, 1], dtype=np.uint64)[np.clip(step, 0, 7)]
+    idx[a0 == a1] = 0
+
+    n = values.shape[0]
+    out = np.empty((n, 8), dtype=np.uint8)
+    ends = np.stack([a0, a1], axis=1).astype(np.int16)
+    out[:, 0:2] = (ends.astype(np.int8).view(np.uint8) if signed else ends.astype(np.uint8))
+    packed = (idx << (_U64(3) * np.arange(16, dtype=np.uint64))).sum(axis=1)
+    out[:, 2:8] = packed.astype('<u8')[:, None].view(np.uint8)[:, :6]
+    return out
+
+
+# ── BC7 ──────────────────────────────────────────────────────────────────────
+
+def _put(lo, hi, pos, nbits, val):
+    """OR *nbits* of *val* (uint64 per block) in at bit *pos*."""
+    if pos < 64:
+        lo |= val << _U64(pos)
+        if pos + nbits > 64:
+            hi |= val >> _U64(64 - pos)
+    else:
+        hi |= val << _U64(pos - 64)
+
+
+def _quantize_endpoints(ep, cb, ab, epb, spb):
+    """(n, n_ep, 4) float 0..255 -> (q, pbits, rec).
+
+    *q* is what gets stored per channel, *pbits* the p-bit per endpoint (or
+    None), *rec* the 8-bit values a decoder expands them back to.  With
+    p-bits, both settings are tried and the one that reconstructs closer
+    wins -- per endpoint, or per subset pair for a shared bit.
+    """
+    n, n_ep = ep.shape[:2]
+    bits = np.array([cb, cb, cb, ab or 8])
+    weight = np.array([1.0, 1.0, 1.0, 1.0 if ab else 0.0], dtype=np.float32)
+    if not (epb or spb):
+        q = np.clip(np.rint(ep * (((1 << bits) - 1) / 255.0)), 0, (1 << bits) - 1).astype(np.int32)
+        rec = _expand(q, bits).astype(np.int32)
+        pbits = None
+    else:
+        full = bits + 1
+        qs, recs, errs = [], [], []
+        for p in (0, 1):
+            q = np.rint((ep * (((1 << full) - 1) / 255.0) - p) / 2.0)
+            q = np.clip(q, 0, (1 << bits) - 1).astype(np.int32)
+            rec = _expand((q << 1) | p, full).astype(np.int32)
+            qs.append(q)
+            recs.append(rec)
+            errs.append((((rec - ep) ** 2) * weight).sum(axis=-1))
+        if spb:
+            e = [x.reshape(n, n_ep // 2, 2).sum(axis=-1) for x in errs]
+            pbits = (e[1] < e[0]).astype(np.int32)
+            per_ep = np.repeat(pbits, 2, axis=1)
+        else:
+            pbits = (errs[1] < errs[0]).astype(np.int32)
+            per_ep = pbits
+        pick = per_ep[..., None].astype(bool)
+        q = np.where(pick, qs[1], qs[0])
+        rec = np.where(pick, recs[1], recs[0])
+    if not ab:
+        q[..., 3] = 0
+        rec[..., 3] = 255
+    return q, pbits, rec
+
+
+def _pixel_endpoints(rec, subset, ch):
+    """Each pixel's subset endpoints for channels *ch* -> e0, e1 (n, 16, C).
+
+    *subset* None means one subset: the endpoints come back (n, 1, C) and
+    broadcast, skipping a gather that would only copy them 16 times.
+    """
+    if subset is None:
+        return rec[:, 0:1, ch], rec[:, 1:2, ch]
+    rows = np.arange(rec.shape[0])[:, None]
+    return rec[:, 0::2, ch][rows, subset], rec[:, 1::2, ch][rows, subset]
+
+
+def _assign_indices(px, rec, subset, bits, ch):
+    """Nearest palette index per pixel for channels *ch* (a slice) -> (n, 16).
+
+    A palette is collinear, so nearest-by-distance is nearest-by-projection
+    onto the endpoint line: one dot product and a search over midpoints.
+    """
+    e0, e1 = _pixel_endpoints(rec, subset, ch)
+    e0 = e0.astype(np.float32)
+    d = e1 - e0
+    dd = np.maximum((d * d).sum(axis=-1), 1e-6)
+    t = ((px[..., ch] - e0) * d).sum(axis=-1) / dd * 64.0
+    return np.searchsorted(_MIDPOINTS[bits], t)
+
+
+def _reconstruct(rec, subset, idx, bits, ch):
+    """Decoded values of channels *ch* -> (n, 16, C) int32, exactly as the
+    decoder computes them."""
+    w = BC7_WEIGHTS[bits].astype(np.int32)[idx][..., None]
+    e0, e1 = _pixel_endpoints(rec, subset, ch)
+    return ((e1 - e0) * w + (e0 << 6) + 32) >> 6
+
+
+def _encode_bc7_mode(px, mode, part, refine):
+    """Encode every block in *mode* with partition shape *part* (n,).
+
+    px (n, 16, 4) float32 -> (lo, hi, err): the packed block halves and each
+    block's squared RGBA error as decoded.
+    """
+    ns, pb, rb, isb, cb, ab, epb, spb, ib, ib2 = BC7_MODES[mode]
+    n = px.shape[0]
+    subset = BC7_PARTITIONS[ns][part].astype(np.intp)
+    masks = [subset == s for s in range(ns)]
+    if ns == 1:
+        subset = None
+    # Separate-index modes (4/5) and the alpha-less ones fit colour alone.
+    colour = slice(0, 4) if (ab and not ib2) else slice(0, 3)
+    alpha = slice(3, 4)
+
+    ep = np.empty((n, 2 * ns, 4), dtype=np.float32)
+    ep[..., 3] = 255.0
+    for s, mask in enumerate(masks):
+        ep[:, 2 * s, colour], ep[:, 2 * s + 1, colour] = _principal_endpoints(px[..., colour], mask)
+    if ib2:
+        ep[:, 0, 3], ep[:, 1, 3] = px[..., 3].min(axis=1), px[..., 3].max(axis=1)
+
+    best = None
+    for it in range(refine + 1):
+        q, pbits, rec = _quantize_endpoints(ep, cb, ab, epb, spb)
+        idx = _assign_indices(px, rec, subset, ib, colour)
+        dec = np.empty((n, 16, 4), dtype=np.int32)
+        dec[..., colour] = _reconstruct(rec, subset, idx, ib, colour)
+        idx2 = None
+        if ib2:
+            idx2 = _assign_indices(px, rec, None, ib2, alpha)
+            dec[..., alpha] = _reconstruct(rec, None, idx2, ib2, alpha)
+        elif not ab:
+            dec[..., 3] = 255
+        err = ((dec - px) ** 2).sum(axis=(1, 2))
+        cand = (err, q, pbits, idx, idx2)
+        if best is None:
+            best = cand
+        else:
+            keep = best[0] <= err
+            best = tuple(None if b is None else np.where(keep.reshape((n,) + (1,) * (b.ndim - 1)), b, c)
+                         for b, c in zip(best, cand))
+        if it == refine:
+            break
+        w = BC7_WEIGHTS[ib][idx] / 64.0
+        for s, mask in enumerate(masks):
+            ep[:, 2 * s, colour], ep[:, 2 * s + 1, colour] = _least_squares_endpoints(
+                px[..., colour], w, mask, ep[:, 2 * s, colour], ep[:, 2 * s + 1, colour])
+        if ib2:
+            w2 = BC7_WEIGHTS[ib2][idx2] / 64.0
+            ep[:, 0, alpha], ep[:, 1, alpha] = _least_squares_endpoints(
+                px[..., alpha], w2, np.ones((n, 16), dtype=bool), ep[:, 0, alpha], ep[:, 1, alpha])
+    err, q, pbits, idx, idx2 = best
+
+    # Anchor pixels store their index without its top bit, so it must be 0.
+    # Swapping a subset's endpoints and mirroring its indices decodes to the
+    # same colours (the weight tables are symmetric) and clears it.
+    rows = np.arange(n)
+    half = 1 << (ib - 1)
+    chans = [0, 1, 2, 3] if colour.stop == 4 else [0, 1, 2]
+    for s in range(ns):
+        anchor = _ANCHOR_PIXELS[ns][part, s]
+        flip = idx[rows, anchor] >= half
+        a, b = 2 * s, 2 * s + 1
+        for c in chans:
+            q[flip, a, c], q[flip, b, c] = q[flip, b, c], q[flip, a, c]
+        if epb:
+            pbits[flip, a], pbits[flip, b] = pbits[flip, b], pbits[flip, a]
+        mirror = flip[:, None] & masks[s]
+        idx = np.where(mirror, (1 << ib) - 1 - idx, idx)
+    if ib2:
+        flip = idx2[:, 0] >= (1 << (ib2 - 1))
+        q[flip, 0, 3], q[flip, 1, 3] = q[flip, 1, 3], q[flip, 0, 3]
+        idx2 = np.where(flip[:, None], (1 << ib2) - 1 - idx2, idx2)
+
+    lo = np.zeros(n, dtype=np.uint64)
+    hi = np.zeros(n, dtype=np.uint64)
+    _put(lo, hi, 0, mode + 1, np.full(n, 1 << mode, dtype=np.uint64))
+    pos = mode + 1
+    if pb:
+        _put(lo, hi, pos, pb, part.astype(np.uint64))
+    pos += pb + rb + isb          # rotation 0, index selection 0
+    for c in range(3):
+        for e in range(2 * ns):
+            _put(lo, hi, pos, cb, q[:, e, c].astype(np.uint64))
+            pos += cb
+    if ab:
+        for e in range(2 * ns):
+            _put(lo, hi, pos, ab, q[:, e, 3].astype(np.uint64))
+            pos += ab
+    if epb or spb:
+        for k in range(pbits.shape[1]):
+            _put(lo, hi, pos, 1, pbits[:, k].astype(np.uint64))
+            pos += 1
+    offsets = _INDEX_LAYOUTS[ns, ib][0]
+    offsets = offsets[part] if ns > 1 else offsets[0]
+    _put(lo, hi, pos, 16 * ib - ns, (idx.astype(np.uint64) << offsets).sum(axis=1))
+    pos += 16 * ib - ns
+    if ib2:
+        offsets = _INDEX_LAYOUTS[1, ib2][0][0]
+        _put(lo, hi, pos, 16 * ib2 - 1, (idx2.astype(np.uint64) << offsets).sum(axis=1))
+    return lo, hi, err
+
+
+def _rank_partitions(px, ns, k):
+    """The *k* partition shapes per block whose subsets each scatter least
+    about their own mean -> (k, n).  A cheap stand-in for encoding all 64.
+
+    Minimising the within-subset scatter is maximising sum(|subset sum|^2 /
+    count), and every subset sum of every shape is one matrix product.
+    """
+    n, _, c = px.shape
+    masks = np.concatenate([BC7_PARTITIONS[ns] == s for s in range(ns)]).astype(np.float32)
+    cnt = np.maximum(masks.sum(axis=1), 1.0)                          # (ns * 64,)
+    sums = masks @ px.transpose(1, 0, 2).reshape(16, n * c)           # (ns * 64, n * C)
+    explained = (sums.reshape(-1, n, c) ** 2).sum(axis=2) / cnt[:, None]
+    explained = explained.reshape(ns, 64, n).sum(axis=0)             # (64, n)
+    return np.argsort(-explained, axis=0)[:k]
+
+
+def _encode_bc7(blocks, quality):
+    """(n, 16, 4) uint8 -> (n, 16) uint8 BC7 blocks."""
+    px = blocks.astype(np.float32)
+    n = px.shape[0]
+    opaque = (blocks[..., 3] == 255).all(axis=1)
+    lo = np.zeros(n, dtype=np.uint64)
+    hi = np.zeros(n, dtype=np.uint64)
+    best = np.full(n, np.inf)
+    refine = _REFINE_PASSES[quality]
+    for mode in BC7_QUALITY_MODES[quality]:
+        ns, ab = BC7_MODES[mode][0], BC7_MODES[mode][5]
+        # Modes without alpha decode A as 255 -- only worth trying where
+        # that is already right.
+        sel = np.arange(n) if ab else np.nonzero(opaque)[0]
+        if not sel.size:
+            continue
+        sub = px[sel]
+        if ns == 1:
+            parts = [np.zeros(sel.size, dtype=np.intp)]
+        else:
+            parts = _rank_partitions(sub, ns, _PARTITION_CANDIDATES[quality])
+        for part in parts:
+            m_lo, m_hi, err = _encode_bc7_mode(sub, mode, part, refine)
+            better = err < best[sel]
+            hit = sel[better]
+            lo[hit], hi[hit], best[hit] = m_lo[better], m_hi[better], err[better]
+    return np.stack([lo, hi], axis=1).astype('<u8').view(np.uint8)
+
+
+# ── Entry points ─────────────────────────────────────────────────────────────
+
+_BC1 = {_F['BC1_TYPELESS'], _F['BC1_UNORM'], _F['BC1_UNORM_SRGB']}
+_BC3 = {_F['BC3_TYPELESS'], _F['BC3_UNORM'], _F['BC3_UNORM_SRGB']}
+_BC4 = {_F['BC4_TYPELESS'], _F['BC4_UNORM'], _F['BC4_SNORM']}
+_BC5 = {_F['BC5_TYPELESS'], _F['BC5_UNORM'], _F['BC5_SNORM']}
+_BC7 = {_F['BC7_TYPELESS'], _F['BC7_UNORM'], _F['BC7_UNORM_SRGB']}
+_SIGNED = {_F['BC4_SNORM'], _F['BC5_SNORM']}
+_PLAIN = {fmt: (bpp, order) for fmt, (bpp, order, signed) in _UNCOMPRESSED_LAYOUT.items() if not signed}
+
+
+def can_encode(fmt):
+    """True when encode_mip handles this DXGI format (numeric value)."""
+    return any(fmt in s for s in (_BC1, _BC3, _BC4, _BC5, _BC7, _PLAIN))
+
+
+def encode_mip(rgba, fmt, quality='NORMAL'):
+    """``(h, w, 4)`` uint8, top row first -> one mip's bytes in *fmt*.
+
+    *quality* is one of QUALITY_TIERS; it only changes BC7 (mode search) and
+    the number of endpoint refinement passes elsewhere.
+
+    Raises ValueError for a format this module does not encode.
+    """
+    if quality not in QUALITY_TIERS:
+        raise ValueError(f"Unknown quality tier: {quality}")
+    rgba = np.ascontiguousarray(rgba, dtype=np.uint8)
+
+    if fmt in _PLAIN:
+        bpp, order = _PLAIN[fmt]
+        out = np.full(rgba.shape[:2] + (bpp,), 255, dtype=np.uint8)
+        for dst, src in enumerate(order):
+            if src is not None:
+                out[..., src] = rgba[..., dst]
+        return out.tobytes()
+
+    blocks = _to_blocks(rgba)
+    refine = min(1, _REFINE_PASSES[quality])
+    parts = []
+    for sl in _chunks(blocks.shape[0]):
+        b = blocks[sl]
+        if fmt in _BC7:
+            parts.append(_encode_bc7(b, quality))
+        elif fmt in _BC1:
+            parts.append(_encode_bc1_colour(b, True, refine))
+        elif fmt in _BC3:
+            parts.append(np.concatenate([_encode_bc4_channel(b[..., 3]),
+                                         _encode_bc1_colour(b, False, refine)], axis=1))
+        elif fmt in _BC4:
+            parts.append(_encode_bc4_channel(b[..., 0], signed=fmt in _SIGNED))
+        elif fmt in _BC5:
+            parts.append(np.concatenate([_encode_bc4_channel(b[..., 0], signed=fmt in _SIGNED),
+                                         _encode_bc4_channel(b[..., 1], signed=fmt in _SIGNED)], axis=1))
+        else:
+            name = dxgi.DXGI_FORMAT_NAMES.get(fmt, str(fmt))
+            raise ValueError(f"Unsupported format for encoding: {name}")
+    return b''.join(p.tobytes() for p in parts)
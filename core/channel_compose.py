@@ -0,0 +1,131 @@
+"""Channel packing on single-channel planes, in the sources' own sample type.
+
+Both _compose_channels (mdf_tex_processor_base, keyed by PBR type; and
+tex_convert_base, keyed by 'A'/'B') used to load every referenced source as a
+full ``(h, w, 4)`` float32 array -- 64 MB at 4K -- even when the channel map
+reads one channel of it (roughness R, AO R), and then allocate a float32
+result on top.  A material with six 4K sources held well over a gigabyte.
+
+Here a source is loaded as just the channels the map reads, each a separate
+``(h, w)`` plane in the type the file stores: uint8 for an 8-bit PNG/TGA or a
+block-compressed DDS, uint16 for a 16-bit PNG.  Composing stays in that type
+-- an invert is ``255 - x`` -- and the result is uint8 unless a source was
+wider.  Only the two genuinely non-linear steps, the octahedral normal encode
+and the AO bake, go through float, on the planes they touch.
+
+Sources only Blender can decode (JPG, BMP, TIFF, EXR) come back as float32
+planes, and a result with any float input is float32 -- the old behaviour.
+
+Planes are top row first, as decoded.  Free of ``bpy`` apart from that
+Blender fallback (tex_encoder.load_rgba).
+"""
+
+import numpy as np
+
+from . import image_io
+
+
+def top(dtype):
+    """The sample value that means 1.0."""
+    return float(np.iinfo(dtype).max) if np.dtype(dtype).kind in 'ui' else 1.0
+
+
+def common_dtype(planes):
+    """The narrowest type every one of *planes* converts into losslessly."""
+    kinds = {np.dtype(p.dtype) for p in planes}
+    if not kinds or kinds <= {np.dtype(np.uint8)}:
+        return np.dtype(np.uint8)
+    if kinds <= {np.dtype(np.uint8), np.dtype(np.uint16)}:
+        return np.dtype(np.uint16)
+    return np.dtype(np.float32)
+
+
+def to_float(plane):
+    if plane.dtype.kind == 'f':
+        return plane.astype(np.float32, copy=False)
+    return plane.astype(np.float32) * np.float32(1.0 / top(plane.dtype))
+
+
+def from_float(arr, dtype):
+    """0..1 floats -> *dtype*, rounding half up like image_io.to_samples."""
+    dtype = np.dtype(dtype)
+    if dtype.kind == 'f':
+        return arr.astype(dtype, copy=False)
+    out = np.clip(arr, 0.0, 1.0) * np.float32(top(dtype))
+    out += 0.5
+    return np.floor(out, out=out).astype(dtype)
+
+
+def convert(plane, dtype):
+    dtype = np.dtype(dtype)
+    if plane.dtype == dtype:
+        return plane
+    if plane.dtype == np.uint8 and dtype == np.uint16:
+        return plane.astype(np.uint16) * np.uint16(257)
+    return from_float(to_float(plane), dtype)
+
+
+def constant(value, dtype):
+    """A 0..1 constant as a sample of *dtype*."""
+    dtype = np.dtype(dtype)
+    if dtype.kind == 'f':
+        return dtype.type(value)
+    return dtype.type(int(np.floor(min(max(float(value), 0.0), 1.0) * top(dtype) + 0.5)))
+
+
+def invert(plane, out=None):
+    """``1 - x`` in the plane's own scale: ``255 - x`` for uint8."""
+    return np.subtract(plane.dtype.type(top(plane.dtype)), plane, out=out)
+
+
+def resize(plane, width, height, filter_name=None):
+    """A plane scaled to ``(height, width)``, in its own type
+    (mip_chain.resize, Lanczos unless *filter_name* says otherwise)."""
+    from . import mip_chain
+    filter_name = filter_name or mip_chain.RESIZE_FILTER
+    scaled = mip_chain.resize(to_float(plane)[..., None], width, height, filter_name)[..., 0]
+    return from_float(scaled, plane.dtype)
+
+
+def load_planes(path, channels, blender=True):
+    """``{channel index: (h, w) plane}`` for just *channels* of the image at
+    *path*, top row first.
+
+    Grey images answer every colour channel from their one plane, and a
+    missing alpha is a full-scale plane -- the same reading
+    image_io.to_rgba and Blender's loader give.  *blender* False raises
+    image_io.UnsupportedImage for a file only Blender reads.
+    """
+    channels = sorted(set(channels))
+    lower = path.lower()
+    if image_io.can_read(path):
+        try:
+            samples = image_io.read(path)
+        except image_io.UnsupportedImage:
+            if not blender:
+                raise
+        else:
+            return _pick(samples, channels)
+
+    from .tex_encoder import load_rgba
+    rgba = load_rgba(path, blender=blender)
+    if lower.endswith('.dds'):
+        # Block-compressed data decodes to exact multiples of 1/255.
+        return {c: from_float(rgba[..., c], np.uint8) for c in channels}
+    return {c: np.ascontiguousarray(rgba[..., c]) for c in channels}
+
+
+def _pick(samples, channels):
+    count = samples.shape[2]
+    out = {}
+    for c in channels:
+        if count <= 2:
+            src = 0 if c < 3 else (1 if count == 2 else None)
+        else:
+            src = c if c < count else None
+        if src is None:
+            out[c] = np.full(samples.shape[:2], top(samples.dtype), dtype=samples.dtype)
+        else:
+            # A copy, so the interleaved decode can be freed.
+            out[c] = np.ascontiguousarray(samples[..., src])
+    return out
@@ -6,6 +6,7 @@ Header field layout is the standard, publicly documented Microsoft DDS format
 against kagenocookie/RE-Engine-Lib's DDSFile.cs for field order, not copied from it.
 """
 
+import mmap
 import struct
 
 from . import dxgi_format as dxgi
@@ -35,48 +36,111 @@ class DDSFile:
         return dxgi.is_srgb(self.dxgi_format)
 
 
+class MappedDDS:
+    """A DDS file mapped into memory rather than read into it.
+
+    The header is parsed on open -- a page read, whatever the file's size -- and
+    each mip is handed out by ``mip(level)`` as a memoryview into the mapping,
+    so a caller after the dimensions, or after mip 0 alone, never pulls in the
+    rest.  Use as a context manager, or call close(); views still held past
+    close keep the mapping alive until they are dropped.
+
+    Raises ValueError for anything read_dds rejects.
+    """
+
+    def __init__(self, filepath):
+        with open(filepath, 'rb') as f:
+            # ValueError for an empty file, same as a bad magic would be.
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+        try:
+            self._parse(filepath)
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self, filepath):
+        data = self._view
+        magic = struct.unpack_from('<I', data, 0)[0]
+        if magic != DDS_MAGIC:
+            raise ValueError(f"Not a DDS file: {filepath}")
+
+        (size, flags, height, width, pitch_or_linear, depth, mip_map_count,
+         _reserved1, pixel_format, caps1, caps2, caps3, caps4, reserved2) = _HEADER_STRUCT.unpack_from(data, 4)
+
+        pf_size, pf_flags, pf_fourcc, pf_rgbbitcount, pf_rmask, pf_gmask, pf_bmask, pf_amask = \
+            struct.unpack('<8I', pixel_format)
+
+        if pf_fourcc != DX10_FOURCC:
+            raise ValueError(f"DDS file has no DX10 header (fourCC={pf_fourcc:#x}): {filepath}")
+
+        offset = 4 + _HEADER_STRUCT.size
+        dxgi_fmt, resource_dimension, misc_flag, array_size, misc_flags2 = _DX10_STRUCT.unpack_from(data, offset)
+        offset += _DX10_STRUCT.size
+
+        if array_size != 1 or (misc_flag & 0x4):  # DDS_RESOURCE_MISC_TEXTURECUBE
+            raise ValueError("Texture arrays / cubemaps are not supported")
+
+        self.width = width
+        self.height = height
+        self.mip_count = max(1, mip_map_count)
+        self.dxgi_format = dxgi_fmt
+
+        # Where each mip sits follows from the header alone.
+        self._spans = []
+        w, h = width, height
+        for _ in range(self.mip_count):
+            w = max(1, w)
+            h = max(1, h)
+            mip_size = dxgi.get_image_size(dxgi_fmt, w, h)
+            self._spans.append((offset, mip_size))
+            offset += mip_size
+            w >>= 1
+            h >>= 1
+
+    @property
+    def is_srgb(self):
+        return dxgi.is_srgb(self.dxgi_format)
+
+    def mip(self, level):
+        """Mip *level*'s bytes, as a memoryview into the file."""
+        offset, size = self._spans[level]
+        return self._view[offset:offset + size]
+
+    def to_dds(self, levels=None):
+        """A DDSFile holding copies of *levels* (default: every mip)."""
+        levels = range(self.mip_count) if levels is None else levels
+        dds = DDSFile()
+        dds.width = self.width
+        dds.height = self.height
+        dds.dxgi_format = self.dxgi_format
+        dds.mips = [bytes(self.mip(i)) for i in levels]
+        dds.mip_count = len(dds.mips)
+        return dds
+
+    def close(self):
+        self._view.release()
+        try:
+            self._mm.close()
+        except BufferError:
+            pass    # a mip view is still out there; the mapping goes with it
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_dds(filepath):
+    """A MappedDDS for *filepath*."""
+    return MappedDDS(filepath)
+
+
 def read_dds(filepath):
     """Read a DX10-header DDS file. Raises ValueError for anything else (legacy FourCC, cubemaps, arrays)."""
-    with open(filepath, 'rb') as f:
-        data = f.read()
-
-    magic = struct.unpack_from('<I', data, 0)[0]
-    if magic != DDS_MAGIC:
-        raise ValueError(f"Not a DDS file: {filepath}")
-
-    (size, flags, height, width, pitch_or_linear, depth, mip_map_count,
-     _reserved1, pixel_format, caps1, caps2, caps3, caps4, reserved2) = _HEADER_STRUCT.unpack_from(data, 4)
-
-    pf_size, pf_flags, pf_fourcc, pf_rgbbitcount, pf_rmask, pf_gmask, pf_bmask, pf_amask = \
-        struct.unpack('<8I', pixel_format)
-
-    if pf_fourcc != DX10_FOURCC:
-        raise ValueError(f"DDS file has no DX10 header (fourCC={pf_fourcc:#x}): {filepath}")
-
-    offset = 4 + _HEADER_STRUCT.size
-    dxgi_fmt, resource_dimension, misc_flag, array_size, misc_flags2 = _DX10_STRUCT.unpack_from(data, offset)
-    offset += _DX10_STRUCT.size
-
-    if array_size != 1 or (misc_flag & 0x4):  # DDS_RESOURCE_MISC_TEXTURECUBE
-        raise ValueError("Texture arrays / cubemaps are not supported")
-
-    dds = DDSFile()
-    dds.width = width
-    dds.height = height
-    dds.mip_count = max(1, mip_map_count)
-    dds.dxgi_format = dxgi_fmt
-
-    w, h = width, height
-    for _ in range(dds.mip_count):
-        w = max(1, w)
-        h = max(1, h)
-        mip_size = dxgi.get_image_size(dxgi_fmt, w, h)
-        dds.mips.append(data[offset:offset + mip_size])
-        offset += mip_size
-        w >>= 1
-        h >>= 1
-
-    return dds
+    with MappedDDS(filepath) as mapped:
+        return mapped.to_dds()
 
 
 # DDSD_CAPS | DDSD_HEIGHT | DDSD_WIDTH | DDSD_PIXELFORMAT | DDSD_MIPMAPCOUNT
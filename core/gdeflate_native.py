@@ -6,12 +6,17 @@ Needed only for .tex versions that require GDeflate-compressed mip data
 
 import ctypes
 from ctypes import c_bool, c_uint8, c_uint32, c_uint64, POINTER, byref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 FASTEST = 1      # DSTORAGE_COMPRESSION_FASTEST
 DEFAULT = 9       # DSTORAGE_COMPRESSION_DEFAULT
 BEST_RATIO = 12   # DSTORAGE_COMPRESSION_BEST_RATIO
 
+#: Level names as the export settings store them.
+LEVELS = {'FASTEST': FASTEST, 'DEFAULT': DEFAULT, 'BEST_RATIO': BEST_RATIO}
+
 _DLL = None
 
 
@@ -50,28 +55,120 @@ def _load_dll():
     return dll
 
 
-def compress(data, level=DEFAULT, flags=0):
-    """Compress bytes with GDeflate. Returns the compressed bytes."""
-    dll = _load_dll()
-    bound = dll.gdeflate_get_compress_bound(c_uint64(len(data)))
-    output_size = c_uint64(bound)
-    output_array = (c_uint8 * bound)()
-    input_array = (c_uint8 * len(data))(*data)
-
+def _input(data):
+    """A POINTER(c_uint8)-compatible view of *data* with no per-byte marshalling.
+
+    ``(c_uint8 * n)(*data)`` turns every byte into a Python int argument first --
+    millions of them for one large BC7 mip.  Instead: ``bytes`` are passed by
+    address (the caller holds the reference for the length of the call),
+    writable buffers (bytearray, writable memoryview) are wrapped in place, and
+    anything else is copied once at memcpy speed.
+    """
+    if isinstance(data, bytes):
+        return ctypes.cast(ctypes.c_char_p(data), POINTER(c_uint8))
+    n = memoryview(data).nbytes
+    try:
+        return (c_uint8 * n).from_buffer(data)
+    except (TypeError, ValueError):
+        # Read-only (a memoryview over bytes) or non-contiguous.
+        return (c_uint8 * n).from_buffer_copy(data)
+
+
+def _compress_into(dll, data, out, level, flags):
+    """Compress *data* into the preallocated bytearray *out*; returns the size."""
+    n = memoryview(data).nbytes
+    output_size = c_uint64(len(out))
     ok = dll.gdeflate_compress(
-        output_array, byref(output_size), input_array, c_uint64(len(data)),
+        (c_uint8 * len(out)).from_buffer(out), byref(output_size), _input(data), c_uint64(n),
         c_uint32(int(level)), c_uint32(flags),
     )
     if not ok:
         raise RuntimeError("GDeflate compression failed")
-    return bytes(output_array[:output_size.value])
+    return output_size.value
+
+
+def compress(data, level=DEFAULT, flags=0):
+    """Compress a bytes-like object with GDeflate. Returns the compressed bytes."""
+    dll = _load_dll()
+    out = bytearray(dll.gdeflate_get_compress_bound(c_uint64(memoryview(data).nbytes)))
+    size = _compress_into(dll, data, out, level, flags)
+    return bytes(memoryview(out)[:size])
+
+
+def compress_iter(chunks, level=DEFAULT, flags=0, workers=1, skip_errors=False):
+    """Compress each bytes-like object in *chunks*, yielding the results in
+    order -- identical to calling compress on each.  *chunks* may be a
+    generator, so a caller can produce each input only when it is needed and
+    write each result out as soon as it arrives.
+
+    With *workers* > 1 the chunks are compressed on a thread pool -- ctypes
+    drops the GIL for the length of the DLL call, so they genuinely run side
+    by side -- with at most ``2 * workers`` in flight, which bounds memory no
+    matter how many chunks there are.  Serially, one output buffer, grown to
+    the largest chunk seen, serves them all.
+
+    *skip_errors*: yield ``b''`` for a chunk the codec fails on (or for every
+    chunk, when the DLL will not load) instead of raising, so the caller can
+    store it raw.
+    """
+    workers = max(1, int(workers))
+    if workers > 1:
+        yield from _compress_pooled(iter(chunks), level, flags, workers, skip_errors)
+        return
+
+    try:
+        dll = _load_dll()
+    except (OSError, RuntimeError):
+        if not skip_errors:
+            raise
+        dll = None
+    out = bytearray()
+    for chunk in chunks:
+        if dll is None:
+            yield b''
+            continue
+        bound = dll.gdeflate_get_compress_bound(c_uint64(memoryview(chunk).nbytes))
+        if bound > len(out):
+            out = bytearray(bound)
+        try:
+            size = _compress_into(dll, chunk, out, level, flags)
+        except RuntimeError:
+            if not skip_errors:
+                raise
+            yield b''
+            continue
+        yield bytes(memoryview(out)[:size])
+
+
+def _compress_pooled(chunks, level, flags, workers, skip_errors):
+    def one(chunk):
+        try:
+            return compress(chunk, level, flags)
+        except (OSError, RuntimeError):
+            if not skip_errors:
+                raise
+            return b''
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(one, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def compress_many(chunks, level=DEFAULT, flags=0, workers=1):
+    """compress_iter, collected into a list."""
+    return list(compress_iter(chunks, level, flags, workers))
 
 
 def get_uncompressed_size(compressed_data):
     dll = _load_dll()
-    input_array = (c_uint8 * len(compressed_data))(*compressed_data)
     uncompressed_size = c_uint64(0)
-    ok = dll.gdeflate_get_uncompressed_size(input_array, c_uint64(len(compressed_data)), byref(uncompressed_size))
+    ok = dll.gdeflate_get_uncompressed_size(
+        _input(compressed_data), c_uint64(memoryview(compressed_data).nbytes), byref(uncompressed_size))
     if not ok:
         raise RuntimeError("Failed to get GDeflate uncompressed size")
     return uncompressed_size.value
@@ -80,11 +177,11 @@ def get_uncompressed_size(compressed_data):
 def decompress(compressed_data, num_workers=1):
     dll = _load_dll()
     output_size = get_uncompressed_size(compressed_data)
-    input_array = (c_uint8 * len(compressed_data))(*compressed_data)
-    output_array = (c_uint8 * output_size)()
+    out = bytearray(output_size)
     ok = dll.gdeflate_decompress(
-        output_array, c_uint64(output_size), input_array, c_uint64(len(compressed_data)), c_uint32(num_workers),
+        (c_uint8 * output_size).from_buffer(out), c_uint64(output_size),
+        _input(compressed_data), c_uint64(memoryview(compressed_data).nbytes), c_uint32(num_workers),
     )
     if not ok:
         raise RuntimeError("GDeflate decompression failed")
-    return bytes(output_array)
+    return bytes(out)
@@ -140,6 +140,11 @@ STRINGS = {
     "core.standard_ops.merge_physics_done": {
         "EN": "Physics weight downgrade complete: merged {groups} physics vertex group(s) across {meshes} mesh(es)",
         "ZH": "物理权重降级完成: 在 {meshes} 个网格上合并了 {groups} 个物理顶点组"},
+    "core.standard_ops.merge_physics_dry_run": {
+        "EN": "Dry run: {groups} physics vertex group(s) across {meshes} mesh(es) would move "
+              "{mass:.1f} total weight into {bases} base bone(s); per-bone list in the console",
+        "ZH": "试运行: {meshes} 个网格上的 {groups} 个物理顶点组将把共 {mass:.1f} 的权重"
+              "转移到 {bases} 根基础骨骼; 逐骨明细见控制台"},
     "core.standard_ops.renamed_to_target_done": {
         "EN": "Renamed {n} bone(s) to target game names", "ZH": "已将 {n} 根骨骼改名为目标游戏名"},
     "core.standard_ops.removed_non_base_bones": {
@@ -391,6 +396,12 @@ STRINGS = {
         "ZH": "完成: 生成 {export}, 失败 {fail}, 跳过 {skip}"},
     "core.mdf_tex_processor_base.process_done": {
         "EN": "Done: generated {export}, skipped {skip}", "ZH": "完成: 生成 {export}, 跳过 {skip}"},
+    "core.mdf_tex_processor_base.process_cancelled": {
+        "EN": "Cancelled: generated {export}, failed {fail}, skipped {skip}",
+        "ZH": "已取消: 生成 {export}, 失败 {fail}, 跳过 {skip}"},
+    "core.mdf_tex_processor_base.processing": {
+        "EN": "Processing textures {done}/{total} -- Esc to cancel",
+        "ZH": "正在处理贴图 {done}/{total} -- 按 Esc 取消"},
 
     # ══════════════════════════════════════════════════════════════════════
     # core/mdf_generator_base.py
@@ -501,6 +512,8 @@ STRINGS = {
         "ZH": "额外迁移两个 shader 中所有同名同类型的参数，包括 shader 内部常量与游戏运行时状态值"},
     "core.octahedral_normals.label": {
         "EN": "Hemi-Octahedral Normals", "ZH": "法线使用半八面体编码"},
+    "core.gdeflate_level.label": {
+        "EN": "GDeflate Level", "ZH": "GDeflate 压缩级别"},
     "core.mdf_port_ops.migrate_flags_label": {"EN": "Migrate Flags", "ZH": "迁移 Flags"},
     "core.mdf_port_ops.done_params": {
         "EN": ", params {migrated} migrated / {skipped} skipped",
@@ -924,6 +937,12 @@ STRINGS = {
     "core.tex_convert_base.drop_done":    {"EN": "Converted {n} file(s) to DDS", "ZH": "已转换 {n} 个文件为 DDS"},
     "core.tex_convert_base.drop_partial": {"EN": "Converted {n} file(s); failed: {failed}",
                                             "ZH": "已转换 {n} 个；失败：{failed}"},
+    "core.tex_convert_base.drop_progress": {
+        "EN": "Converting {done}/{total} -- {name} -- Esc to cancel",
+        "ZH": "正在转换 {done}/{total} -- {name} -- 按 Esc 取消"},
+    "core.tex_convert_base.drop_file_failed": {"EN": "{name}: {err}", "ZH": "{name}：{err}"},
+    "core.tex_convert_base.drop_cancelled": {"EN": "Cancelled: converted {n} of {total} file(s)",
+                                              "ZH": "已取消：转换了 {total} 个中的 {n} 个"},
 
     "core.tex_convert_base.drop_png_desc": {
         "EN": "Decode the dropped DDS to PNG. Stored bytes only, no gamma conversion — "
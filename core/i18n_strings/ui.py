@@ -241,11 +241,14 @@ STRINGS = {
     "ui.main_panel.sk_field_smooth_iters":        {"EN": "Smooth Iterations", "ZH": "平滑迭代次数"},
     "ui.main_panel.sk_field_sync_seams":          {"EN": "Sync Seam Vertices","ZH": "缝合重合顶点"},
     "ui.main_panel.sk_field_direction_filter":    {"EN": "Direction Filter",  "ZH": "方向过滤"},
+    "ui.main_panel.sk_field_all_keys":            {"EN": "All Shape Keys",    "ZH": "全部形态键"},
     "ui.main_panel.sk_err_select_non_basis":      {"EN": "Please select a non-Basis shape key", "ZH": "请选择一个非 Basis 的形态键"},
     "ui.main_panel.sk_warn_no_deformation":       {"EN": "Shape key '{name}' has no detectable deformation; try lowering the ignore threshold",
                                                     "ZH": "形态键 '{name}' 未检测到有效形变，请调低忽略阈值"},
     "ui.main_panel.sk_info_generated":            {"EN": "Generated vertex group '{name}' ({n} valid vertex/vertices)",
                                                     "ZH": "已生成顶点组 '{name}'（{n} 个有效顶点）"},
+    "ui.main_panel.sk_info_generated_batch":      {"EN": "Generated {n} vertex group(s) from shape keys ({skipped} without deformation skipped)",
+                                                    "ZH": "已由形态键生成 {n} 个顶点组（跳过 {skipped} 个无形变的形态键）"},
 
     # ── MHW_OT_MMDFaceWeights ────────────────────────────────────────────────────
     "ui.main_panel.mmd_face_weights_tip":         {"EN": "Split MMD eyelid/mouth shape keys by direction into target-game facial vertex groups",
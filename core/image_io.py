@@ -0,0 +1,546 @@
+"""PNG and TGA read/write in NumPy + zlib, without Blender.
+
+Every compose used to go through ``bpy.data.images``: load a source into a
+temporary datablock to get at its pixels, and ``images.new`` + ``save()`` a
+second one just to get a PNG onto disk for texconv -- with, in
+tex_convert_base, ``img.pixels[:]`` in both directions on top (see the comment
+above mdf_tex_processor_base.image_to_array for what that costs).  This reads
+and writes the two formats those paths actually see, straight to and from
+arrays, so they run on any thread and outside Blender.
+
+Reading covers what image editors and texconv write:
+
+* PNG: grey, grey+alpha, RGB, RGBA at 8 and 16 bits, palette and low-bit grey
+  (1/2/4), ``tRNS`` transparency.  Not Adam7 interlacing -- UnsupportedImage,
+  which callers answer by falling back to Blender's loader.
+* TGA: true-colour (16/24/32 bit), grey and colour-mapped, raw or RLE, either
+  origin.
+
+Writing produces a non-interlaced PNG (8 or 16 bit, grey/RGB/RGBA by channel
+count) or an uncompressed TGA.  PNG rows are filtered with None/Sub/Up, chosen
+per row by the usual minimum-sum-of-absolutes heuristic; Average and Paeth are
+never picked because undoing them cannot be vectorised across a row, and files
+written here are mostly read back here.  *threads* > 1 deflates the filtered
+stream in independent chunks on a thread pool (zlib releases the GIL), each
+primed with the previous chunk's last 32 KiB as a dictionary, so the output is
+one ordinary zlib stream any decoder reads.  PngWriter does the same a band
+of rows at a time, for images produced in strips.
+
+No colour-space chunks (sRGB/gAMA/iCCP) are written, and none read are
+applied: stored values in, stored values out -- the same rule
+texconv_native.convert_to_dds keeps.
+
+Arrays are ``(h, w, C)``, top row first (file order, as in the codecs; Blender
+pixel buffers are bottom row first).  Free of ``bpy``.
+"""
+
+import collections
+import os
+import struct
+import zlib
+
+import numpy as np
+
+READ_EXTS = ('.png', '.tga')
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+_PNG_COLOR_TYPE = {1: 0, 2: 4, 3: 2, 4: 6}
+_DEFLATE_WINDOW = 32 * 1024
+
+
+class UnsupportedImage(ValueError):
+    """A file this module does not decode; try another loader."""
+
+
+def can_read(path):
+    return os.path.splitext(path)[1].lower() in READ_EXTS
+
+
+def read(path):
+    """The stored samples of a PNG or TGA as ``(h, w, C)`` uint8 or uint16,
+    C = 1 (grey), 2 (grey + alpha), 3 or 4.  Palette images come back as RGB(A)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.png':
+        return read_png(path)
+    if ext == '.tga':
+        return read_tga(path)
+    raise UnsupportedImage(f"Not a PNG or TGA: {path}")
+
+
+def to_rgba(samples):
+    """read()'s samples -> ``(h, w, 4)`` float32 in 0..1, grey spread over RGB
+    and a missing alpha made opaque -- what Blender's loader hands back."""
+    scale = 1.0 / np.iinfo(samples.dtype).max
+    h, w, c = samples.shape
+    out = np.empty((h, w, 4), dtype=np.float32)
+    if c <= 2:
+        out[..., :3] = samples[..., :1] * scale
+    else:
+        out[..., :3] = samples[..., :3] * scale
+    if c in (2, 4):
+        out[..., 3] = samples[..., -1] * scale
+    else:
+        out[..., 3] = 1.0
+    return out
+
+
+def read_rgba(path):
+    """A PNG or TGA as ``(h, w, 4)`` float32 in 0..1, top row first."""
+    return to_rgba(read(path))
+
+
+def write(path, arr, bits=8, level=6, threads=1):
+    """Save *arr* as PNG or TGA, by *path*'s extension.  See write_png."""
+    if path.lower().endswith('.tga'):
+        write_tga(path, arr)
+    else:
+        write_png(path, arr, bits, level, threads)
+
+
+def to_samples(arr, bits=8):
+    """Floats in 0..1 -> uint8/uint16 samples, rounded half up as Blender's own
+    float -> byte conversion does.  Integer arrays pass through."""
+    if arr.dtype.kind in 'ui':
+        return arr
+    top = 255.0 if bits == 8 else 65535.0
+    out = np.clip(arr, 0.0, 1.0) * top
+    out += 0.5
+    return np.floor(out, out=out).astype(np.uint8 if bits == 8 else np.uint16)
+
+
+# ── PNG read ─────────────────────────────────────────────────────────────────
+
+def _png_chunks(data):
+    pos = len(_PNG_SIGNATURE)
+    while pos + 8 <= len(data):
+        length, ctype = struct.unpack_from('>I4s', data, pos)
+        yield ctype, data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if ctype == b'IEND':
+            return
+
+
+def read_png(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:8] != _PNG_SIGNATURE:
+        raise UnsupportedImage(f"Not a PNG: {path}")
+
+    ihdr = palette = trns = None
+    idat = []
+    for ctype, payload in _png_chunks(data):
+        if ctype == b'IHDR':
+            ihdr = struct.unpack('>IIBBBBB', payload[:13])
+        elif ctype == b'PLTE':
+            palette = np.frombuffer(payload, dtype=np.uint8).reshape(-1, 3)
+        elif ctype == b'tRNS':
+            trns = payload
+        elif ctype == b'IDAT':
+            idat.append(payload)
+    if ihdr is None:
+        raise UnsupportedImage(f"PNG without IHDR: {path}")
+    w, h, depth, color_type, _comp, _filt, interlace = ihdr
+    if interlace:
+        raise UnsupportedImage(f"Interlaced PNG: {path}")
+    if color_type not in _PNG_CHANNELS or depth not in (1, 2, 4, 8, 16):
+        raise UnsupportedImage(f"PNG colour type {color_type} at {depth} bits: {path}")
+
+    channels = _PNG_CHANNELS[color_type]
+    stride = (w * channels * depth + 7) // 8
+    bpp = max(1, channels * depth // 8)
+    raw = zlib.decompress(b''.join(idat))
+    if len(raw) < h * (stride + 1):
+        raise ValueError(f"Truncated PNG data: {path}")
+    rows = _unfilter(np.frombuffer(raw, dtype=np.uint8, count=h * (stride + 1))
+                     .reshape(h, stride + 1), bpp)
+
+    if depth == 16:
+        samples = rows.view('>u2').astype(np.uint16).reshape(h, w, channels)
+    elif depth == 8:
+        samples = rows.reshape(h, w, channels)
+    else:
+        bits = np.unpackbits(rows, axis=1).reshape(h, -1, depth)
+        weights = (1 << np.arange(depth - 1, -1, -1)).astype(np.uint8)
+        samples = (bits * weights).sum(axis=2, dtype=np.uint8)[:, :w, None]
+        if color_type == 0:
+            samples = samples * np.uint8(255 // ((1 << depth) - 1))
+
+    if color_type == 3:
+        if palette is None:
+            raise ValueError(f"Palette PNG without PLTE: {path}")
+        index = samples[..., 0]
+        if trns is not None:
+            alpha = np.full(len(palette), 255, dtype=np.uint8)
+            alpha[:len(trns)] = np.frombuffer(trns, dtype=np.uint8)[:len(palette)]
+            return np.concatenate([palette[index], alpha[index][..., None]], axis=-1)
+        return palette[index]
+    if trns is not None and color_type in (0, 2):
+        # Colour-key transparency: one sample value (per channel) is clear.
+        key = np.array(struct.unpack(f'>{len(trns) // 2}H', trns), dtype=np.uint32)
+        if depth < 8:
+            key = key * (255 // ((1 << depth) - 1))
+        top = np.iinfo(samples.dtype).max
+        clear = np.all(samples == key.astype(samples.dtype), axis=-1, keepdims=True)
+        samples = np.concatenate([samples, np.where(clear, 0, top).astype(samples.dtype)],
+                                 axis=-1)
+    return np.ascontiguousarray(samples)
+
+
+def _unfilter(rows, bpp):
+    """PNG scanlines (filter byte first) -> the unfiltered bytes, (h, stride).
+
+    None/Sub/Up are vectorised a row at a time.  Average and Paeth depend on
+    the pixel to the left as already *decoded*, so a run of such rows is solved
+    along anti-diagonals instead -- every pixel on one needs only the two
+    before it -- which keeps the loop at rows + columns steps, not pixels.
+    """
+    ftypes = rows[:, 0]
+    data = rows[:, 1:]
+    h, stride = data.shape
+    out = np.empty((h, stride), dtype=np.uint8)
+    prev = np.zeros(stride, dtype=np.uint8)
+    r = 0
+    while r < h:
+        f = ftypes[r]
+        if f == 0:
+            out[r] = data[r]
+        elif f == 1:
+            out[r] = np.cumsum(data[r].reshape(-1, bpp), axis=0, dtype=np.uint8).ravel()
+        elif f == 2:
+            np.add(data[r], prev, out=out[r])
+        elif f in (3, 4):
+            end = r + 1
+            while end < h and ftypes[end] in (3, 4):
+                end += 1
+            _unfilter_wavefront(data[r:end], ftypes[r:end] == 4, prev, out[r:end], bpp)
+            prev = out[end - 1]
+            r = end
+            continue
+        else:
+            raise ValueError(f"Bad PNG filter type {f}")
+        prev = out[r]
+        r += 1
+    return out
+
+
+def _unfilter_wavefront(data, paeth, prev, out, bpp, band=1024):
+    k, stride = data.shape
+    if k > band:
+        for r0 in range(0, k, band):
+            _unfilter_wavefront(data[r0:r0 + band], paeth[r0:r0 + band],
+                                out[r0 - 1] if r0 else prev, out[r0:r0 + band], bpp, band)
+        return
+    npx = stride // bpp
+    # Skewed so that each anti-diagonal is one contiguous slice: cell (r, x)
+    # lives at grid[x + r + 2, r + 1].  Row 0 holds the row above the run, and
+    # every left-edge neighbour lands on a cell that stays zero.
+    grid = np.zeros((npx + k + 2, k + 1, bpp), dtype=np.int16)
+    grid[1:npx + 1, 0] = prev.reshape(npx, bpp)
+    rr, xx = np.indices((k, npx))
+    src = np.zeros((npx + k, k, bpp), dtype=np.int16)
+    src[rr + xx, rr] = data.reshape(k, npx, bpp)
+    is_paeth = paeth[:, None]
+    for d in range(npx + k - 1):
+        r0, r1 = max(0, d - npx + 1), min(k - 1, d) + 1
+        a = grid[d + 1, r0 + 1:r1 + 1]
+        b = grid[d + 1, r0:r1]
+        c = grid[d, r0:r1]
+        pa = np.abs(b - c)
+        pb = np.abs(a - c)
+        pc = np.abs(a + b - 2 * c)
+        pred = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+        pred = np.where(is_paeth[r0:r1], pred, (a + b) >> 1)
+        np.bitwise_and(src[d, r0:r1] + pred, 0xFF, out=grid[d + 2, r0 + 1:r1 + 1])
+    out[:] = grid[rr + xx + 2, rr + 1].reshape(k, stride)
+
+
+# ── PNG write ────────────────────────────────────────────────────────────────
+
+def _png_chunk(ctype, payload):
+    return (struct.pack('>I', len(payload)) + ctype + payload
+            + struct.pack('>I', zlib.crc32(ctype + payload) & 0xFFFFFFFF))
+
+
+def _filter_rows(rows, bpp, prev=None):
+    """Filtered scanlines, filter byte first, (h, stride + 1) uint8.  *prev*
+    is the raw row above the first one, for a band that is not the image's top."""
+    h, stride = rows.shape
+    out = np.empty((h, stride + 1), dtype=np.uint8)
+    # In bands, so the candidate filterings cost a band's memory, not the image's.
+    band = max(1, (1 << 22) // max(stride, 1))
+    for r0 in range(0, h, band):
+        cur = rows[r0:r0 + band]
+        above = np.empty_like(cur)
+        if r0:
+            above[0] = rows[r0 - 1]
+        else:
+            above[0] = 0 if prev is None else prev
+        above[1:] = cur[:-1]
+        left = np.zeros_like(cur)
+        left[:, bpp:] = cur[:, :-bpp]
+        candidates = (cur, cur - left, cur - above)
+        # The signed size of each filtered byte, summed per row.
+        cost = np.stack([np.abs(c.view(np.int8).astype(np.int32)).sum(axis=1)
+                         for c in candidates])
+        choice = cost.argmin(axis=0).astype(np.uint8)
+        out[r0:r0 + band, 0] = choice
+        picked = out[r0:r0 + band, 1:]
+        for f, cand in enumerate(candidates):
+            rows_f = choice == f
+            picked[rows_f] = cand[rows_f]
+    return out
+
+
+def _deflate_chunk(data, level, zdict):
+    """One raw-deflate piece of the stream, ending on a byte boundary so the
+    next piece can follow it; *zdict* is the data just before it."""
+    comp = (zlib.compressobj(level, zlib.DEFLATED, -15, zdict=zdict) if zdict
+            else zlib.compressobj(level, zlib.DEFLATED, -15))
+    return comp.compress(data) + comp.flush(zlib.Z_SYNC_FLUSH)
+
+
+class PngWriter:
+    """A PNG written a band of rows at a time, top to bottom.
+
+    For a caller producing the image in strips (core/row_bands.py), so the
+    whole image never has to exist at once -- neither as samples nor as the
+    filtered stream.  Each write() filters its rows against the last row of
+    the previous one and hands them to zlib; with *threads* > 1 the bands are
+    deflated in parallel, each primed with the 32 KiB before it, and stitched
+    in order.  IDAT chunks go to disk as they fill.
+
+    ``with PngWriter(...) as png`` closes on success and removes the partial
+    file on an exception.
+    """
+
+    IDAT_BYTES = 1 << 20
+
+    def __init__(self, path, width, height, channels, depth=8, level=6, threads=1):
+        if channels not in _PNG_COLOR_TYPE:
+            raise ValueError(f"Cannot store {channels} channels in a PNG")
+        self.path = path
+        self.width, self.height, self.channels, self.depth = width, height, channels, depth
+        self.level = level
+        self.rows = 0
+        self._prev = None
+        self._tail = b''
+        self._adler = 1
+        self._out = bytearray()
+        threads = max(1, int(threads))
+        self._comp = None if threads > 1 else zlib.compressobj(level, zlib.DEFLATED, -15)
+        self._pool = None
+        self._pending = collections.deque()
+        if threads > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(max_workers=threads)
+        self._max_pending = threads * 2
+
+        self._file = open(path, 'wb')
+        self._file.write(_PNG_SIGNATURE)
+        self._file.write(_png_chunk(b'IHDR', struct.pack(
+            '>IIBBBBB', width, height, depth, _PNG_COLOR_TYPE[channels], 0, 0, 0)))
+        # The zlib wrapper around the raw stream: header now, Adler-32 in close().
+        level_bits = 0 if level < 2 else 1 if level < 6 else 2 if level == 6 else 3
+        cmf, flg = 0x78, level_bits << 6
+        flg |= 31 - ((cmf << 8) | flg) % 31
+        self._out += bytes((cmf, flg))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, _exc, _tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, arr):
+        """Append ``(n, width, channels)`` rows; floats are stored at this
+        writer's depth, as write_png does."""
+        if arr.ndim == 2:
+            arr = arr[..., None]
+        samples = to_samples(arr, self.depth)
+        n = samples.shape[0]
+        if samples.shape[1:] != (self.width, self.channels):
+            raise ValueError(f"Rows of shape {samples.shape[1:]} for a "
+                             f"{self.width}x{self.channels} PNG")
+        if self.depth == 16:
+            rows = samples.astype('>u2').view(np.uint8).reshape(n, -1)
+        else:
+            rows = np.ascontiguousarray(samples, dtype=np.uint8).reshape(n, -1)
+        data = _filter_rows(rows, self.channels * self.depth // 8, self._prev).tobytes()
+        self._prev = rows[-1].copy()
+        self.rows += n
+        self._adler = zlib.adler32(data, self._adler)
+        if self._pool is None:
+            self._emit(self._comp.compress(data))
+            return
+        self._pending.append(self._pool.submit(_deflate_chunk, data, self.level, self._tail))
+        self._tail = (self._tail + data[-_DEFLATE_WINDOW:])[-_DEFLATE_WINDOW:]
+        while self._pending and (self._pending[0].done()
+                                 or len(self._pending) > self._max_pending):
+            self._emit(self._pending.popleft().result())
+
+    def _emit(self, data):
+        self._out += data
+        while len(self._out) >= self.IDAT_BYTES:
+            self._file.write(_png_chunk(b'IDAT', bytes(self._out[:self.IDAT_BYTES])))
+            del self._out[:self.IDAT_BYTES]
+
+    def close(self):
+        if self.rows != self.height:
+            self.abort()
+            raise ValueError(f"{self.rows} rows written to a {self.height}-row PNG")
+        if self._pool is None:
+            self._emit(self._comp.flush(zlib.Z_FINISH))
+        else:
+            while self._pending:
+                self._emit(self._pending.popleft().result())
+            self._pool.shutdown()
+            # Every band ended on a sync flush; an empty final block ends the stream.
+            self._emit(zlib.compressobj(self.level, zlib.DEFLATED, -15).flush(zlib.Z_FINISH))
+        self._out += struct.pack('>I', self._adler & 0xFFFFFFFF)
+        self._file.write(_png_chunk(b'IDAT', bytes(self._out)))
+        self._file.write(_png_chunk(b'IEND', b''))
+        self._file.close()
+        return self.path
+
+    def abort(self):
+        """Stop and remove the partial file."""
+        if self._pool is not None:
+            for fut in self._pending:
+                fut.cancel()
+            self._pool.shutdown()
+        self._file.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def write_png(path, arr, bits=8, level=6, threads=1):
+    """Save ``(h, w, C)`` *arr* (C = 1..4, top row first) as a PNG.
+
+    Floats are taken as 0..1 and stored at *bits* (8 or 16); uint8/uint16
+    arrays are stored as they are.  *level* is the zlib level; *threads* > 1
+    deflates in parallel (see the module docstring).
+    """
+    if arr.ndim == 2:
+        arr = arr[..., None]
+    h, w, c = arr.shape
+    depth = (16 if arr.dtype == np.uint16 else 8) if arr.dtype.kind in 'ui' else bits
+    stride = w * c * depth // 8
+    if h * stride < 2 * (1 << 20):
+        threads = 1
+    band = max(1, (1 << 22) // max(stride, 1))
+    with PngWriter(path, w, h, c, depth, level, threads) as png:
+        for r0 in range(0, h, band):
+            png.write(arr[r0:r0 + band])
+    return path
+
+
+# ── TGA ──────────────────────────────────────────────────────────────────────
+
+def _tga_unrle(data, pos, count, bytes_pp):
+    """Expand *count* RLE-packed pixels starting at data[pos]."""
+    out = bytearray(count * bytes_pp)
+    o = 0
+    end = len(out)
+    while o < end:
+        head = data[pos]
+        pos += 1
+        n = (head & 0x7F) + 1
+        if head & 0x80:
+            px = data[pos:pos + bytes_pp]
+            pos += bytes_pp
+            out[o:o + n * bytes_pp] = px * n
+        else:
+            out[o:o + n * bytes_pp] = data[pos:pos + n * bytes_pp]
+            pos += n * bytes_pp
+        o += n * bytes_pp
+    return bytes(out[:end])
+
+
+def _tga_pixels(buf, depth, alpha_bits):
+    """Raw TGA pixel bytes -> (n, C) uint8 in RGB(A) order."""
+    if depth == 8:
+        return np.frombuffer(buf, dtype=np.uint8)[:, None]
+    if depth == 16:
+        v = np.frombuffer(buf, dtype='<u2')
+        rgb = np.stack([(v >> 10) & 31, (v >> 5) & 31, v & 31], axis=-1)
+        rgb = ((rgb * 255 + 15) // 31).astype(np.uint8)
+        if alpha_bits:
+            return np.concatenate([rgb, np.where(v >> 15, 255, 0).astype(np.uint8)[:, None]],
+                                  axis=-1)
+        return rgb
+    px = np.frombuffer(buf, dtype=np.uint8).reshape(-1, depth // 8)
+    return px[:, [2, 1, 0, 3][:depth // 8]]
+
+
+def read_tga(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < 18:
+        raise UnsupportedImage(f"Not a TGA: {path}")
+    (id_len, cmap_type, img_type, cmap_first, cmap_len, cmap_depth,
+     _x, _y, w, h, depth, desc) = struct.unpack('<BBBHHBHHHHBB', data[:18])
+    base_type = img_type & ~8
+    if base_type not in (1, 2, 3) or depth not in (8, 16, 24, 32):
+        raise UnsupportedImage(f"TGA type {img_type} at {depth} bits: {path}")
+    pos = 18 + id_len
+    cmap = None
+    if cmap_type:
+        cmap_bytes = cmap_len * ((cmap_depth + 7) // 8)
+        if base_type == 1:
+            cmap = _tga_pixels(data[pos:pos + cmap_bytes], cmap_depth, desc & 0x0F)
+        pos += cmap_bytes
+
+    bytes_pp = (depth + 7) // 8
+    count = w * h
+    if img_type & 8:
+        buf = _tga_unrle(data, pos, count, bytes_pp)
+    else:
+        buf = data[pos:pos + count * bytes_pp]
+    if len(buf) < count * bytes_pp:
+        raise ValueError(f"Truncated TGA data: {path}")
+
+    if base_type == 1:
+        if cmap is None:
+            raise ValueError(f"Colour-mapped TGA without a map: {path}")
+        index = (np.frombuffer(buf, dtype='<u2') if bytes_pp == 2
+                 else np.frombuffer(buf, dtype=np.uint8)).astype(np.int64) - cmap_first
+        px = cmap[np.clip(index, 0, len(cmap) - 1)]
+    elif base_type == 3 and depth == 16:     # grey + alpha
+        px = np.frombuffer(buf, dtype=np.uint8).reshape(-1, 2)
+    else:
+        px = _tga_pixels(buf, depth, desc & 0x0F)
+    img = px.reshape(h, w, -1)
+    if not desc & 0x20:         # origin bottom-left, the TGA default
+        img = img[::-1]
+    if desc & 0x10:             # right-to-left
+        img = img[:, ::-1]
+    return np.ascontiguousarray(img)
+
+
+def write_tga(path, arr):
+    """Save ``(h, w, C)`` *arr* (C = 1, 3 or 4, top row first) as an
+    uncompressed 8-bit-per-channel TGA with a top-left origin."""
+    if arr.ndim == 2:
+        arr = arr[..., None]
+    samples = to_samples(arr, 8)
+    if samples.dtype != np.uint8:
+        samples = (samples >> 8).astype(np.uint8)
+    h, w, c = samples.shape
+    if c == 2:
+        samples, c = samples[..., [0, 0, 0, 1]], 4
+    if c not in (1, 3, 4):
+        raise ValueError(f"Cannot store {c} channels in a TGA")
+    img_type = 3 if c == 1 else 2
+    desc = 0x20 | (8 if c == 4 else 0)
+    header = struct.pack('<BBBHHBHHHHBB', 0, 0, img_type, 0, 0, 0, 0, 0, w, h, c * 8, desc)
+    body = samples if c == 1 else samples[..., [2, 1, 0, 3][:c]]
+    with open(path, 'wb') as f:
+        f.write(header)
+        f.write(np.ascontiguousarray(body).tobytes())
+    return path
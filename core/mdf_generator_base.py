@@ -11,6 +11,7 @@ of existing MDF2 materials.
 """
 
 import bpy
+import functools
 import os
 import json
 import re
@@ -23,7 +24,7 @@ from .mdf_tex_processor_base import (
     BASE_SLOT_CHANNEL_MAPS, BASE_NULL_TEX_BY_TYPE, BASE_TEXTURE_TYPE_ABBREV,
     SRGB_SLOT_TYPES, PBR_DEFAULTS, PBR_TYPES, PBR_CHANNEL_SELECTABLE, _CH,
     _import_tex_utils, _compose_channels, channel_maps_consume_ao,
-    make_mdf_path, make_disk_path,
+    make_mdf_path, make_disk_path, texture_workers,
 )
 from .slot_sources import (
     find_slot_sources, stage_source_file,
@@ -32,6 +33,8 @@ from .slot_sources import (
     find_shader_slot_images, find_packed_shader_node,
 )
 from .slot_resolver import resolve_dds_format, write_slot_tex
+from . import solid_tex, tex_encoder, tex_file, tex_index
+from .tex_batch import TexBatch, report_failures
 from .shader_pack import PRESET_PATH_KEY, PRESET_LOCKED_KEY
 
 # ── Principled BSDF socket → PBR type mapping ─────────────────────────────────
@@ -47,7 +50,8 @@ PRINCIPLED_INPUT_MAP = {
 }
 
 BAKE_SIZE_DEFAULT = 1024
-SOLID_SIZE        = 8
+SOLID_SIZE        = 8       # constant compose inputs
+SOLID_SLOT_SIZE   = 256     # a whole slot downgraded to a constant
 
 
 # ── Node analysis ──────────────────────────────────────────────────────────────
@@ -777,7 +781,7 @@ def _prefab_placeholder_dds(slot_type):
 
 def _resolve_placeholder_slot(slot_type, tex_name, natives_root, base_path, temp_dir,
                               abbrev_map, tex_version, use_art_prefix,
-                              image_to_dds, dds_to_tex, comp_cache):
+                              image_to_dds, dds_to_tex, comp_cache, tex_writes=None):
     """Write the bundled placeholder DDS for a PLACEHOLDER_SLOT_TYPES slot
     nothing overrode, and return the resulting mdf path -- same
     make_disk_path/make_mdf_path convention every other slot in this export
@@ -788,6 +792,9 @@ def _resolve_placeholder_slot(slot_type, tex_name, natives_root, base_path, temp
     above: every material in this batch that leaves this slot at its default
     points at the one shared physical file instead of each carrying its own
     copy of the same placeholder image.
+
+    With *tex_writes* (a tex_batch.TexBatch) the write is queued on it
+    instead of done here.
     """
     src = _prefab_placeholder_dds(slot_type)
     if src is None:
@@ -802,12 +809,15 @@ def _resolve_placeholder_slot(slot_type, tex_name, natives_root, base_path, temp
         natives_root, base_path, tex_name, slot_type,
         abbrev_map, tex_version, use_art_prefix,
     )
-    write_slot_tex(
-        src, disk_path, temp_dir,
-        dds_fmt=None, generate_mipmaps=True,
-        image_to_dds=image_to_dds,
-        dds_to_tex=lambda p, o: dds_to_tex(p, tex_version, o),
-    )
+    if tex_writes is not None:
+        tex_writes.add(src, slot_type, None, True, tex_version, disk_path)
+    else:
+        write_slot_tex(
+            src, disk_path, temp_dir,
+            dds_fmt=None, generate_mipmaps=True,
+            image_to_dds=image_to_dds,
+            dds_to_tex=lambda p, o: dds_to_tex(p, tex_version, o),
+        )
     mdf_path = make_mdf_path(base_path, tex_name, slot_type, abbrev_map, use_art_prefix)
     comp_cache[cache_key] = (src, disk_path, mdf_path)
     return mdf_path
@@ -870,11 +880,9 @@ def _generate_solid_texture_path(value, tmp_dir, name_hint, size=SOLID_SIZE):
     Write a solid-colour PNG to tmp_dir and return its path.
     value: float scalar (greyscale) or colour sequence (r,g,b[,a]).
     """
-    img_name = f"__gen_solid_{name_hint}"
-    if img_name in bpy.data.images:
-        bpy.data.images.remove(bpy.data.images[img_name])
+    import numpy as np
 
-    img = bpy.data.images.new(img_name, width=size, height=size, alpha=True)
+    from . import image_io
 
     if isinstance(value, (int, float)):
         v = float(max(0.0, min(1.0, value)))
@@ -885,12 +893,9 @@ def _generate_solid_texture_path(value, tmp_dir, name_hint, size=SOLID_SIZE):
             vals.append(1.0)
         pixel = vals
 
-    img.pixels[:] = pixel * (size * size)
     out_path = os.path.join(tmp_dir, f"_solid_{name_hint}.png")
-    img.filepath_raw = out_path
-    img.file_format  = 'PNG'
-    img.save()
-    bpy.data.images.remove(img)
+    image_io.write_png(out_path, np.broadcast_to(np.array(pixel, dtype=np.float32),
+                                                 (size, size, 4)))
     return out_path
 
 
@@ -1224,8 +1229,8 @@ def detect_native_sizes(mat, strategies):
 
     SOLID  → SOLID_SIZE (8)
     BAKE   → max texture size found in the material node tree
-    DIRECT → size of the source image if loaded in bpy.data.images,
-             otherwise falls back to the material's max texture size
+    DIRECT → size of the source image if loaded in bpy.data.images, else
+             read from its file header, else the material's max texture size
     """
     mat_max = _detect_max_tex_size(mat)
     sizes = {}
@@ -1244,6 +1249,11 @@ def detect_native_sizes(mat, strategies):
                     if bpy.path.abspath(img.filepath) == path and img.size[0] > 0:
                         img_size = max(img.size[0], img.size[1])
                         break
+                else:
+                    # Not loaded: the file header has the size without loading it.
+                    info = tex_index.read_header(path)
+                    if info is not None:
+                        img_size = max(info.width, info.height)
             sizes[ch] = img_size if img_size > 0 else mat_max
     return sizes
 
@@ -1262,26 +1272,31 @@ def _maybe_resize_direct(src_path, target_size, tmp_dir):
     """
     If the source image is larger than target_size, save a scaled copy to
     tmp_dir and return its path.  Otherwise return src_path unchanged.
-    Uses bpy.data.images so no Pillow dependency is required.
+    Scaled in NumPy (mip_chain.resize, Lanczos) at the source's own bit
+    depth and written as a PNG; only formats image_io cannot read go through
+    Blender's loader, and nothing is left in bpy.data.
     """
     try:
-        img = bpy.data.images.load(src_path, check_existing=True)
-        native = max(img.size[0], img.size[1])
+        from . import channel_compose, image_io, mip_chain, tex_encoder
+
+        samples = None
+        if image_io.can_read(src_path):
+            try:
+                samples = image_io.read(src_path)
+            except image_io.UnsupportedImage:
+                pass
+        if samples is None:
+            samples = tex_encoder.load_rgba(src_path)
+        native = max(samples.shape[0], samples.shape[1])
         if native <= target_size:
             return src_path
 
         import hashlib
         tag = hashlib.md5(f"{src_path}_{target_size}".encode()).hexdigest()[:8]
-        ext = os.path.splitext(src_path)[1] or '.png'
-        out_path = os.path.join(tmp_dir, f"resized_{tag}{ext}")
+        out_path = os.path.join(tmp_dir, f"resized_{tag}.png")
 
-        img_copy = img.copy()
-        try:
-            img_copy.scale(target_size, target_size)
-            img_copy.filepath_raw = out_path
-            img_copy.save()
-        finally:
-            bpy.data.images.remove(img_copy)
+        scaled = mip_chain.resize(channel_compose.to_float(samples), target_size, target_size)
+        image_io.write_png(out_path, channel_compose.from_float(scaled, samples.dtype))
         return out_path
     except Exception as e:
         print(f"[MDF Gen] resize failed for {src_path} → {target_size}px: {e}")
@@ -1981,6 +1996,9 @@ class MdfGenProcessBase(bpy.types.Operator):
         print(f"[{cls._log_tag}] {'='*40}", flush=True)
 
         ImageListToDDS, DDSToTex = _import_tex_utils()
+        DDSToTex = functools.partial(
+            DDSToTex, gdeflateLevel=getattr(settings, 'gdeflate_level', None),
+            gdeflateWorkers=tex_file.gdeflate_workers())
 
         _t_import = time.time()
         readPresetJSON = import_read_preset_json()
@@ -1994,6 +2012,12 @@ class MdfGenProcessBase(bpy.types.Operator):
         temp_dir = tempfile.mkdtemp(prefix="mdf_gen_")
         comp_cache = {}  # (slot_type, source_ids, pbr_channels) → (composed, disk, mdf)
         export_count = fail_count = 0
+        # Every slot's .tex is queued here and written in one pass at the end
+        # (core/tex_batch.py); sources stay in temp_dir until then.
+        backend, quality = tex_encoder.preferences()
+        tex_writes = TexBatch(temp_dir, DDSToTex, workers=texture_workers(),
+                              backend=backend, quality=quality, log_tag=cls._log_tag)
+        exported = set()
 
         try:
             for mat_entry in settings.material_list:
@@ -2003,15 +2027,21 @@ class MdfGenProcessBase(bpy.types.Operator):
                         context, mat_entry, settings, mdf_col,
                         natives_root, base_path, temp_dir,
                         ImageListToDDS, DDSToTex, readPresetJSON, cls, mesh_col,
-                        comp_cache,
+                        comp_cache, tex_writes,
                     )
                     export_count += 1
+                    exported.add(mat_entry.blender_material)
                     print(f"[{cls._log_tag}] OK: {mat_entry.blender_material} ({time.time() - _t_mat:.2f}s)")
                 except Exception as e:
                     import traceback
                     print(f"[{cls._log_tag}] FAIL {mat_entry.blender_material}: {e}")
                     traceback.print_exc()
                     fail_count += 1
+
+            # A material whose textures did not all land counts as failed.
+            broken = report_failures(tex_writes.run(), cls._log_tag) & exported
+            export_count -= len(broken)
+            fail_count += len(broken)
         finally:
             shutil.rmtree(temp_dir, ignore_errors=True)
 
@@ -2065,7 +2095,7 @@ class MdfGenProcessBase(bpy.types.Operator):
     def _process_one_material(self, context, mat_entry, settings, mdf_col,
                                natives_root, base_path, temp_dir,
                                ImageListToDDS, DDSToTex, readPresetJSON, cls, mesh_col,
-                               comp_cache):
+                               comp_cache, tex_writes):
         mat_name = mat_entry.blender_material
         mat = bpy.data.materials.get(mat_name)
         if not mat:
@@ -2256,13 +2286,9 @@ class MdfGenProcessBase(bpy.types.Operator):
                 # temp_dir, and texconv names its output after the input.
                 staged = stage_source_file(
                     direct_src, temp_dir, tex_name, slot_type)
-                write_slot_tex(
-                    staged, disk_path, temp_dir,
-                    dds_fmt=resolve_dds_format(slot_type, SRGB_SLOT_TYPES),
-                    generate_mipmaps=effective_mipmaps,
-                    image_to_dds=ImageListToDDS,
-                    dds_to_tex=lambda p, o: DDSToTex(p, cls._tex_version, o),
-                )
+                tex_writes.add(staged, slot_type,
+                               resolve_dds_format(slot_type, SRGB_SLOT_TYPES),
+                               effective_mipmaps, cls._tex_version, disk_path, label=mat_name)
 
                 mdf_path = make_mdf_path(
                     base_path, tex_name, slot_type,
@@ -2282,7 +2308,7 @@ class MdfGenProcessBase(bpy.types.Operator):
                     placeholder_path = _resolve_placeholder_slot(
                         slot_type, tex_name, natives_root, base_path, temp_dir,
                         cls._abbrev_map, cls._tex_version, cls._use_art_prefix,
-                        ImageListToDDS, DDSToTex, comp_cache)
+                        ImageListToDDS, DDSToTex, comp_cache, tex_writes)
                     if placeholder_path:
                         slot_mdf_paths[slot_type] = placeholder_path
                         print(f"[{cls._log_tag}]   {slot_type} -> "
@@ -2343,28 +2369,25 @@ class MdfGenProcessBase(bpy.types.Operator):
                             print(f"[{cls._log_tag}]   {slot_type} -> NULL (all-default)")
                             continue
 
-                    hint = f"{tex_name}_{slot_type.lower()}_dg"
-                    composed = _generate_solid_texture_path(rgba, temp_dir, hint, size=256)
-                    if composed:
-                        disk_path = make_disk_path(
-                            natives_root, base_path, tex_name, slot_type,
-                            cls._abbrev_map, cls._tex_version, cls._use_art_prefix,
-                        )
-                        write_slot_tex(
-                            composed, disk_path, temp_dir,
-                            dds_fmt=resolve_dds_format(slot_type, SRGB_SLOT_TYPES),
-                            generate_mipmaps=effective_mipmaps,
-                            image_to_dds=ImageListToDDS,
-                            dds_to_tex=lambda p, o: DDSToTex(p, cls._tex_version, o),
-                        )
-
-                        mdf_path = make_mdf_path(
-                            base_path, tex_name, slot_type,
-                            cls._abbrev_map, cls._use_art_prefix,
-                        )
-                        slot_mdf_paths[slot_type] = mdf_path
-                        comp_cache[cache_key] = (composed, disk_path, mdf_path)
-                        continue
+                    # A constant: the .tex follows from one encoded block,
+                    # no image or encoder pass (core/solid_tex.py).
+                    disk_path = make_disk_path(
+                        natives_root, base_path, tex_name, slot_type,
+                        cls._abbrev_map, cls._tex_version, cls._use_art_prefix,
+                    )
+                    solid_tex.write_solid_tex(
+                        disk_path, rgba, resolve_dds_format(slot_type, SRGB_SLOT_TYPES),
+                        SOLID_SLOT_SIZE, cls._tex_version, generate_mips=effective_mipmaps,
+                        gdeflate_level=getattr(settings, 'gdeflate_level', None),
+                    )
+
+                    mdf_path = make_mdf_path(
+                        base_path, tex_name, slot_type,
+                        cls._abbrev_map, cls._use_art_prefix,
+                    )
+                    slot_mdf_paths[slot_type] = mdf_path
+                    comp_cache[cache_key] = (None, disk_path, mdf_path)
+                    continue
 
             # --- full composition path ---
             _t_comp = time.time()
@@ -2384,13 +2407,9 @@ class MdfGenProcessBase(bpy.types.Operator):
                     natives_root, base_path, tex_name, slot_type,
                     cls._abbrev_map, cls._tex_version, cls._use_art_prefix,
                 )
-                write_slot_tex(
-                    composed, disk_path, temp_dir,
-                    dds_fmt=resolve_dds_format(slot_type, SRGB_SLOT_TYPES),
-                    generate_mipmaps=effective_mipmaps,
-                    image_to_dds=ImageListToDDS,
-                    dds_to_tex=lambda p, o: DDSToTex(p, cls._tex_version, o),
-                )
+                tex_writes.add(composed, slot_type,
+                               resolve_dds_format(slot_type, SRGB_SLOT_TYPES),
+                               effective_mipmaps, cls._tex_version, disk_path, label=mat_name)
 
                 mdf_path = make_mdf_path(
                     base_path, tex_name, slot_type,
@@ -21,23 +21,27 @@ from .mdf_generator_base import load_preset_enum_items, import_read_preset_json
 # Ground truth is a bundled, preprocessed list (see scripts/build_vanilla_tex_paths.py)
 # maintained by the addon author and shipped with the addon -- not user-configurable,
 # not re-scanned at runtime. See project_mdf_material_conversion_feature memory for why.
+# It is looked up through a mapped sorted hash table built from the list
+# (core/vanilla_index.py) rather than held as a frozenset of strings.
 
 _vanilla_path_cache = {}
 
 
 def _load_vanilla_art_paths(asset_rel_path):
-    """Lazy-loaded, cached frozenset of normalized vanilla Art/*.tex paths."""
+    """Lazy-loaded, cached set of normalized vanilla Art/*.tex paths -- a
+    vanilla_index.VanillaIndex, which supports ``in`` like the frozenset it
+    replaces."""
     if not asset_rel_path:
         return frozenset()
     if asset_rel_path in _vanilla_path_cache:
         return _vanilla_path_cache[asset_rel_path]
+    from . import vanilla_index
     root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     abs_path = os.path.join(root, *asset_rel_path.split('/'))
     paths = frozenset()
     try:
-        with open(abs_path, encoding='utf-8') as f:
-            paths = frozenset(line.strip() for line in f if line.strip())
-    except OSError as e:
+        paths = vanilla_index.load(abs_path)
+    except (OSError, ValueError) as e:
         print(f"[MDF Convert] Failed to load vanilla path list '{abs_path}': {e}")
     _vanilla_path_cache[asset_rel_path] = paths
     return paths
@@ -22,6 +22,7 @@ question -- ``core/mdf_port_params.py`` answers it, and ``migrate_params`` picks
 how far to take the answer.
 """
 
+import functools
 import os
 import tempfile
 import shutil
@@ -36,9 +37,11 @@ from . import mdf_port_tex
 from .mdf_material_convert_base import (
     _load_vanilla_art_paths, is_custom_tex_path, migrate_property_value)
 from .mdf_tex_processor_base import (
-    mdf_collection_poll, _import_tex_utils, octahedral_normals_prop)
+    mdf_collection_poll, _import_tex_utils, octahedral_normals_prop, texture_workers)
 from .mdf_generator_base import (
     import_read_preset_json, PLACEHOLDER_SLOT_TYPES, _resolve_placeholder_slot)
+from . import tex_encoder, tex_file
+from .tex_batch import TexBatch, report_failures
 
 #: Fallback for the PLACEHOLDER_SLOT_TYPES slots when the port cannot write a
 #: real placeholder (textures off, or no destination mod root). Values are the
@@ -435,6 +438,14 @@ class MODDER_OT_PortMdfMaterialCrossGame(bpy.types.Operator):
         temp_dir = tempfile.mkdtemp(prefix="mdf_port_")
         new_col = _new_port_collection(mdf_col, dst_game)
         placeholder_cache = {}  # shared across the whole batch, see _resolve_placeholder_slot
+        # Repacked slots are queued and encoded together before temp_dir goes
+        # (core/tex_batch.py).
+        backend, quality = tex_encoder.preferences()
+        # The writer thread must not read preferences: bind the GDeflate threads now.
+        dds_to_tex = functools.partial(_import_tex_utils()[1],
+                                       gdeflateWorkers=tex_file.gdeflate_workers())
+        tex_writes = TexBatch(temp_dir, dds_to_tex, workers=texture_workers(),
+                              backend=backend, quality=quality, log_tag="MDF Port")
 
         converted = failed = unsupported = 0
         tex_ported = tex_skipped_vanilla = tex_skipped_no_slot = tex_skipped_no_source = 0
@@ -524,7 +535,7 @@ class MODDER_OT_PortMdfMaterialCrossGame(bpy.types.Operator):
                                 octahedral=self.octahedral_normals)
                             mdf_path, written = mdf_port_tex.write_ported_tex(
                                 ported, dst_slot_type, dst_cfg, tex_name,
-                                dst_natives_root, dst_base_path, temp_dir)
+                                dst_natives_root, dst_base_path, temp_dir, tex_writes)
                             dst_binding.path = mdf_path
                             handled_dst_slots.add(dst_slot_type)
                             if written:
@@ -578,6 +589,10 @@ class MODDER_OT_PortMdfMaterialCrossGame(bpy.types.Operator):
                     print(f"[MDF Port] convert failed for '{obj.name}': {e}")
                     import traceback
                     traceback.print_exc()
+
+            manifest = tex_writes.run()
+            report_failures(manifest, "MDF Port")
+            tex_ported -= sum(1 for r in manifest if not r.ok)
         finally:
             shutil.rmtree(temp_dir, ignore_errors=True)
 
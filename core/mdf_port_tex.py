@@ -114,31 +114,52 @@ def layouts_equal(src_slot, dst_slot, src_channel_maps, dst_channel_maps):
     return a is not None and a == b
 
 
-# ── .tex -> PNG decode ───────────────────────────────────────────────────────
+# ── .tex -> pixels ──────────────────────────────────────────────────────────
+
+def decode_tex_to_array(tex_path, temp_dir):
+    """A source .tex's mip 0 as ``(h, w, 4)`` float32, bottom row first -- the
+    same orientation ``image_to_array`` gives, so it drops into the compose
+    code unchanged.
+
+    Decoded in-process by ``core/bcn_decode.py``: no temporary DDS, no PNG, no
+    texconv, so a port runs the same on a machine without the Windows DLL.
+    Formats that module does not cover (BC2, BC6H -- not something a
+    character material slot ships in practice) still take the texconv round
+    trip rather than failing.
+    """
+    import numpy as np
 
-def decode_tex_to_png(tex_path, temp_dir):
-    """A source .tex's mip 0, decoded to a plain PNG for pixel access."""
-    from . import tex_file, dds_file, texconv_native
+    from . import bcn_decode, tex_file
 
     dds = tex_file.read_tex_to_dds(tex_path)
+    if bcn_decode.can_decode(dds.dxgi_format):
+        return np.ascontiguousarray(np.flipud(bcn_decode.decode_dds(dds)))
+    return _decode_tex_via_texconv(dds, tex_path, temp_dir)
+
+
+def _decode_tex_via_texconv(dds, tex_path, temp_dir):
+    import numpy as np
+
+    from . import dds_file, image_io, texconv_native
+
     # A binding's real filename is "<name>.tex.<version>" -- os.path.splitext
     # would treat ".<version>" as the extension and leave "<name>.tex" as the
-    # stem, and that leftover ".tex" then false-triggers slot_resolver.
-    # write_slot_tex's own "is this source already a .tex" substring check
-    # once it survives into the decoded PNG's filename (see
-    # write_ported_tex -> write_slot_tex downstream).
+    # stem, which then reads as a .tex to anything downstream that checks.
     base = os.path.basename(tex_path)
     tex_idx = base.lower().find('.tex')
     stem = base[:tex_idx] if tex_idx >= 0 else os.path.splitext(base)[0]
     dds_tmp = os.path.join(temp_dir, f"{stem}_port_src.dds")
     dds_file.write_dds(dds, dds_tmp)
-    return texconv_native.convert_to_png(dds_tmp, temp_dir)
+    png_path = texconv_native.convert_to_png(dds_tmp, temp_dir)
+
+    return np.ascontiguousarray(np.flipud(image_io.read_rgba(png_path)))
 
 
 # ── Channel unpack (inverse of _compose_channels) ───────────────────────────
 
-def unpack_channels(png_path, slot_type, channel_maps=None, octahedral=False):
-    """A decoded slot PNG -> ``{pbr_type: (h, w, 4) float32}``, one plane per
+def unpack_channels(pix, slot_type, channel_maps=None, octahedral=False):
+    """Decoded slot pixels (decode_tex_to_array) -> ``{pbr_type: (h, w, 4)
+    float32}``, one plane per
     semantic channel group the slot actually carries. Mirrors
     mdf_tex_processor_base._compose_channels in reverse, including the
     octahedral normal decode for the 3-in-1 normal slots.
@@ -148,11 +169,9 @@ def unpack_channels(png_path, slot_type, channel_maps=None, octahedral=False):
     would only cost time and precision -- the octahedral decode produces
     genuinely continuous values that a PNG would quantise.
     """
-    import bpy
     import numpy as np
 
-    from .mdf_tex_processor_base import (BASE_SLOT_CHANNEL_MAPS, NORMAL_OCTAHEDRAL_SLOT_TYPES,
-                                         _CH, image_to_array)
+    from .mdf_tex_processor_base import BASE_SLOT_CHANNEL_MAPS, NORMAL_OCTAHEDRAL_SLOT_TYPES, _CH
     from .re_normal_pack import decode_normal_ga
 
     if channel_maps is None:
@@ -161,16 +180,7 @@ def unpack_channels(png_path, slot_type, channel_maps=None, octahedral=False):
     if ch_map is None:
         return {}
 
-    tmp_name = "__mdf_port_unpack_src"
-    if tmp_name in bpy.data.images:
-        bpy.data.images.remove(bpy.data.images[tmp_name])
-    img = bpy.data.images.load(png_path, check_existing=False)
-    img.name = tmp_name
-    img.colorspace_settings.name = 'Non-Color'
-    w, h = img.size
-    pix = image_to_array(img)
-    bpy.data.images.remove(img)
-
+    h, w = pix.shape[:2]
     pbr_arrays = {}
 
     def _plane(pbr_type):
@@ -224,8 +234,8 @@ def repack_slot(src_tex_path, src_slot_type, dst_slot_type, temp_dir, tex_name,
     if layouts_equal(src_slot_type, dst_slot_type, src_maps, dst_maps):
         return "tex", src_tex_path
 
-    png_path = decode_tex_to_png(src_tex_path, temp_dir)
-    planes = unpack_channels(png_path, src_slot_type, channel_maps=src_maps,
+    pix = decode_tex_to_array(src_tex_path, temp_dir)
+    planes = unpack_channels(pix, src_slot_type, channel_maps=src_maps,
                              octahedral=octahedral)
     composed = _compose_channels(dst_slot_type, {}, {}, temp_dir, tex_name,
                                  channel_maps=dst_maps, pbr_arrays=planes,
@@ -249,7 +259,7 @@ def rewrite_tex_container(src_tex_path, dst_tex_version, out_path):
     dds = tex_file.read_tex_to_dds(src_tex_path, all_mips=True)
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     with open(out_path, 'wb') as f:
-        f.write(tex_file.build_tex_from_dds(dds, dst_tex_version))
+        tex_file.write_tex(f, dds, dst_tex_version)
     return out_path
 
 
@@ -281,13 +291,15 @@ def resolve_source_disk_path(natives_root, mdf_path, tex_version):
 
 
 def write_ported_tex(source, dst_slot_type, dst_cfg, tex_name, dst_natives_root,
-                     dst_base_path, temp_dir):
+                     dst_base_path, temp_dir, tex_writes=None):
     """Write a ported slot out under the destination game's own on-disk
     convention.  *source* is repack_slot's ``(kind, payload)``.
 
     Returns (mdf_path, written) -- mdf_path is set (and the binding can point
     at it) even when dst_natives_root is empty; only the on-disk .tex write is
-    skipped, per the "mod root is optional" decision."""
+    skipped, per the "mod root is optional" decision.  With *tex_writes* (a
+    tex_batch.TexBatch) a repacked image is queued there rather than encoded
+    here, and *written* means queued."""
     from .mdf_tex_processor_base import make_mdf_path, make_disk_path, SRGB_SLOT_TYPES, _import_tex_utils
     from .slot_resolver import resolve_dds_format, write_slot_tex
 
@@ -306,6 +318,10 @@ def write_ported_tex(source, dst_slot_type, dst_cfg, tex_name, dst_natives_root,
         return mdf_path, True
 
     png_path = payload
+    if tex_writes is not None:
+        tex_writes.add(png_path, dst_slot_type, resolve_dds_format(dst_slot_type, SRGB_SLOT_TYPES),
+                       True, tex_version, disk_path, label=tex_name)
+        return mdf_path, True
     image_to_dds, dds_to_tex = _import_tex_utils()
     write_slot_tex(
         png_path, disk_path, temp_dir,
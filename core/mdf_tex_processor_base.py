@@ -1,12 +1,15 @@
 import bpy
+import collections
+import functools
 import os
 import json
 import tempfile
 import shutil
+import threading
 import time
 
 from .i18n import T
-from .slot_resolver import resolve_dds_format, write_slot_tex
+from .slot_resolver import resolve_dds_format
 from .re_normal_pack import encode_normal_ga
 
 # ── PBR Constants ──────────────────────────────────────────────────────────────
@@ -107,6 +110,26 @@ def octahedral_normals_prop():
         default=False,
     )
 
+def gdeflate_level_prop():
+    """GDeflate level for the .tex versions that need it (MHWS, RE9), shared by
+    their processors and generators so each export can trade size for speed.
+    Best Ratio is what every export used before this was a setting.  Two
+    languages in the tooltip for the same reason as octahedral_normals_prop.
+    """
+    return bpy.props.EnumProperty(
+        name="GDeflate Level",
+        description=(
+            "Compression level for the .tex mip data.\n"
+            ".tex 贴图数据的 GDeflate 压缩级别。"
+        ),
+        items=[
+            ('FASTEST', "Fastest", "Quickest export, largest files / 最快，文件最大"),
+            ('DEFAULT', "Default", "Balanced / 均衡"),
+            ('BEST_RATIO', "Best Ratio", "Smallest files, slowest export / 文件最小，最慢"),
+        ],
+        default='BEST_RATIO',
+    )
+
 _CH           = {'R': 0, 'G': 1, 'B': 2, 'A': 3}
 _CH_ENUM_ITEMS = [('R', 'R', ''), ('G', 'G', ''), ('B', 'B', ''), ('A', 'A', '')]
 
@@ -402,23 +425,28 @@ def make_disk_path(natives_root, base_path, tex_name, slot_type, abbrev_map, tex
 
 # ── Native texture conversion (no external addon) ──────────────────────────────
 # Drop-in replacements for RE Mesh Editor's re_tex_utils.ImageListToDDS/DDSToTex,
-# backed by our own bundled texconv + .tex writer (core/texconv_native.py,
-# core/tex_file.py) instead of the external RE Mesh Editor addon.
+# backed by our own encoder + .tex writer (core/tex_encoder.py -- bundled texconv
+# or the NumPy fallback -- and core/tex_file.py) instead of the external RE Mesh
+# Editor addon.
 
 def _ImageListToDDS(imageConvertList, outDir, generateMipMaps):
-    from . import texconv_native
+    from . import tex_encoder
     for in_path, dds_format in imageConvertList:
         try:
-            texconv_native.convert_to_dds(in_path, dds_format, outDir, generate_mips=generateMipMaps)
+            tex_encoder.convert_to_dds(in_path, dds_format, outDir, generate_mips=generateMipMaps)
         except Exception as err:
             print(f"Failed to convert {in_path} - {err}")
 
 
-def _DDSToTex(ddsPathList, texVersion, outPath):
+def _DDSToTex(ddsPathList, texVersion, outPath, gdeflateLevel=None, gdeflateWorkers=None):
+    # gdeflateWorkers=None reads the addon preference, so callers that run this
+    # off the main thread (a TexBatch writer) bind tex_file.gdeflate_workers()
+    # in beforehand.
     from . import tex_file
     if len(ddsPathList) != 1:
         raise NotImplementedError("Texture arrays are not supported")
-    tex_file.write_tex_from_dds(ddsPathList[0], texVersion, outPath)
+    tex_file.write_tex_from_dds(ddsPathList[0], texVersion, outPath, gdeflateLevel,
+                                gdeflateWorkers)
 
 
 def _import_tex_utils():
@@ -466,10 +494,93 @@ def channel_maps_consume_ao(channel_maps):
     return False
 
 
+def compose_sources(slot_type, pbr_paths, channel_maps=None, bake_ao_into_color=False):
+    """``{pbr_type: path}`` of the PBR images *slot_type*'s channel map reads
+    that exist on disk."""
+    if channel_maps is None:
+        channel_maps = BASE_SLOT_CHANNEL_MAPS
+    ch_map = channel_maps.get(slot_type)
+    if ch_map is None:
+        return {}
+    needed_types = {src[0] for src in ch_map.values()
+                    if src is not None and isinstance(src, tuple)}
+    # No channel map references 'ao' when it is being baked into the colour, so
+    # it has to be requested explicitly or the loader would skip it.
+    if bake_ao_into_color:
+        needed_types.add('ao')
+    return {pt: pbr_paths[pt] for pt in needed_types
+            if pbr_paths.get(pt) and os.path.isfile(pbr_paths[pt])}
+
+
+def sources_need_blender(sources):
+    """True when one of *sources*' files can only be read through bpy (so
+    on the main thread) -- anything but PNG, TGA and DDS."""
+    from . import image_io
+    return any(not (image_io.can_read(p) or p.lower().endswith('.dds'))
+               for p in sources.values())
+
+
+def compose_channels_read(slot_type, pbr_channels=None, channel_maps=None,
+                          bake_ao_into_color=False):
+    """``{pbr_type: {channel index, ...}}`` -- which channels of which PBR
+    image _compose_channels reads for *slot_type*, after the per-type channel
+    selectors in *pbr_channels*.  Everything else is never loaded."""
+    if channel_maps is None:
+        channel_maps = BASE_SLOT_CHANNEL_MAPS
+    pbr_channels = pbr_channels or {}
+    read = collections.defaultdict(set)
+    for src in (channel_maps.get(slot_type) or {}).values():
+        if not (isinstance(src, tuple) and src):
+            continue
+        pbr_type, in_ch_i = src[0], src[1]
+        if pbr_type in PBR_CHANNEL_SELECTABLE and pbr_channels.get(pbr_type):
+            in_ch_i = _CH.get(pbr_channels[pbr_type], in_ch_i)
+        read[pbr_type].add(in_ch_i)
+    if bake_ao_into_color:
+        read['ao'].add(_CH.get(pbr_channels.get('ao'), 0))
+    return dict(read)
+
+
+def load_compose_inputs(slot_type, pbr_paths, channel_maps=None, bake_ao_into_color=False,
+                        blender=True, pbr_channels=None):
+    """``{pbr_type: {channel index: (h, w) plane}}`` (Blender row order) for
+    the channels *slot_type*'s channel map reads, all scaled to the widest
+    source; None when there are none.
+
+    The loading half of _compose_channels.  Planes keep the file's sample
+    type (core/channel_compose.py).  PNG/TGA/DDS sources are read without
+    bpy, so on any thread; *blender* False turns any other source into
+    image_io.UnsupportedImage rather than a Blender load off the main thread.
+    """
+    from . import channel_compose
+    import numpy as np
+
+    sources = compose_sources(slot_type, pbr_paths, channel_maps, bake_ao_into_color)
+    if not sources:
+        return None
+    read = compose_channels_read(slot_type, pbr_channels, channel_maps, bake_ao_into_color)
+    loaded = {pt: channel_compose.load_planes(path, read.get(pt, ()), blender=blender)
+              for pt, path in sources.items()}
+
+    # Scale to the largest (not the first): a 256×256 SOLID image must not
+    # shrink larger baked or source textures due to set order.
+    shapes = [p.shape for planes in loaded.values() for p in planes.values()]
+    if not shapes:
+        return None
+    ref_h, ref_w = max(shapes, key=lambda hw: hw[1])
+    for planes in loaded.values():
+        for ch, plane in planes.items():
+            if plane.shape != (ref_h, ref_w):
+                plane = channel_compose.resize(plane, ref_w, ref_h)
+            planes[ch] = np.flipud(plane)
+    return loaded
+
+
 def _compose_channels(slot_type, pbr_paths, pbr_channels, temp_dir, tex_name, pbr_inv=None,
                        channel_maps=None, normal_flip_g=False,
                        bake_ao_into_color=False, ao_strength=1.0,
-                       pbr_arrays=None, octahedral=True):
+                       pbr_arrays=None, octahedral=True, as_array=False, threads=None,
+                       pbr_planes=None):
     """Compose a packed texture from PBR inputs for the given slot type.
     channel_maps: optional override; defaults to BASE_SLOT_CHANNEL_MAPS.
     Channel map values: tuple (pbr_type, ch_idx[, True]) | None (=0.0) | float (constant).
@@ -477,14 +588,25 @@ def _compose_channels(slot_type, pbr_paths, pbr_channels, temp_dir, tex_name, pb
     bake_ao_into_color: multiply the AO map into this slot's colour channels.  For
         a game with no AO slot that is the only way to keep an AO map at all --
         see channel_maps_consume_ao.  ao_strength lerps white -> map, matching
-        the packed shader's AO Strength so preview and export agree.
+        the packed shader's AO Strength slider so preview and export agree.
     pbr_arrays: ``{pbr_type: (h, w, 4) float32}`` supplied in process, used instead
         of loading *pbr_paths* from disk.  For a caller that just produced the
         planes itself (the cross-game port) this skips writing each one to an
         8-bit PNG and reading it back -- which is not only the slower path but a
         lossier one, since values that are genuinely continuous (a decoded
         octahedral normal) get quantised on the way through.
+    pbr_planes: load_compose_inputs' result, for a caller that loaded the
+        sources itself (the texture processor, off the main thread).
+    as_array: return the composed ``(h, w, 4)`` array (Blender row order)
+        instead of saving it as a PNG -- for the NumPy encoder, which takes it
+        straight from here (tex_encoder.encode_array).  uint8 when every
+        source read was 8-bit, uint16 for a 16-bit source, float32 once a
+        source came in as floats; see core/channel_compose.py.
+    threads: for the row bands and the PNG deflate (core/row_bands.py,
+        core/image_io.py); default one per core, 1 for a caller already
+        running composes in parallel.
     """
+    from . import channel_compose as cc
     if pbr_inv is None:
         pbr_inv = {}
     if channel_maps is None:
@@ -496,13 +618,7 @@ def _compose_channels(slot_type, pbr_paths, pbr_channels, temp_dir, tex_name, pb
         print(f"[MDF Tex] No channel map for slot type: {slot_type}")
         return None
 
-    needed_types = {src[0] for src in ch_map.values()
-                    if src is not None and isinstance(src, tuple)}
-    # No channel map references 'ao' when it is being baked into the colour, so
-    # it has to be requested explicitly or the loader would skip it.
-    if bake_ao_into_color:
-        needed_types.add('ao')
-    loaded = {}
+    read = compose_channels_read(slot_type, pbr_channels, channel_maps, bake_ao_into_color)
 
     if pbr_arrays:
         # Handed straight over in memory, skipping a round trip through 8-bit PNGs.
@@ -514,68 +630,42 @@ def _compose_channels(slot_type, pbr_paths, pbr_channels, temp_dir, tex_name, pb
         # slots, and MHWI is free to give a 512px RMT to a 2048px albedo.  Dropping
         # there costs the material its roughness and metallic with nothing logged,
         # which is the worst way for this to fail.
-        for pbr_type in needed_types:
-            arr = pbr_arrays.get(pbr_type)
-            if arr is not None:
-                loaded[pbr_type] = arr
+        loaded = {pt: {ch: pbr_arrays[pt][:, :, ch] for ch in chs}
+                  for pt, chs in read.items() if pbr_arrays.get(pt) is not None}
         if not loaded:
             return None
-        ref_h, ref_w = max((a.shape[:2] for a in loaded.values()),
+        ref_h, ref_w = max((pbr_arrays[pt].shape[:2] for pt in loaded),
                            key=lambda hw: hw[0] * hw[1])
-        for pbr_type, arr in list(loaded.items()):
-            h, w = arr.shape[:2]
+        for pbr_type, planes in loaded.items():
+            h, w = pbr_arrays[pbr_type].shape[:2]
             if (h, w) == (ref_h, ref_w):
                 continue
             print(f"[MDF Tex] scaling {pbr_type} plane {w}x{h} -> {ref_w}x{ref_h}")
-            rows = (np.arange(ref_h) * h // ref_h).clip(0, h - 1)
-            cols = (np.arange(ref_w) * w // ref_w).clip(0, w - 1)
-            loaded[pbr_type] = arr[rows[:, None], cols[None, :]]
+            for ch, plane in planes.items():
+                planes[ch] = cc.resize(plane, ref_w, ref_h)
     else:
-        # First pass: load all images and determine the largest size as reference.
-        # Using the largest (not the first) avoids 256×256 SOLID images accidentally
-        # shrinking larger baked or source textures due to non-deterministic set order.
-        raw_imgs = {}
-        ref_w = ref_h = 0
-        for pbr_type in needed_types:
-            img_path = pbr_paths.get(pbr_type, '')
-            if not img_path or not os.path.isfile(img_path):
-                continue
-            tmp_name = f"__mdf_compose_tmp_{pbr_type}"
-            if tmp_name in bpy.data.images:
-                bpy.data.images.remove(bpy.data.images[tmp_name])
-            img = bpy.data.images.load(img_path, check_existing=False)
-            img.name = tmp_name
-            img.colorspace_settings.name = 'Non-Color'
-            iw, ih = img.size
-            if iw > ref_w:
-                ref_w, ref_h = iw, ih
-            raw_imgs[pbr_type] = img
-
-        if not raw_imgs:
+        loaded = pbr_planes or load_compose_inputs(slot_type, pbr_paths, channel_maps,
+                                                   bake_ao_into_color,
+                                                   pbr_channels=pbr_channels)
+        if not loaded:
             return None
-
-        if ref_w == 0:
-            ref_w = ref_h = 1024
-
-        # Second pass: scale down any smaller images and convert to numpy arrays.
-        for pbr_type, img in raw_imgs.items():
-            iw, ih = img.size
-            if iw != ref_w or ih != ref_h:
-                img.scale(ref_w, ref_h)
-            loaded[pbr_type] = image_to_array(img)
-            bpy.data.images.remove(img)
-
-    result = np.zeros((ref_h, ref_w, 4), dtype=np.float32)
-
+    all_planes = [p for planes in loaded.values() for p in planes.values()]
+    ref_h, ref_w = all_planes[0].shape
+    dtype = cc.common_dtype(all_planes)
+
+    # Per output channel: a constant, or a source plane (file row order --
+    # flipud of a flipud view is the decoded array again) and whether to
+    # invert it.  Resolved once; the bands below only index into it.
+    plan = []
     for out_ch, src in ch_map.items():
         out_i = _CH[out_ch]
         if src is None:
             # Alpha channel (index 3) defaults to opaque to avoid premultiplied-alpha
             # issues when texconv converts the PNG to DDS (A=0 would zero all channels).
-            result[:, :, out_i] = 1.0 if out_i == 3 else 0.0
+            plan.append((out_i, cc.constant(1.0 if out_i == 3 else 0.0, dtype), False))
             continue
         if isinstance(src, (int, float)):
-            result[:, :, out_i] = float(src)
+            plan.append((out_i, cc.constant(src, dtype), False))
             continue
         pbr_type = src[0]
         in_ch_i  = src[1]
@@ -584,74 +674,112 @@ def _compose_channels(slot_type, pbr_paths, pbr_channels, temp_dir, tex_name, pb
             override = pbr_channels.get(pbr_type)
             if override:
                 in_ch_i = _CH.get(override, in_ch_i)
+            invert ^= bool(pbr_inv.get(pbr_type))
         pix = loaded.get(pbr_type)
         if pix is None:
             val = PBR_DEFAULTS.get(pbr_type, [0.0]*4)[in_ch_i]
             if invert:
                 val = 1.0 - val
-            result[:, :, out_i] = val
-        else:
-            data = pix[:, :, in_ch_i].copy()
+            plan.append((out_i, cc.constant(val, dtype), False))
+            continue
+        invert ^= bool(normal_flip_g) and pbr_type == 'normal' and in_ch_i == 1
+        plan.append((out_i, np.flipud(pix[in_ch_i]), invert))
+
+    # These pack a third quantity (AO/cavity) into B, which a plain
+    # two-channel normal has no room for -- see core/re_normal_pack.py.
+    # Runs after normal_flip_g above, so that toggle still corrects a
+    # source authored in the other Y convention before this encodes it.
+    octahedral = octahedral and slot_type in NORMAL_OCTAHEDRAL_SLOT_TYPES
+
+    ao_plane = None
+    if bake_ao_into_color and loaded.get('ao') is not None:
+        strength = min(max(float(ao_strength), 0.0), 1.0)
+        # Same channel/invert override as the channel-map path above --
+        # this branch has no ch_map entry for 'ao' to read them from
+        # (that's the whole reason it exists: games with no AO-consuming
+        # slot at all), so it has to consult pbr_channels/pbr_inv itself.
+        ao_plane = np.flipud(loaded['ao'][_CH.get(pbr_channels.get('ao'), 0)])
+        # Colour channels only. Alpha carries opacity or metallic depending
+        # on the slot, and darkening either would be wrong.
+        colour_channels = [
+            _CH[ch] for ch, src in ch_map.items()
+            if isinstance(src, tuple) and src and src[0] == 'color'
+        ]
+        print(f"[MDF Tex] {slot_type}: AO baked into "
+              f"{len(colour_channels)} colour channel(s) at strength {strength:.2f}")
+
+    def compose_band(r0, r1):
+        band = np.empty((r1 - r0, ref_w, 4), dtype=dtype)
+        for out_i, src, invert in plan:
+            if not isinstance(src, np.ndarray):
+                band[:, :, out_i] = src
+                continue
+            data = cc.convert(src[r0:r1], dtype)
             if invert:
-                data = 1.0 - data
-            if pbr_type in PBR_CHANNEL_SELECTABLE and pbr_inv.get(pbr_type):
-                data = 1.0 - data
-            if normal_flip_g and pbr_type == 'normal' and in_ch_i == 1:
-                data = 1.0 - data
-            result[:, :, out_i] = data
-
-    if octahedral and slot_type in NORMAL_OCTAHEDRAL_SLOT_TYPES:
-        # These pack a third quantity (AO/cavity) into B, which a plain
-        # two-channel normal has no room for -- see core/re_normal_pack.py.
-        # Runs after normal_flip_g above, so that toggle still corrects a
-        # source authored in the other Y convention before this encodes it.
-        g = result[:, :, _CH['G']]
-        a = result[:, :, _CH['A']]
-        result[:, :, _CH['G']], result[:, :, _CH['A']] = encode_normal_ga(g, a)
-
-    if bake_ao_into_color:
-        ao_pix = loaded.get('ao')
-        if ao_pix is not None:
-            strength = min(max(float(ao_strength), 0.0), 1.0)
-            # Same channel/invert override as the channel-map path above --
-            # this branch has no ch_map entry for 'ao' to read them from
-            # (that's the whole reason it exists: games with no AO-consuming
-            # slot at all), so it has to consult pbr_channels/pbr_inv itself.
-            ao_ch_i = _CH.get(pbr_channels.get('ao'), 0)
-            ao_data = ao_pix[:, :, ao_ch_i]
+                cc.invert(data, out=band[:, :, out_i])
+            else:
+                band[:, :, out_i] = data
+        if octahedral:
+            g, a = encode_normal_ga(cc.to_float(band[:, :, _CH['G']]),
+                                    cc.to_float(band[:, :, _CH['A']]))
+            band[:, :, _CH['G']] = cc.from_float(g, dtype)
+            band[:, :, _CH['A']] = cc.from_float(a, dtype)
+        if ao_plane is not None:
+            ao_data = cc.to_float(ao_plane[r0:r1])
             if pbr_inv.get('ao'):
                 ao_data = 1.0 - ao_data
             # lerp(white, ao, strength): strength 0 leaves the colour untouched,
             # which is the same curve the shader's AO Strength slider follows.
             occl = 1.0 - strength * (1.0 - ao_data)
-            # Colour channels only. Alpha carries opacity or metallic depending
-            # on the slot, and darkening either would be wrong.
-            colour_channels = [
-                _CH[ch] for ch, src in ch_map.items()
-                if isinstance(src, tuple) and src and src[0] == 'color'
-            ]
             for out_i in colour_channels:
-                result[:, :, out_i] = result[:, :, out_i] * occl
-            print(f"[MDF Tex] {slot_type}: AO baked into "
-                  f"{len(colour_channels)} colour channel(s) at strength {strength:.2f}")
+                band[:, :, out_i] = cc.from_float(cc.to_float(band[:, :, out_i]) * occl, dtype)
+        return band
+
+    # In row bands (core/row_bands.py), so the float steps above cost a band
+    # of memory rather than the image.
+    from . import image_io, row_bands
+    threads = threads or os.cpu_count() or 1
+    rows = row_bands.band_rows(ref_w)
+
+    if as_array:
+        result = np.empty((ref_h, ref_w, 4), dtype=dtype)
+        top_first = np.flipud(result)
+
+        def fill(r0, r1):
+            top_first[r0:r1] = compose_band(r0, r1)
+
+        row_bands.run(ref_h, rows, fill, threads=threads)
+        return result
 
     abbrev   = BASE_TEXTURE_TYPE_ABBREV.get(slot_type, slot_type)
     out_name = f"{tex_name}_{abbrev}_composed.png"
     out_path = os.path.join(temp_dir, out_name)
-
-    tmp_out = f"__mdf_compose_out_{abbrev}"
-    if tmp_out in bpy.data.images:
-        bpy.data.images.remove(bpy.data.images[tmp_out])
-    out_img = bpy.data.images.new(tmp_out, width=ref_w, height=ref_h, alpha=True)
-    out_img.colorspace_settings.name = 'Non-Color'
-    array_to_image(out_img, result)
-    out_img.filepath_raw = out_path
-    out_img.file_format = 'PNG'
-    out_img.save()
-    bpy.data.images.remove(out_img)
+    depth = 16 if dtype == np.uint16 else 8
+    with image_io.PngWriter(out_path, ref_w, ref_h, 4, depth, threads=threads) as png:
+        row_bands.run(ref_h, rows, compose_band, png.write, threads)
     return out_path
 
 
+def normal_mip_spec(slot_type, channel_maps=None, octahedral=True):
+    """The mip_chain.build_mip_chain *normal* argument for a composed slot, or
+    None when the slot carries no normal.  Mirrors _compose_channels: the
+    octahedral slots hold the pair in G/A once encoded, everything else holds
+    whichever channels the map sends ``('normal', 0)`` and ``('normal', 1)`` to.
+    """
+    if channel_maps is None:
+        channel_maps = BASE_SLOT_CHANNEL_MAPS
+    ch_map = channel_maps.get(slot_type) or {}
+    if octahedral and slot_type in NORMAL_OCTAHEDRAL_SLOT_TYPES:
+        return ('octahedral', _CH['G'], _CH['A'])
+    found = {}
+    for out_ch, src in ch_map.items():
+        if isinstance(src, tuple) and len(src) >= 2 and src[0] == 'normal':
+            found.setdefault(src[1], _CH[out_ch])
+    if 0 in found and 1 in found:
+        return ('xy', found[0], found[1])
+    return None
+
+
 # ── State persistence ──────────────────────────────────────────────────────────
 
 def _capture_material_state(m):
@@ -992,6 +1120,618 @@ class MdfTexPasteMaterialBase(bpy.types.Operator):
         return {'FINISHED'}
 
 
+# ── Process run ────────────────────────────────────────────────────────────────
+# Process runs in stages (core/stage_pipeline.py).  The run below walks the
+# slots on the main thread, where every bpy read happens -- source images, the
+# material list, bindings -- and hands the NumPy compose and block encode to a
+# worker pool and the .tex write, GDeflate included, to a writer thread.  Each
+# result comes back through poll() on the main thread, which is the only place
+# a binding path gets set.  Preferences are read up front for the same reason.
+
+def texture_workers():
+    """Worker threads for Process: the addon preference, 0 meaning half the
+    CPU cores, at most 4 -- each in-flight 4K slot holds a few hundred MB."""
+    from .addon_prefs import pref
+    workers = pref('texture_workers', 0)
+    return workers if workers > 0 else max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+def share_identical_textures():
+    """The addon preference; True outside Blender or before registration."""
+    from .addon_prefs import pref
+    return bool(pref('share_identical_textures', True))
+
+
+def _snapshot_materials(settings):
+    """Plain-data copy of what Process reads from the material list, taken once:
+    a run spans many timer ticks and the panel stays editable meanwhile."""
+    materials = []
+    for mat_item in settings.materials:
+        pbr_paths = {pt: getattr(mat_item.pbr, pt) for pt in PBR_TYPES}
+        color_path    = pbr_paths.get('color', '')
+        emissive_path = pbr_paths.get('emissive', '')
+        materials.append({
+            'obj_name':      mat_item.material_obj_name,
+            'name':          mat_item.material_name,
+            'tex_name':      mat_item.material_name.removesuffix('_UseSC'),
+            # The global toggle overrides this material's own checkbox,
+            # same as core.mdf_generator_base's effective_mipmaps.
+            'mipmaps':       (mat_item.generate_mipmaps
+                              and not getattr(settings, 'global_disable_mipmaps', False)),
+            'skip_textures': mat_item.skip_textures,
+            'pbr_paths':     pbr_paths,
+            'pbr_channels':  {pt: getattr(mat_item.pbr, f"{pt}_ch")
+                              for pt in PBR_CHANNEL_SELECTABLE},
+            'pbr_inv':       {pt: getattr(mat_item.pbr, f"{pt}_inv")
+                              for pt in PBR_CHANNEL_SELECTABLE},
+            'normal_flip_g': mat_item.pbr.normal_flip_g,
+            'share_emi':     bool(color_path and emissive_path and color_path == emissive_path),
+            'slots':         [(s.texture_type, s.mode, bpy.path.abspath(s.direct_image)
+                               if s.direct_image else '')
+                              for s in mat_item.slots],
+            # Filled in as the run goes -- see _ProcessRun._bind.
+            'albd_out':      None,
+            'albd_pending':  False,
+            'emi_deferred':  None,
+        })
+    return materials
+
+
+class _SharedTex:
+    """One texture of a run that several slots may point at -- see
+    _ProcessRun._share."""
+
+    __slots__ = ('mdf_path', 'disk_path', 'state', 'waiters')
+
+    def __init__(self, mdf_path, disk_path, state='PENDING'):
+        self.mdf_path  = mdf_path
+        self.disk_path = disk_path
+        self.state     = state      # PENDING | DONE | FAILED
+        self.waiters   = []         # (mat, slot_type) bound once this is DONE
+
+
+class _SamePixels:
+    """A worker's answer for a composed slot whose pixels another slot of the
+    run already produced: nothing is encoded or written."""
+
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+
+class _ProcessRun:
+    """One press of Process, from the first slot to the report.
+
+    Slots that would come out identical -- the same NRRO or mask bound to ten
+    materials -- are produced once.  Before composing, each slot is keyed by its
+    sources and settings (slot_cache.slot_key / direct_key); a second slot with
+    a key already in flight or written is bound to that file instead of getting
+    its own.  On the NumPy route the composed pixels are hashed as well, which
+    also catches identical images under different file names.  See _share.
+
+    With the slot cache on, a pixel match is remembered across runs: the slot
+    stores an alias to the owner's key, and each cache entry keeps its pixel
+    digest, so a run served from the cache shares the same way.  See
+    _share_cached.
+    """
+
+    def __init__(self, op_cls, settings, natives_root, base_path):
+        from . import slot_cache, stage_pipeline, tex_encoder, tex_file
+
+        self.cls          = op_cls
+        self.natives_root = natives_root
+        self.base_path    = base_path
+        self.collection   = settings.mdf_collection.name
+        self.channel_maps = (op_cls._channel_maps if op_cls._channel_maps is not None
+                             else BASE_SLOT_CHANNEL_MAPS)
+        self.gdeflate_level = getattr(settings, 'gdeflate_level', None)
+        self.octahedral   = getattr(settings, 'octahedral_normals', False)
+        # Unchanged slots are copied from the last run's output instead of
+        # re-composed and re-encoded -- see core/slot_cache.py.
+        self.use_cache    = slot_cache.enabled()
+        # Located here: the writer thread stores entries and must not touch bpy.
+        self.cache_root   = slot_cache.cache_dir() if self.use_cache else None
+        self.backend, self.quality = tex_encoder.preferences()
+        self.gdeflate_workers = tex_file.gdeflate_workers()
+        self.use_share    = share_identical_textures()
+        self._shared = {}           # source key -> _SharedTex
+        self._pixels = {}           # composed-pixel digest -> source key (workers)
+        self._digests = {}          # source key -> its composed-pixel digest
+        self._pixels_lock = threading.Lock()
+        self._own_pixels = set()    # (material, slot) not to be pixel-matched again
+
+        self.materials = _snapshot_materials(settings)
+        self.total = sum(len(m['slots']) for m in self.materials)
+        self.export_count = self.fail_count = self.skip_count = self.cancel_count = 0
+        self.shared_count = 0
+
+        self.temp_dir = tempfile.mkdtemp(prefix="mdf_tex_")
+        self.pipeline = stage_pipeline.StagePipeline(texture_workers())
+        # Decoded inputs wait in memory for a worker; bound how many.
+        self.max_in_flight = self.pipeline.workers * 2
+        self._plan = ((mat, slot) for mat in self.materials for slot in mat['slots'])
+        self._retry = collections.deque()
+        self._load_here = set()     # (material, slot) whose sources need bpy
+        self._planned_all = False
+        self._job_id = 0
+        self._t_start = time.time()
+
+    @property
+    def handled(self):
+        return self.export_count + self.fail_count + self.skip_count + self.cancel_count
+
+    @property
+    def cancelled(self):
+        return self.pipeline.cancelled
+
+    @property
+    def finished(self):
+        return ((self._planned_all or self.cancelled)
+                and (self.cancelled or not self._retry)
+                and self.pipeline.pending == 0)
+
+    # ── Main-thread stage ──
+
+    def step(self, budget):
+        """Plan slots for up to *budget* seconds while there is room in flight,
+        and apply whatever has finished.  False once the run is over."""
+        self.pipeline.poll()
+        end = time.perf_counter() + budget
+        while (not self.cancelled and self.pipeline.pending < self.max_in_flight
+               and time.perf_counter() < end):
+            if not self._plan_next():
+                break
+        self.pipeline.poll()
+        return not self.finished
+
+    def cancel(self):
+        print(f"[{self.cls._log_tag}] cancelling...", flush=True)
+        self.pipeline.cancel()
+
+    def finish(self):
+        self.pipeline.drain()
+        self.pipeline.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        if self.use_cache:
+            from . import slot_cache
+            slot_cache.prune(root=self.cache_root)
+        if self.shared_count:
+            print(f"[{self.cls._log_tag}] {self.shared_count} slot(s) share another's texture")
+        print(f"[{self.cls._log_tag}] ★ 总耗时: {time.time() - self._t_start:.2f}s ★", flush=True)
+
+    def _plan_next(self):
+        if self._retry:
+            mat, slot = self._retry.popleft()
+        else:
+            nxt = next(self._plan, None)
+            if nxt is None:
+                self._planned_all = True
+                return False
+            mat, slot = nxt
+        self._plan_slot(mat, slot)
+        return True
+
+    def _binding(self, mat, slot_type):
+        col = bpy.data.collections.get(self.collection)
+        mat_obj = col.objects.get(mat['obj_name']) if col else None
+        mat_data = getattr(mat_obj, 're_mdf_material', None) if mat_obj else None
+        if mat_data is None:
+            return None
+        return next((b for b in mat_data.textureBindingList_items
+                     if b.textureType == slot_type), None)
+
+    def _bind(self, mat, slot_type, path, albd=True):
+        binding = self._binding(mat, slot_type)
+        if binding is None:
+            return False
+        binding.path = path
+        self.export_count += 1
+        if albd and slot_type == 'BaseDielectricMap':
+            mat['albd_out'] = path
+            self._release_emi(mat, reuse=True)
+        return True
+
+    def _release_emi(self, mat, reuse):
+        """The EmissiveMap held back while its shared albedo was in flight:
+        point it at the albedo, or, that having failed, process it itself."""
+        slot = mat['emi_deferred']
+        if slot is None:
+            return
+        mat['emi_deferred'] = None
+        if reuse:
+            if self._bind(mat, slot[0], mat['albd_out']):
+                print(f"[{self.cls._log_tag}] EMI reuse ALBD: {mat['albd_out']}")
+        elif not self.cancelled:
+            self._retry.append((mat, slot))
+        else:
+            self.cancel_count += 1
+
+    def _share(self, mat, slot_type, key):
+        """Point this slot at the texture *key* already names, if any: bound
+        now when written, queued behind it while in flight.  True when the slot
+        needs nothing more."""
+        if not self.use_share:
+            return False
+        entry = self._shared.get(key)
+        if entry is None or entry.state == 'FAILED':
+            return False
+        if entry.state == 'DONE':
+            self._bind_shared(mat, slot_type, entry)
+        else:
+            entry.waiters.append((mat, slot_type))
+            if slot_type == 'BaseDielectricMap':
+                mat['albd_pending'] = True
+        return True
+
+    def _share_cached(self, mat, slot_type, key):
+        """Point this slot at the texture an earlier run found identical to it:
+        through the alias stored then, or through the pixel digest of its own
+        cache entry.  True when the slot needs nothing more."""
+        from . import slot_cache
+        if not self.use_share:
+            return False
+        owner = slot_cache.alias(key, root=self.cache_root)
+        if owner is None or owner not in self._shared:
+            digest = slot_cache.digest(key, root=self.cache_root)
+            if digest is None:
+                return False
+            with self._pixels_lock:
+                owner = self._pixels.setdefault(digest, key)
+            if owner == key:
+                return False
+        if not self._share(mat, slot_type, owner):
+            return False
+        self._shared[key] = self._shared[owner]
+        slot_cache.store_alias(key, owner, root=self.cache_root)
+        return True
+
+    def _bind_shared(self, mat, slot_type, entry):
+        if slot_type == 'BaseDielectricMap':
+            mat['albd_pending'] = False
+        if self._bind(mat, slot_type, entry.mdf_path):
+            self.shared_count += 1
+            print(f"[{self.cls._log_tag}] SHARED {slot_type} -> {entry.mdf_path}")
+        else:
+            self.skip_count += 1
+
+    def _settle(self, key, ok):
+        """The texture *key* is written (or failed): bind the slots waiting on
+        it, or send them back to be produced on their own."""
+        entry = self._shared.get(key)
+        if entry is None or entry.state != 'PENDING':
+            return
+        entry.state = 'DONE' if ok else 'FAILED'
+        waiters, entry.waiters = entry.waiters, []
+        if not ok:
+            with self._pixels_lock:
+                for digest in [d for d, k in self._pixels.items() if k == key]:
+                    del self._pixels[digest]
+        for mat, slot_type in waiters:
+            if ok:
+                self._bind_shared(mat, slot_type, entry)
+                continue
+            if slot_type == 'BaseDielectricMap':
+                mat['albd_pending'] = False
+            if self.cancelled:
+                self.cancel_count += 1
+                self._release_emi(mat, reuse=False)
+            else:
+                self._retry.append((mat, self._slot(mat, slot_type)))
+
+    @staticmethod
+    def _slot(mat, slot_type):
+        return next(s for s in mat['slots'] if s[0] == slot_type)
+
+    def _plan_slot(self, mat, slot):
+        cls = self.cls
+        slot_type, mode, direct_image = slot
+        if mode == 'SKIP':
+            self.skip_count += 1
+            return
+        if self._binding(mat, slot_type) is None:
+            self.skip_count += 1
+            return
+
+        mdf_path = make_mdf_path(self.base_path, mat['tex_name'], slot_type,
+                                 cls._abbrev_map, cls._use_art_prefix)
+
+        if mode == 'DEFAULT':
+            null_rel = cls._null_tex_by_type.get(slot_type)
+            if null_rel:
+                self._bind(mat, slot_type, null_rel, albd=False)
+                print(f"[{cls._log_tag}] NULL {slot_type}: {null_rel}")
+            else:
+                print(f"[{cls._log_tag}] SKIP (no null) {slot_type}")
+                self.skip_count += 1
+            return
+
+        if mode == 'COMPOSE' and slot_type == 'EmissiveMap' and mat['share_emi']:
+            if mat['albd_out']:
+                self._bind(mat, slot_type, mat['albd_out'])
+                print(f"[{cls._log_tag}] EMI reuse ALBD: {mat['albd_out']}")
+                return
+            if mat['albd_pending']:
+                mat['emi_deferred'] = slot
+                return
+
+        try:
+            if mode == 'COMPOSE':
+                self._plan_compose(mat, slot_type, mdf_path)
+            else:
+                self._plan_direct(mat, slot_type, direct_image, mdf_path)
+        except Exception as err:
+            print(f"[{cls._log_tag}] FAIL {slot_type}: {err}")
+            self.fail_count += 1
+
+    def _disk_path(self, mat, slot_type):
+        cls = self.cls
+        return make_disk_path(self.natives_root, self.base_path, mat['tex_name'], slot_type,
+                              cls._abbrev_map, cls._tex_version, cls._use_art_prefix)
+
+    def _job_dir(self):
+        """A temp directory of the job's own: texconv names its output after
+        the input, and two slots may share a source basename."""
+        self._job_id += 1
+        return os.path.join(self.temp_dir, f"{self._job_id:04d}")
+
+    def _plan_compose(self, mat, slot_type, mdf_path):
+        from . import slot_cache, tex_encoder
+        cls = self.cls
+
+        if mat['skip_textures']:
+            self._bind(mat, slot_type, mdf_path)
+            return
+        dds_fmt = resolve_dds_format(slot_type, SRGB_SLOT_TYPES)
+        disk_path = self._disk_path(mat, slot_type)
+        source_key = slot_cache.slot_key(
+            slot_type, self.channel_maps.get(slot_type),
+            mat['pbr_paths'], mat['pbr_channels'], mat['pbr_inv'],
+            normal_flip_g=mat['normal_flip_g'], octahedral=self.octahedral,
+            dds_fmt=dds_fmt, mipmaps=mat['mipmaps'],
+            tex_version=cls._tex_version, gdeflate_level=self.gdeflate_level,
+            encoder=tex_encoder.encoder_signature(dds_fmt, self.backend, self.quality))
+        if self._share(mat, slot_type, source_key):
+            return
+        cache_key = source_key if self.use_cache else None
+        if cache_key and self._share_cached(mat, slot_type, cache_key):
+            return
+        if cache_key and slot_cache.place(cache_key, disk_path, root=self.cache_root):
+            self._bind(mat, slot_type, mdf_path)
+            if self.use_share:
+                self._shared[source_key] = _SharedTex(mdf_path, disk_path, 'DONE')
+            print(f"[{cls._log_tag}] CACHED {slot_type} -> {os.path.basename(disk_path)}")
+            return
+
+        sources = compose_sources(slot_type, mat['pbr_paths'], cls._channel_maps)
+        if not sources:
+            null_rel = cls._null_tex_by_type.get(slot_type)
+            if null_rel:
+                self._bind(mat, slot_type, null_rel, albd=False)
+                print(f"[{cls._log_tag}] NULL (empty inputs) {slot_type}: {null_rel}")
+            else:
+                print(f"[{cls._log_tag}] SKIP (empty inputs, no null) {slot_type}")
+                self.skip_count += 1
+            return
+        # PNG/TGA/DDS sources are read on the worker along with everything
+        # else; only a format that needs Blender's loader is read here.
+        loaded = None
+        if sources_need_blender(sources) or (mat['name'], slot_type) in self._load_here:
+            loaded = load_compose_inputs(slot_type, mat['pbr_paths'], cls._channel_maps,
+                                         pbr_channels=mat['pbr_channels'])
+        # The NumPy encoder takes the composed array as is; only texconv needs
+        # it saved as a PNG first.
+        if tex_encoder.pick_backend(dds_fmt, self.backend) == 'NUMPY':
+            match = (self.use_share and (mat['name'], slot_type) not in self._own_pixels)
+            work = functools.partial(self._compose_encode, mat, slot_type, dds_fmt, loaded,
+                                     source_key if match else None)
+            write = functools.partial(self._write_dds, disk_path, cache_key)
+        else:
+            work = functools.partial(self._compose_texconv, mat, slot_type, dds_fmt, loaded,
+                                     self._job_dir())
+            write = functools.partial(self._write_dds_file, disk_path, cache_key)
+        self._submit(mat, slot_type, mdf_path, disk_path, work, write, source_key)
+
+    def _plan_direct(self, mat, slot_type, src_img, mdf_path):
+        from . import slot_cache, tex_encoder
+        cls = self.cls
+
+        if mat['skip_textures']:
+            self._bind(mat, slot_type, mdf_path, albd=False)
+            return
+        if not src_img or not os.path.isfile(src_img):
+            print(f"[{cls._log_tag}] SKIP direct {slot_type}: not found")
+            self.skip_count += 1
+            return
+        disk_path = self._disk_path(mat, slot_type)
+        dds_fmt = resolve_dds_format(slot_type, SRGB_SLOT_TYPES)
+        source_key = slot_cache.direct_key(
+            src_img, dds_fmt=dds_fmt, mipmaps=mat['mipmaps'], tex_version=cls._tex_version,
+            gdeflate_level=self.gdeflate_level,
+            encoder=tex_encoder.encoder_signature(dds_fmt, self.backend, self.quality))
+        if self._share(mat, slot_type, source_key):
+            return
+
+        # Same routing as slot_resolver.write_slot_tex, substring match and all.
+        if '.tex' in os.path.basename(src_img).lower():
+            work = functools.partial(str, src_img)
+            write = functools.partial(self._copy_tex, disk_path)
+        elif src_img.lower().endswith('.dds'):
+            work = functools.partial(str, src_img)
+            write = functools.partial(self._write_dds_file, disk_path, None)
+        elif tex_encoder.pick_backend(dds_fmt, self.backend) == 'NUMPY':
+            from . import image_io
+            if image_io.can_read(src_img) and (mat['name'], slot_type) not in self._load_here:
+                pixels = functools.partial(tex_encoder.load_rgba, src_img, blender=False)
+            else:
+                pixels = tex_encoder.load_rgba(src_img)     # bpy: here, not on a worker
+            work = functools.partial(self._encode, pixels, dds_fmt, mat['mipmaps'])
+            write = functools.partial(self._write_dds, disk_path, None)
+        else:
+            work = functools.partial(self._texconv, src_img, dds_fmt, mat['mipmaps'],
+                                     self._job_dir())
+            write = functools.partial(self._write_dds_file, disk_path, None)
+        self._submit(mat, slot_type, mdf_path, disk_path, work, write, source_key)
+
+    def _submit(self, mat, slot_type, mdf_path, disk_path, work, write, source_key=None):
+        if slot_type == 'BaseDielectricMap':
+            mat['albd_pending'] = True
+        if self.use_share and source_key:
+            self._shared[source_key] = _SharedTex(mdf_path, disk_path)
+        self.pipeline.submit(work, write, functools.partial(
+            self._finished, mat, slot_type, mdf_path, disk_path, source_key))
+
+    def _finished(self, mat, slot_type, mdf_path, disk_path, source_key, result, err):
+        from concurrent.futures import CancelledError
+        from . import image_io
+        tag = self.cls._log_tag
+        if slot_type == 'BaseDielectricMap':
+            mat['albd_pending'] = False
+        if (isinstance(err, image_io.UnsupportedImage) and not self.cancelled
+                and (mat['name'], slot_type) not in self._load_here):
+            # A source only Blender can read after all (an interlaced PNG):
+            # again, loading it on the main thread this time.
+            self._load_here.add((mat['name'], slot_type))
+            self._retry.append((mat, self._slot(mat, slot_type)))
+            self._settle(source_key, ok=False)
+        elif isinstance(err, CancelledError):
+            self.cancel_count += 1
+            self._release_emi(mat, reuse=False)
+            self._settle(source_key, ok=False)
+        elif err is not None:
+            print(f"[{tag}] FAIL {slot_type}: {err}")
+            self.fail_count += 1
+            self._release_emi(mat, reuse=False)
+            self._settle(source_key, ok=False)
+        elif isinstance(result, _SamePixels):
+            self._same_pixels(mat, slot_type, source_key, result.key)
+        elif self._bind(mat, slot_type, mdf_path):
+            print(f"[{tag}] OK {slot_type} -> {os.path.basename(disk_path)}")
+            self._settle(source_key, ok=True)
+        else:
+            # The material's object went away mid-run; the file is written.
+            self.skip_count += 1
+            self._settle(source_key, ok=True)
+
+    def _same_pixels(self, mat, slot_type, own_key, owner_key):
+        """A composed slot came out identical to *owner_key*'s: share that
+        texture, along with every slot that was waiting on this one."""
+        own, owner = self._shared.get(own_key), self._shared.get(owner_key)
+        if owner is None or owner.state == 'FAILED':
+            # Gone by now: produce it after all, without matching again.
+            self._own_pixels.add((mat['name'], slot_type))
+            self._retry.append((mat, self._slot(mat, slot_type)))
+            self._settle(own_key, ok=False)
+            return
+        if self.use_cache:
+            from . import slot_cache
+            slot_cache.store_alias(own_key, owner_key, root=self.cache_root)
+        if owner.state == 'DONE':
+            self._bind_shared(mat, slot_type, owner)
+            own.mdf_path, own.disk_path = owner.mdf_path, owner.disk_path
+            self._settle(own_key, ok=True)
+            return
+        owner.waiters.append((mat, slot_type))
+        if slot_type == 'BaseDielectricMap':
+            mat['albd_pending'] = True
+        owner.waiters.extend(own.waiters)
+        own.waiters = []
+        self._shared[own_key] = owner
+
+    # ── Worker stage (no bpy) ──
+
+    def _compose(self, mat, slot_type, loaded, out_dir=None):
+        """The composed slot: an array, or with *out_dir* a PNG saved there."""
+        channel_maps = self.cls._channel_maps
+        if loaded is None:
+            loaded = load_compose_inputs(slot_type, mat['pbr_paths'], channel_maps,
+                                         blender=False, pbr_channels=mat['pbr_channels'])
+        return _compose_channels(
+            slot_type, mat['pbr_paths'], mat['pbr_channels'], out_dir,
+            mat['tex_name'], mat['pbr_inv'], channel_maps=channel_maps,
+            normal_flip_g=mat['normal_flip_g'], pbr_planes=loaded,
+            octahedral=self.octahedral, as_array=out_dir is None, threads=1)
+
+    def _compose_encode(self, mat, slot_type, dds_fmt, loaded, source_key=None):
+        import numpy as np
+        from . import tex_encoder
+        pixels = self._compose(mat, slot_type, loaded)
+        normal = normal_mip_spec(slot_type, self.cls._channel_maps, self.octahedral)
+        if source_key is not None:
+            owner = self._claim_pixels(pixels, source_key, dds_fmt, mat['mipmaps'], normal)
+            if owner is not None:
+                return _SamePixels(owner)
+        return tex_encoder.encode_array(
+            np.flipud(pixels), dds_fmt, generate_mips=mat['mipmaps'], normal=normal,
+            quality=self.quality)
+
+    def _claim_pixels(self, pixels, source_key, dds_fmt, mipmaps, normal):
+        """Register this slot's composed pixels; the source key of the slot
+        that registered identical ones first, or None when that is this one."""
+        import hashlib
+        import numpy as np
+        digest = hashlib.blake2b(repr((pixels.dtype.str, pixels.shape, dds_fmt, mipmaps,
+                                       normal)).encode('utf-8'))
+        digest.update(np.ascontiguousarray(pixels).data)
+        digest = digest.hexdigest()
+        with self._pixels_lock:
+            owner = self._pixels.setdefault(digest, source_key)
+            self._digests[source_key] = digest
+        return None if owner == source_key else owner
+
+    def _encode(self, pixels, dds_fmt, mipmaps):
+        from . import tex_encoder
+        if callable(pixels):
+            pixels = pixels()
+        return tex_encoder.encode_array(pixels, dds_fmt, generate_mips=mipmaps,
+                                        quality=self.quality)
+
+    def _compose_texconv(self, mat, slot_type, dds_fmt, loaded, out_dir):
+        os.makedirs(out_dir, exist_ok=True)
+        png = self._compose(mat, slot_type, loaded, out_dir)
+        return self._texconv(png, dds_fmt, mat['mipmaps'], out_dir)
+
+    def _texconv(self, src_img, dds_fmt, mipmaps, out_dir):
+        from . import tex_encoder
+        dds_path = tex_encoder.convert_to_dds(src_img, dds_fmt, out_dir,
+                                              generate_mips=mipmaps, backend='TEXCONV')
+        if not os.path.isfile(dds_path):
+            raise FileNotFoundError(f"texconv output not found: {dds_path}")
+        return dds_path
+
+    # ── Writer stage (no bpy) ──
+
+    def _write_dds(self, disk_path, cache_key, dds):
+        from . import tex_file
+        if isinstance(dds, _SamePixels):
+            return dds
+        os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+        with open(disk_path, 'wb') as f:
+            tex_file.write_tex(f, dds, self.cls._tex_version, self.gdeflate_level,
+                               self.gdeflate_workers)
+        self._store(cache_key, disk_path)
+        return disk_path
+
+    def _write_dds_file(self, disk_path, cache_key, dds_path):
+        from . import tex_file
+        os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+        tex_file.write_tex_from_dds(dds_path, self.cls._tex_version, disk_path,
+                                    self.gdeflate_level, self.gdeflate_workers)
+        self._store(cache_key, disk_path)
+        return disk_path
+
+    def _copy_tex(self, disk_path, src_img):
+        os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+        shutil.copy2(src_img, disk_path)
+        return disk_path
+
+    def _store(self, cache_key, disk_path):
+        if cache_key:
+            from . import slot_cache
+            slot_cache.store(cache_key, disk_path, root=self.cache_root,
+                             digest=self._digests.get(cache_key))
+
+
 class MdfTexProcessBase(bpy.types.Operator):
     """Process MDF2 texture bindings: compose/convert images and update paths"""
     bl_label   = "Process"
@@ -1007,8 +1747,11 @@ class MdfTexProcessBase(bpy.types.Operator):
     _path_fixed_prefix = ""   # Optional path segment prepended to texture_base_path
     _log_tag          = "MDF Tex"
 
-    def execute(self, context):
-        _t_total = time.time()
+    _run   = None
+    _timer = None
+
+    def _start(self, context):
+        """Validate the panel and set up a _ProcessRun; None after reporting why not."""
         scene    = context.scene
         cls      = type(self)
         settings = getattr(scene, cls._settings_attr)
@@ -1016,161 +1759,87 @@ class MdfTexProcessBase(bpy.types.Operator):
         natives_root = scene.get(cls._natives_root_key, "")
         if not natives_root or not os.path.isdir(natives_root):
             self.report({'ERROR'}, T("core.mdf_tex_processor_base.set_natives_root"))
-            return {'CANCELLED'}
+            return None
         if not settings.mdf_collection:
             self.report({'ERROR'}, T("core.mdf_tex_processor_base.select_mdf_collection"))
-            return {'CANCELLED'}
+            return None
         base_path = settings.texture_base_path.strip()
         if not base_path:
             self.report({'ERROR'}, T("core.mdf_tex_processor_base.fill_base_path"))
-            return {'CANCELLED'}
+            return None
         if cls._path_fixed_prefix:
             base_path = cls._path_fixed_prefix.strip('/') + '/' + base_path.strip('/')
         if not settings.materials:
             self.report({'ERROR'}, T("core.mdf_tex_processor_base.click_refresh_first"))
-            return {'CANCELLED'}
+            return None
 
         print(f"[{cls._log_tag}] {'='*40}", flush=True)
+        return _ProcessRun(cls, settings, natives_root, base_path)
+
+    def _report_run(self, run):
+        counts = dict(export=run.export_count, fail=run.fail_count, skip=run.skip_count)
+        if run.cancelled:
+            self.report({'WARNING'}, T("core.mdf_tex_processor_base.process_cancelled").format(**counts))
+        elif run.fail_count > 0:
+            self.report({'WARNING'}, T("core.mdf_tex_processor_base.process_done_with_fail").format(**counts))
+        else:
+            self.report({'INFO'}, T("core.mdf_tex_processor_base.process_done").format(**counts))
+        return {'FINISHED'}
 
-        ImageListToDDS, DDSToTex = _import_tex_utils()
-
-        temp_dir = tempfile.mkdtemp(prefix="mdf_tex_")
-        export_count = fail_count = skip_count = 0
-
+    def execute(self, context):
+        run = self._start(context)
+        if run is None:
+            return {'CANCELLED'}
         try:
-            for mat_item in settings.materials:
-                _t_mat = time.time()
-                mat_obj = settings.mdf_collection.objects.get(mat_item.material_obj_name)
-                if mat_obj is None:
-                    continue
-                mat_data = getattr(mat_obj, 're_mdf_material', None)
-                if mat_data is None:
-                    continue
-
-                tex_name     = mat_item.material_name.removesuffix('_UseSC')
-                # The global toggle overrides this material's own checkbox,
-                # same as core.mdf_generator_base's effective_mipmaps.
-                effective_mipmaps = (mat_item.generate_mipmaps
-                                    and not getattr(settings, 'global_disable_mipmaps', False))
-                pbr_paths      = {pt: getattr(mat_item.pbr, pt) for pt in PBR_TYPES}
-                pbr_channels   = {pt: getattr(mat_item.pbr, f"{pt}_ch")
-                                  for pt in PBR_CHANNEL_SELECTABLE}
-                pbr_inv        = {pt: getattr(mat_item.pbr, f"{pt}_inv")
-                                  for pt in PBR_CHANNEL_SELECTABLE}
-                normal_flip_g  = mat_item.pbr.normal_flip_g
-
-                color_path    = pbr_paths.get('color', '')
-                emissive_path = pbr_paths.get('emissive', '')
-                share_emi     = bool(color_path and emissive_path and color_path == emissive_path)
-                albd_path_out = None
-
-                for slot in mat_item.slots:
-                    if slot.mode == 'SKIP':
-                        skip_count += 1
-                        continue
-                    binding = next(
-                        (b for b in mat_data.textureBindingList_items
-                         if b.textureType == slot.texture_type), None)
-                    if binding is None:
-                        skip_count += 1
-                        continue
-
-                    mdf_path = make_mdf_path(base_path, tex_name, slot.texture_type,
-                                             cls._abbrev_map, cls._use_art_prefix)
-
-                    if slot.mode == 'DEFAULT':
-                        null_rel = cls._null_tex_by_type.get(slot.texture_type)
-                        if null_rel:
-                            binding.path = null_rel
-                            print(f"[{cls._log_tag}] NULL {slot.texture_type}: {null_rel}")
-                            export_count += 1
-                        else:
-                            print(f"[{cls._log_tag}] SKIP (no null) {slot.texture_type}")
-                            skip_count += 1
-                        continue
-
-                    if (slot.mode == 'COMPOSE'
-                            and slot.texture_type == 'EmissiveMap'
-                            and share_emi and albd_path_out):
-                        binding.path = albd_path_out
-                        print(f"[{cls._log_tag}] EMI reuse ALBD: {albd_path_out}")
-                        export_count += 1
-                        continue
-
-                    try:
-                        if slot.mode == 'COMPOSE':
-                            if mat_item.skip_textures:
-                                binding.path = mdf_path
-                                if slot.texture_type == 'BaseDielectricMap':
-                                    albd_path_out = mdf_path
-                                export_count += 1
-                                continue
-                            _t_comp = time.time()
-                            src_img = _compose_channels(
-                                slot.texture_type, pbr_paths, pbr_channels,
-                                temp_dir, tex_name, pbr_inv,
-                                channel_maps=cls._channel_maps,
-                                normal_flip_g=normal_flip_g,
-                                octahedral=getattr(settings, 'octahedral_normals', False))
-                            # print(f"[{cls._log_tag}]   合成通道 {slot.texture_type}: {time.time() - _t_comp:.2f}s", flush=True)
-                            if src_img is None:
-                                null_rel = cls._null_tex_by_type.get(slot.texture_type)
-                                if null_rel:
-                                    binding.path = null_rel
-                                    print(f"[{cls._log_tag}] NULL (empty inputs) {slot.texture_type}: {null_rel}")
-                                    export_count += 1
-                                else:
-                                    print(f"[{cls._log_tag}] SKIP (empty inputs, no null) {slot.texture_type}")
-                                    skip_count += 1
-                                continue
-                        else:  # DIRECT
-                            if mat_item.skip_textures:
-                                binding.path = mdf_path
-                                export_count += 1
-                                continue
-                            src_img = bpy.path.abspath(slot.direct_image)
-                            if not src_img or not os.path.isfile(src_img):
-                                print(f"[{cls._log_tag}] SKIP direct {slot.texture_type}: not found")
-                                skip_count += 1
-                                continue
-
-                        disk_path = make_disk_path(
-                            natives_root, base_path, tex_name, slot.texture_type,
-                            cls._abbrev_map, cls._tex_version, cls._use_art_prefix)
-
-                        write_slot_tex(
-                            src_img, disk_path, temp_dir,
-                            dds_fmt=resolve_dds_format(
-                                slot.texture_type, SRGB_SLOT_TYPES),
-                            generate_mipmaps=effective_mipmaps,
-                            image_to_dds=ImageListToDDS,
-                            dds_to_tex=lambda p, o: DDSToTex(p, cls._tex_version, o),
-                        )
-
-                        binding.path = mdf_path
-                        if slot.texture_type == 'BaseDielectricMap':
-                            albd_path_out = mdf_path
-                        print(f"[{cls._log_tag}] OK {slot.texture_type} -> {os.path.basename(disk_path)}")
-                        export_count += 1
-
-                    except Exception as err:
-                        print(f"[{cls._log_tag}] FAIL {slot.texture_type}: {err}")
-                        fail_count += 1
-
-            print(f"[{cls._log_tag}] 材质耗时: {mat_item.material_name} {time.time() - _t_mat:.2f}s", flush=True)
-
+            while run.step(0.25):
+                run.pipeline.poll(timeout=0.05)
         finally:
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            run.finish()
+        return self._report_run(run)
 
-        print(f"[{cls._log_tag}] ★ 总耗时: {time.time() - _t_total:.2f}s ★", flush=True)
+    def invoke(self, context, event):
+        run = self._start(context)
+        if run is None:
+            return {'CANCELLED'}
+        self._run = run
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, max(run.total, 1))
+        return {'RUNNING_MODAL'}
 
-        if fail_count > 0:
-            self.report({'WARNING'}, T("core.mdf_tex_processor_base.process_done_with_fail").format(
-                export=export_count, fail=fail_count, skip=skip_count))
-        else:
-            self.report({'INFO'}, T("core.mdf_tex_processor_base.process_done").format(
-                export=export_count, skip=skip_count))
-        return {'FINISHED'}
+    def modal(self, context, event):
+        run = self._run
+        if event.type == 'ESC' and event.value == 'PRESS':
+            if not run.cancelled:
+                run.cancel()
+            return {'RUNNING_MODAL'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        if run.step(0.05):
+            context.window_manager.progress_update(run.handled)
+            context.workspace.status_text_set(
+                T("core.mdf_tex_processor_base.processing").format(done=run.handled, total=run.total))
+            return {'RUNNING_MODAL'}
+        self._end_modal(context)
+        return self._report_run(run)
+
+    def cancel(self, context):
+        # Blender tearing the operator down (window closed, file loaded).
+        if self._run is not None:
+            self._run.cancel()
+            self._end_modal(context)
+
+    def _end_modal(self, context):
+        wm = context.window_manager
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        if context.workspace is not None:
+            context.workspace.status_text_set(None)
+        self._run.finish()
+        self._run = None
 
 
 # ── Registration (shared PropertyGroups only) ──────────────────────────────────
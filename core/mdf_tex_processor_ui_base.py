@@ -63,7 +63,8 @@ class MdfTexDialogBase(bpy.types.Operator):
             self, width=PROCESSOR_WINDOW_WIDTH)
 
     def execute(self, context):
-        getattr(getattr(bpy.ops, type(self)._game_prefix), 'mdf_tex_process')()
+        # INVOKE: the modal front end, with progress and Esc to cancel.
+        getattr(getattr(bpy.ops, type(self)._game_prefix), 'mdf_tex_process')('INVOKE_DEFAULT')
         return {'FINISHED'}
 
     # ── Drawing ────────────────────────────────────────────────────────────────
@@ -100,6 +101,10 @@ class MdfTexDialogBase(bpy.types.Operator):
         if hasattr(settings, "octahedral_normals"):
             layout.prop(settings, "octahedral_normals",
                         text=T("core.octahedral_normals.label"))
+        # Only the GDeflate games (MHWS, RE9) declare it.
+        if hasattr(settings, "gdeflate_level"):
+            layout.prop(settings, "gdeflate_level",
+                        text=T("core.gdeflate_level.label"))
         if not settings.texture_base_path.strip():
             hint = layout.row()
             hint.label(text=f"    {cls._path_hint}", icon='INFO')
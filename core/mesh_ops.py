@@ -103,6 +103,11 @@ class MHW_OT_ShapeKeyToWeights(bpy.types.Operator):
         items=_sk_filter_sign_items,
         default=0,
     )
+    all_keys: bpy.props.BoolProperty(
+        name="All Shape Keys",
+        default=False,
+        description="Convert every non-Basis shape key in one run, each into a group named after it",
+    )
 
     @classmethod
     def poll(cls, context):
@@ -121,7 +126,10 @@ class MHW_OT_ShapeKeyToWeights(bpy.types.Operator):
     def draw(self, context):
         layout = self.layout
         col = layout.column()
-        col.prop(self, "shape_key_enum", text=T("ui.main_panel.sk_field_shape_key"))
+        col.prop(self, "all_keys", text=T("ui.main_panel.sk_field_all_keys"))
+        row = col.row()
+        row.enabled = not self.all_keys
+        row.prop(self, "shape_key_enum", text=T("ui.main_panel.sk_field_shape_key"))
         col.separator()
         col.prop(self, "ignore_threshold", text=T("ui.main_panel.sk_field_ignore_threshold"))
         col.prop(self, "weight_strength", text=T("ui.main_panel.sk_field_weight_strength"), slider=True)
@@ -139,15 +147,13 @@ class MHW_OT_ShapeKeyToWeights(bpy.types.Operator):
     def execute(self, context):
         obj = context.active_object
         key_blocks = obj.data.shape_keys.key_blocks
+        basis_kb = obj.data.shape_keys.reference_key
         idx = int(self.shape_key_enum)
 
-        if idx <= 0 or idx >= len(key_blocks):
+        if not self.all_keys and (idx <= 0 or idx >= len(key_blocks)):
             self.report({'ERROR'}, T("ui.main_panel.sk_err_select_non_basis"))
             return {'CANCELLED'}
 
-        active_kb = key_blocks[idx]
-        basis_kb = obj.data.shape_keys.reference_key
-
         if context.mode != 'OBJECT':
             bpy.ops.object.mode_set(mode='OBJECT')
 
@@ -156,6 +162,27 @@ class MHW_OT_ShapeKeyToWeights(bpy.types.Operator):
             sign = 1.0 if self.filter_sign == '+' else -1.0
             direction = {'X': (sign, 0, 0), 'Y': (0, sign, 0), 'Z': (0, 0, sign)}[self.filter_axis]
 
+        if self.all_keys:
+            # One run for the lot: basis read once, topology and seams shared.
+            jobs = [weight_utils.ShapeKeyWeightJob(
+                        kb, direction,
+                        ignore_threshold=self.ignore_threshold,
+                        weight_strength=self.weight_strength,
+                        smooth_factor=self.smooth_factor,
+                        smooth_iters=self.smooth_iters)
+                    for kb in key_blocks if kb != basis_kb]
+            results = weight_utils.shape_keys_to_weights(obj, basis_kb, jobs,
+                                                         sync_seams=self.sync_seams)
+            made = sum(1 for r in results if r is not None)
+            if not made:
+                self.report({'WARNING'}, T("ui.main_panel.sk_warn_no_deformation").format(
+                    name=", ".join(j.vg_name for j in jobs[:3])))
+                return {'CANCELLED'}
+            self.report({'INFO'}, T("ui.main_panel.sk_info_generated_batch").format(
+                n=made, skipped=len(results) - made))
+            return {'FINISHED'}
+
+        active_kb = key_blocks[idx]
         result = weight_utils.shape_key_to_weights(
             obj, active_kb, basis_kb,
             ignore_threshold=self.ignore_threshold,
@@ -279,28 +306,25 @@ class MHW_OT_MMDFaceWeights(bpy.types.Operator):
         basis_kb = obj.data.shape_keys.reference_key
         vg_col = _MMD_FACE_GAME_COL[self.target_game]
 
-        done, skipped = [], []
+        jobs, job_parts = [], []
         for sk_name, direction, part_id, *vg_names in _MMD_FACE_ENTRIES:
             kb = key_blocks.get(sk_name)
             if kb is None:
-                skipped.append(part_id)
                 continue
             target_vg = vg_names[vg_col - 3]
             if self.target_game == 'RE4':
                 target_vg = _mmd_re4_vg_name(target_vg, self.re4_character)
             params = _MMD_FACE_FIXED_PARAMS[part_id in _MMD_FACE_UPPER_EYELID_LABELS]
-
-            result = weight_utils.shape_key_to_weights(
-                obj, kb, basis_kb,
-                sync_seams=self.sync_seams,
-                direction=direction,
-                vg_name=target_vg,
-                **params,
-            )
-            if result is None:
-                skipped.append(part_id)
-            else:
-                done.append(part_id)
+            jobs.append(weight_utils.ShapeKeyWeightJob(kb, direction, target_vg, **params))
+            job_parts.append(part_id)
+
+        # All parts in one run: the basis, the seam clusters and the adjacency are
+        # shared instead of rebuilt per part.
+        results = weight_utils.shape_keys_to_weights(obj, basis_kb, jobs,
+                                                     sync_seams=self.sync_seams)
+        converted = {p for p, r in zip(job_parts, results) if r is not None}
+        done = [e[2] for e in _MMD_FACE_ENTRIES if e[2] in converted]
+        skipped = [e[2] for e in _MMD_FACE_ENTRIES if e[2] not in converted]
 
         if not done:
             self.report({'WARNING'}, T("ui.main_panel.mmd_warn_no_valid_shapekeys"))
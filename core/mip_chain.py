@@ -0,0 +1,243 @@
+"""Mip pyramids in NumPy, from the float32 arrays the compose path already holds.
+
+Mips used to come only from texconv's own ``-m``/``-if CUBIC -sepalpha`` pass,
+which means a composed slot had to be written out as a PNG first just so texconv
+could read it back and filter it.  This builds the same pyramid in memory, so a
+composed array can go straight to the block encoder (``core/tex_encoder.py``'s
+``encode_array``).
+
+Each level is filtered from the one above it, 2:1 per axis, with a separable
+kernel:
+
+* ``BOX``    -- plain 2x2 average.  Cheapest, softest.
+* ``LINEAR`` -- tent, 4 taps per axis.
+* ``CUBIC``  -- Catmull-Rom, the default, matching texconv's ``-if CUBIC``
+  (which convert_to_dds asks for) in keeping detail at the lower levels.
+* ``KAISER`` -- Kaiser-windowed sinc, 3 lobes.  Sharpest; what most engines'
+  offline mip tools default to.
+
+``resize`` scales to any size with the same machinery, and two more kernels:
+
+* ``LANCZOS``  -- Lanczos-3, the default there (``RESIZE_FILTER``): sharp,
+  and free of the aliasing a nearest-neighbour gather leaves in a reduction.
+* ``MITCHELL`` -- Mitchell-Netravali (B = C = 1/3): softer, barely rings.
+
+Per-axis weights depend only on the two sizes and the kernel, so they are
+built once per ``(source, destination, filter)`` and cached.
+
+Edges clamp.  Kernels with negative lobes can overshoot, so every level is
+clipped back to 0..1.
+
+Alpha is filtered as its own channel by default (texconv's ``-sepalpha``): the
+packed slots store data, not coverage, in A.  ``separate_alpha=False`` weights
+colour by alpha instead, for genuinely transparent colour maps.
+
+Normal maps can't be averaged per channel: the average of two unit vectors is
+shorter than either, which reads as a flatter surface at every lower mip.
+Passing *normal* decodes the vector, filters it in 3D, renormalises and
+re-encodes it per level -- for a plain X/Y pair or the hemi-octahedral G/A pair
+of ``NORMAL_OCTAHEDRAL_SLOT_TYPES`` (see core/re_normal_pack.py).
+
+Free of ``bpy``.  Orientation is whatever the caller passes; nothing here flips.
+"""
+
+import functools
+
+import numpy as np
+
+from .re_normal_pack import decode_normal_ga, encode_normal_ga
+
+FILTERS = ('BOX', 'LINEAR', 'CUBIC', 'KAISER', 'LANCZOS', 'MITCHELL')
+
+#: resize's default: scaling compose inputs and oversized sources.
+RESIZE_FILTER = 'LANCZOS'
+
+#: texconv ``-if`` names this module has an equivalent for.
+TEXCONV_FILTER_NAMES = {
+    'BOX': 'BOX', 'FANT': 'BOX', 'POINT': 'BOX',
+    'LINEAR': 'LINEAR', 'TRIANGLE': 'LINEAR',
+    'CUBIC': 'CUBIC',
+}
+
+
+# ── Kernels ──────────────────────────────────────────────────────────────────
+
+def _box(x):
+    return (np.abs(x) < 0.5).astype(np.float64) + (np.abs(x) == 0.5) * 0.5
+
+
+def _linear(x):
+    return np.maximum(0.0, 1.0 - np.abs(x))
+
+
+def _catmull_rom(x):
+    x = np.abs(x)
+    return np.where(x < 1.0, 1.5 * x ** 3 - 2.5 * x ** 2 + 1.0,
+                    np.where(x < 2.0, -0.5 * x ** 3 + 2.5 * x ** 2 - 4.0 * x + 2.0, 0.0))
+
+
+_KAISER_ALPHA = 4.0
+
+
+def _kaiser(x):
+    x = np.asarray(x, dtype=np.float64)
+    inside = np.abs(x) < 3.0
+    window = np.i0(_KAISER_ALPHA * np.sqrt(np.clip(1.0 - (x / 3.0) ** 2, 0.0, 1.0)))
+    return np.where(inside, np.sinc(x) * window / np.i0(_KAISER_ALPHA), 0.0)
+
+
+def _lanczos3(x):
+    x = np.asarray(x, dtype=np.float64)
+    return np.where(np.abs(x) < 3.0, np.sinc(x) * np.sinc(x / 3.0), 0.0)
+
+
+def _mitchell(x, b=1.0 / 3.0, c=1.0 / 3.0):
+    x = np.abs(x)
+    near = ((12 - 9 * b - 6 * c) * x ** 3 + (-18 + 12 * b + 6 * c) * x ** 2 + (6 - 2 * b)) / 6
+    far = ((-b - 6 * c) * x ** 3 + (6 * b + 30 * c) * x ** 2 + (-12 * b - 48 * c) * x
+           + (8 * b + 24 * c)) / 6
+    return np.where(x < 1.0, near, np.where(x < 2.0, far, 0.0))
+
+
+#: name -> (kernel, support radius in destination texels)
+_KERNELS = {
+    'BOX': (_box, 0.5),
+    'LINEAR': (_linear, 1.0),
+    'CUBIC': (_catmull_rom, 2.0),
+    'KAISER': (_kaiser, 3.0),
+    'LANCZOS': (_lanczos3, 3.0),
+    'MITCHELL': (_mitchell, 2.0),
+}
+
+#: Kernels with negative lobes, whose output can leave 0..1.
+_RINGING = {'CUBIC', 'KAISER', 'LANCZOS', 'MITCHELL'}
+
+
+@functools.lru_cache(maxsize=128)
+def _axis_weights(n, m, filter_name):
+    """(taps index (m, T), weights (m, T) float32) taking *n* samples to *m*.
+    The kernel widens with a reduction and keeps its own width for an
+    enlargement, where it interpolates.  Cached, and so read-only."""
+    kernel, support = _KERNELS[filter_name]
+    scale = n / m
+    stretch = max(scale, 1.0)
+    centers = (np.arange(m) + 0.5) * scale - 0.5
+    radius = support * stretch
+    taps = int(np.floor(2 * radius)) + 1
+    first = np.ceil(centers - radius).astype(np.int64)
+    j = first[:, None] + np.arange(taps)
+    w = kernel((j - centers[:, None]) / stretch)
+    w /= w.sum(axis=1, keepdims=True)
+    idx, w = np.clip(j, 0, n - 1), w.astype(np.float32)
+    idx.flags.writeable = w.flags.writeable = False
+    return idx, w
+
+
+def _resample_axis(arr, axis, idx, w):
+    out = None
+    for t in range(idx.shape[1]):
+        taken = np.take(arr, idx[:, t], axis=axis)
+        shape = [1] * arr.ndim
+        shape[axis] = -1
+        term = taken * w[:, t].reshape(shape)
+        if out is None:
+            out = term
+        else:
+            out += term
+    return out
+
+
+def downsample(arr, filter_name='CUBIC'):
+    """One mip step: (h, w, C) float32 -> (max(1, h // 2), max(1, w // 2), C)."""
+    h, w = arr.shape[:2]
+    out = arr
+    if h > 1:
+        out = _resample_axis(out, 0, *_axis_weights(h, h // 2, filter_name))
+    if w > 1:
+        out = _resample_axis(out, 1, *_axis_weights(w, w // 2, filter_name))
+    return out
+
+
+def resize(arr, width, height, filter_name=RESIZE_FILTER):
+    """``(h, w, C)`` float32 -> ``(height, width, C)``, either axis growing or
+    shrinking, edges clamped -- for scaling compose inputs to a common size."""
+    if filter_name not in _KERNELS:
+        raise ValueError(f"Unknown filter: {filter_name}")
+    h, w = arr.shape[:2]
+    out = np.asarray(arr, dtype=np.float32)
+    if height != h:
+        out = _resample_axis(out, 0, *_axis_weights(h, height, filter_name))
+    if width != w:
+        out = _resample_axis(out, 1, *_axis_weights(w, width, filter_name))
+    if filter_name in _RINGING:
+        np.clip(out, 0.0, 1.0, out=out)
+    return out
+
+
+# ── Normal handling ──────────────────────────────────────────────────────────
+
+def _decode_normal(arr, normal):
+    """*arr*'s normal channels -> (h, w, 3) unit vectors."""
+    kind, c0, c1 = normal
+    if kind == 'octahedral':
+        x, y = decode_normal_ga(arr[..., c0], arr[..., c1])
+    else:
+        x, y = arr[..., c0] * 2.0 - 1.0, arr[..., c1] * 2.0 - 1.0
+    z = np.sqrt(np.clip(1.0 - x * x - y * y, 0.0, None))
+    return np.stack([x, y, z], axis=-1).astype(np.float32)
+
+
+def _encode_normal(arr, normal, vec):
+    """Write unit vectors *vec* back into *arr*'s normal channels."""
+    kind, c0, c1 = normal
+    x01 = (vec[..., 0] + 1.0) * 0.5
+    y01 = (vec[..., 1] + 1.0) * 0.5
+    if kind == 'octahedral':
+        # encode_normal_ga takes the plain pair as (green=Y, alpha=X).
+        arr[..., c0], arr[..., c1] = encode_normal_ga(y01, x01)
+    else:
+        arr[..., c0], arr[..., c1] = x01, y01
+
+
+# ── Pyramid ──────────────────────────────────────────────────────────────────
+
+def mip_count(width, height):
+    """Levels in a full chain down to 1x1."""
+    return int(max(width, height)).bit_length()
+
+
+def build_mip_chain(arr, filter_name='CUBIC', separate_alpha=True, normal=None, levels=None):
+    """``(h, w, 4)`` float32 in 0..1 -> list of levels, *arr* itself first.
+
+    *normal*: None, ``('xy', x_ch, y_ch)`` for a plain two-channel normal or
+    ``('octahedral', g_ch, a_ch)`` for the hemi-octahedral pair -- those two
+    channels are then filtered as vectors and renormalised, the others as
+    usual.  *levels* caps the chain length (default: down to 1x1).
+    """
+    if filter_name not in _KERNELS:
+        raise ValueError(f"Unknown mip filter: {filter_name}")
+    arr = np.asarray(arr, dtype=np.float32)
+    h, w = arr.shape[:2]
+    total = mip_count(w, h) if levels is None else max(1, min(int(levels), mip_count(w, h)))
+
+    chain = [arr]
+    cur = arr
+    vec = _decode_normal(arr, normal) if normal else None
+    weighted = not separate_alpha and arr.shape[2] == 4
+    for _ in range(total - 1):
+        if weighted:
+            a = cur[..., 3:4]
+            src = np.concatenate([cur[..., :3] * a, a], axis=-1)
+            nxt = downsample(src, filter_name)
+            cover = nxt[..., 3:4]
+            nxt[..., :3] = np.where(cover > 1e-6, nxt[..., :3] / np.maximum(cover, 1e-6), 0.0)
+        else:
+            nxt = downsample(cur, filter_name)
+        np.clip(nxt, 0.0, 1.0, out=nxt)
+        if vec is not None:
+            vec = downsample(vec, filter_name)
+            vec /= np.maximum(np.linalg.norm(vec, axis=-1, keepdims=True), 1e-8)
+            _encode_normal(nxt, normal, vec)
+        chain.append(nxt)
+        cur = nxt
+    return chain
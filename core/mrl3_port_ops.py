@@ -172,18 +172,13 @@ def decode_mhwi_tex(tex_path, temp_dir):
 
 
 def _png_to_array(png_path):
-    from .mdf_tex_processor_base import image_to_array
+    """texconv's PNG as ``(h, w, 4)`` float32, bottom row first like
+    mdf_tex_processor_base.image_to_array."""
+    import numpy as np
 
-    name = "__mrl3_port_src"
-    if name in bpy.data.images:
-        bpy.data.images.remove(bpy.data.images[name])
-    img = bpy.data.images.load(png_path, check_existing=False)
-    img.name = name
-    img.colorspace_settings.name = 'Non-Color'
-    try:
-        return image_to_array(img)
-    finally:
-        bpy.data.images.remove(img)
+    from . import image_io
+
+    return np.ascontiguousarray(np.flipud(image_io.read_rgba(png_path)))
 
 
 def load_source_slots(mat_data, natives_root, temp_dir):
@@ -298,8 +293,9 @@ def migrate_params(src_data, dst_data, mode):
 # ── texture rebuild ─────────────────────────────────────────────────────────────
 
 def port_textures(mat_data, dst_data, tex_name, arrays, pngs, dst_cfg,
-                  dst_root, dst_base, temp_dir):
-    """Fill the new material's bindings, writing each texture out.  ``(written, notes)``."""
+                  dst_root, dst_base, temp_dir, tex_writes=None):
+    """Fill the new material's bindings, writing each texture out (or queueing
+    it on *tex_writes*, a tex_batch.TexBatch).  ``(written, notes)``."""
     from .mdf_tex_processor_base import BASE_SLOT_CHANNEL_MAPS, _compose_channels
 
     planes, notes = mrl3_port_tex.decompose(arrays)
@@ -333,7 +329,7 @@ def port_textures(mat_data, dst_data, tex_name, arrays, pngs, dst_cfg,
         if source is None:
             continue
         mdf_path, on_disk = mdf_port_tex.write_ported_tex(
-            source, slot, dst_cfg, tex_name, dst_root, dst_base, temp_dir)
+            source, slot, dst_cfg, tex_name, dst_root, dst_base, temp_dir, tex_writes)
         binding.path = mdf_path
         written += int(on_disk)
     return written, notes
@@ -548,6 +544,18 @@ class MHWI_OT_PortMrl3ToMdf2(bpy.types.Operator):
         built = failed = tex_written = 0
         params_ok = params_skip = 0
         missing, notes, unportable = [], [], set()
+        tex_writes = None
+        if convert:
+            import functools
+            from . import tex_encoder, tex_file
+            from .mdf_tex_processor_base import _import_tex_utils, texture_workers
+            from .tex_batch import TexBatch, report_failures
+            backend, quality = tex_encoder.preferences()
+            # The writer thread must not read preferences: bind the GDeflate threads now.
+            dds_to_tex = functools.partial(_import_tex_utils()[1],
+                                           gdeflateWorkers=tex_file.gdeflate_workers())
+            tex_writes = TexBatch(temp_dir, dds_to_tex, workers=texture_workers(),
+                                  backend=backend, quality=quality, log_tag="MRL3 Port")
 
         try:
             for obj in materials:
@@ -570,10 +578,15 @@ class MHWI_OT_PortMrl3ToMdf2(bpy.types.Operator):
                     unportable.update(mrl3_port_tex.unportable(arrays))
                     written, size_notes = port_textures(
                         src_data, dst_data, name.removesuffix('_UseSC'),
-                        arrays, pngs, dst_cfg, dst_root, dst_base, temp_dir)
+                        arrays, pngs, dst_cfg, dst_root, dst_base, temp_dir, tex_writes)
                     tex_written += written
                     notes.extend(f"{name}/{n}" for n in size_notes)
                 built += 1
+
+            if tex_writes is not None:
+                manifest = tex_writes.run()
+                report_failures(manifest, "MRL3 Port")
+                tex_written -= sum(1 for r in manifest if not r.ok)
         finally:
             import shutil
             shutil.rmtree(temp_dir, ignore_errors=True)
@@ -28,13 +28,17 @@ The maths is plain linear blend skinning, the same thing the Armature modifier d
 with a change of basis either side because vertices live in mesh space and ``S_b``
 in armature space.  A vertex whose weights sum to zero is left exactly where it is --
 the Armature modifier leaves it alone too, and "helpfully" collapsing it to the origin
-is a corruption that only shows up as a stray spike much later.
+is a corruption that only shows up as a stray spike much later.  The kernel itself
+is ``core/skinning.py``: sparse weights, one ``(3, 4)`` per bone, float32, chunked.
 """
 
 import bpy
 import numpy as np
 from mathutils import Matrix
 
+from . import skinning
+from .weight_matrix import WeightMatrix
+
 
 def bound_meshes(arm_obj):
     """Every mesh **deformed** by *arm_obj*.
@@ -98,59 +102,58 @@ def rebind(mesh_obj, arm_obj):
     return True
 
 
-def _skin_matrices(arm_obj, obj):
-    """``(V, 4, 4)`` per-vertex transforms in *obj*'s local space, or None.
+def _skin_weights(arm_obj, obj):
+    """*obj*'s skinning as ``(indptr, bones, weights, mats)`` for
+    ``skinning.skin``, or None.
 
     None means "no vertex in this mesh is weighted to any bone of this armature",
     which is worth distinguishing from "all identity": the caller can skip the mesh
     entirely instead of rewriting every coordinate with itself.
     """
     bones = arm_obj.pose.bones
-    # Vertex group index -> that group's skinning matrix.  Groups naming no bone are
-    # left out, so they contribute no weight -- matching the Armature modifier.
-    by_group = {}
+    to_arm = np.array(arm_obj.matrix_world.inverted() @ obj.matrix_world,
+                      dtype=np.float64)
+    from_arm = np.linalg.inv(to_arm)
+    # Vertex group index -> row of the bone stack.  Groups naming no bone are left
+    # out, so they contribute no weight -- matching the Armature modifier.  The basis
+    # change is folded into each bone so each vertex needs one transform rather than
+    # three.
+    column_bone = {}
+    mats = []
     for vg in obj.vertex_groups:
         pb = bones.get(vg.name)
         if pb is None:
             continue
-        by_group[vg.index] = np.array(
-            (pb.matrix @ pb.bone.matrix_local.inverted()), dtype=np.float64)
-    if not by_group:
+        column_bone[vg.index] = len(mats)
+        mats.append(from_arm @ np.array(
+            (pb.matrix @ pb.bone.matrix_local.inverted()), dtype=np.float64) @ to_arm)
+    if not mats:
         return None
 
-    n = len(obj.data.vertices)
-    acc = np.zeros((n, 4, 4), dtype=np.float64)
-    total = np.zeros(n, dtype=np.float64)
-    for i, v in enumerate(obj.data.vertices):
-        for g in v.groups:
-            m = by_group.get(g.group)
-            if m is None or g.weight == 0.0:
-                continue
-            acc[i] += m * g.weight
-            total[i] += g.weight
-
+    weights = WeightMatrix.from_object(obj)
+    lut = np.full(len(weights.names), -1, dtype=np.int64)
+    for col, b in column_bone.items():
+        lut[col] = b
+    bone = lut[weights.indices]
+    keep = (bone >= 0) & (weights.data != 0.0)
+    rows = weights.rows()[keep]
+    bone = bone[keep]
+    w = weights.data[keep].astype(np.float64)
+
+    n = weights.vertex_count
+    total = np.bincount(rows, weights=w, minlength=n)
     weighted = total > 1e-12
     if not weighted.any():
         return None
     # Normalise, matching the modifier: weights that do not sum to 1 scale the result
-    # rather than shrinking the mesh toward the origin.
-    acc[weighted] /= total[weighted, None, None]
-    acc[~weighted] = np.eye(4)
-
-    to_arm = np.array(arm_obj.matrix_world.inverted() @ obj.matrix_world,
-                      dtype=np.float64)
-    from_arm = np.linalg.inv(to_arm)
-    # Fold the basis change in so each vertex needs one 4x4 rather than three.
-    return from_arm @ acc @ to_arm
-
-
-def _transform(mats, coords):
-    """Apply per-vertex 4x4 *mats* to a flat ``(V*3,)`` coordinate buffer, in place."""
-    pts = coords.reshape(-1, 3)
-    homo = np.empty((pts.shape[0], 4), dtype=np.float64)
-    homo[:, :3] = pts
-    homo[:, 3] = 1.0
-    pts[:] = np.einsum('vij,vj->vi', mats, homo)[:, :3]
+    # rather than shrinking the mesh toward the origin.  A vertex whose weights sum to
+    # zero keeps no entries, and skinning leaves it where it is.
+    keep = weighted[rows]
+    rows, bone = rows[keep], bone[keep]
+    w = (w[keep] / total[rows]).astype(np.float32)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, bone, w, np.array(mats, dtype=np.float32)[:, :3, :]
 
 
 def bake_mesh(arm_obj, obj):
@@ -159,26 +162,27 @@ def bake_mesh(arm_obj, obj):
     Returns True if anything changed.  Shape keys are moved by the same per-vertex
     transform as the base mesh -- their coordinates are absolute positions in the same
     space, so a shape key that survives this stays exactly as far from the basis as it
-    was.
+    was.  The base mesh and every key are read into one float32 stack and skinned in
+    one ``skinning.skin`` call.
     """
-    mats = _skin_matrices(arm_obj, obj)
-    if mats is None:
+    skin = _skin_weights(arm_obj, obj)
+    if skin is None:
         return False
 
     me = obj.data
     n = len(me.vertices)
+    key_blocks = list(me.shape_keys.key_blocks) if me.shape_keys else []
+
+    stack = np.empty((1 + len(key_blocks), n * 3), dtype=np.float32)
+    me.vertices.foreach_get("co", stack[0])
+    for row, kb in enumerate(key_blocks, 1):
+        kb.data.foreach_get("co", stack[row])
+
+    skinning.skin(stack.reshape(len(stack), n, 3), *skin)
 
-    co = np.empty(n * 3, dtype=np.float64)
-    me.vertices.foreach_get("co", co)
-    _transform(mats, co)
-    me.vertices.foreach_set("co", co)
-
-    if me.shape_keys:
-        for kb in me.shape_keys.key_blocks:
-            kco = np.empty(n * 3, dtype=np.float64)
-            kb.data.foreach_get("co", kco)
-            _transform(mats, kco)
-            kb.data.foreach_set("co", kco)
+    me.vertices.foreach_set("co", stack[0])
+    for row, kb in enumerate(key_blocks, 1):
+        kb.data.foreach_set("co", stack[row])
 
     me.update()
     return True
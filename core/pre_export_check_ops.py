@@ -45,6 +45,7 @@ from bpy.props import (BoolProperty, CollectionProperty, EnumProperty,
 from .i18n import T
 from .compat import HAS_DIALOG_TITLE
 from . import pre_export_check as pc
+from . import tex_index
 from .mdf_material_convert_base import _load_vanilla_art_paths
 from .mdf_port_tex import get_game_tex_config
 from .mdf_port_ops import mdf_material_collections, _draw_mod_root_row
@@ -196,8 +197,16 @@ def _check_textures(materials, cfg, natives_root):
     tex_version = cfg["tex_version"]
     vanilla = _load_vanilla_art_paths(cfg["vanilla_asset_rel"])
 
+    # One incremental walk of the mod root instead of an isfile per binding;
+    # after the first run an unchanged tree costs a stat per directory.
+    index = tex_index.get_index(natives_root) if os.path.isdir(natives_root) else None
+
     def exists(path):
-        return os.path.isfile(pc.resolve_disk_path(natives_root, path, tex_version))
+        disk_path = pc.resolve_disk_path(natives_root, path, tex_version)
+        if index is not None and index.contains(disk_path):
+            return True
+        # A miss is rare and is what gets reported, so confirm it on disk.
+        return os.path.isfile(disk_path)
 
     n_found = 0
     missing = []   # (obj, material name, slot, path)
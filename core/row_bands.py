@@ -0,0 +1,65 @@
+"""Image work in fixed-height row bands, handed on in order.
+
+The compose, detail-normal blend and colour adjust each used to build their
+result -- and every float temporary on the way to it -- at full resolution.
+At 8K one float32 RGBA temporary is a gigabyte, and the detail blend's
+bilinear tiling alone made four gathered copies of the detail map at the
+output size.  Run as bands, a kernel's temporaries are a band's worth, and the
+result can go straight into image_io.PngWriter without existing whole either.
+
+``run(height, rows, kernel, sink)`` calls ``kernel(r0, r1)`` for each band top
+to bottom and ``sink(result)`` with each result in band order.  With
+*threads* > 1 the kernels run on a pool -- NumPy releases the GIL inside its
+loops -- while *sink* stays on the calling thread, at most two bands per
+thread ahead of it.
+
+Free of ``bpy``.
+"""
+
+import collections
+
+#: Float working set per band: about 16 MB, whatever the image width.
+BAND_BYTES = 1 << 24
+
+
+def band_rows(width, bytes_per_pixel=16, budget=BAND_BYTES):
+    """Rows per band for *width*-pixel rows costing *bytes_per_pixel* each
+    (16: one float32 RGBA temporary)."""
+    return max(1, budget // max(1, int(width) * int(bytes_per_pixel)))
+
+
+def bands(height, rows):
+    """``(r0, r1)`` for each band of *rows* rows, top to bottom."""
+    for r0 in range(0, height, rows):
+        yield r0, min(r0 + rows, height)
+
+
+def run(height, rows, kernel, sink=None, threads=1):
+    """``sink(kernel(r0, r1))`` for every band, in order.  An exception from
+    either stops the run and propagates once the bands in flight finish."""
+    threads = max(1, int(threads or 1))
+    if threads == 1 or height <= rows:
+        for r0, r1 in bands(height, rows):
+            out = kernel(r0, r1)
+            if sink is not None:
+                sink(out)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+    pending = collections.deque()
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix='mt-band') as pool:
+        try:
+            for r0, r1 in bands(height, rows):
+                pending.append(pool.submit(kernel, r0, r1))
+                if len(pending) >= threads * 2:
+                    out = pending.popleft().result()
+                    if sink is not None:
+                        sink(out)
+            while pending:
+                out = pending.popleft().result()
+                if sink is not None:
+                    sink(out)
+        except BaseException:
+            for fut in pending:
+                fut.cancel()
+            raise
@@ -0,0 +1,72 @@
+"""Sparse linear blend skinning over stacked coordinate sets.
+
+``pose_bake`` used to build a dense ``(V, 4, 4)`` float64 transform per vertex
+-- 128 bytes a vertex, plus a second full copy for the change of basis -- by
+looping over every vertex's groups in Python, then ran an einsum per shape
+key.  Here the weights stay sparse and the work is chunked:
+
+* weights come in as CSR -- ``indptr`` per vertex, then bone index and
+  normalised weight per entry; a vertex with no entries is left where it is;
+* bones are a ``(B, 3, 4)`` float32 stack with any change of basis already
+  folded in, so each vertex needs one affine transform;
+* ``skin`` blends each chunk's matrices with a gather, a multiply and an
+  ``np.add.reduceat``, then applies them to every coordinate set at once --
+  the basis and all shape keys stacked as ``(K, V, 3)``.
+
+Chunks are sized so the per-chunk temporaries stay near ``CHUNK_BYTES``
+however many shape keys are stacked.  Float32 throughout, like the
+coordinates Blender stores.  Free of ``bpy``.
+"""
+
+import numpy as np
+
+CHUNK_BYTES = 32 << 20
+
+
+def chunk_size(sets):
+    """Vertices per chunk for *sets* stacked coordinate sets."""
+    return max(1024, CHUNK_BYTES // (max(1, sets) * 3 * 4 * 2))
+
+
+def blend(indptr, bones, weights, mats, lo, hi):
+    """The blended ``(3, 4)`` transform of each vertex in ``[lo, hi)`` that has
+    weights, as ``(vertex_indices, transforms)``."""
+    e0, e1 = int(indptr[lo]), int(indptr[hi])
+    if e0 == e1:
+        return np.empty(0, dtype=np.int64), np.empty((0, 3, 4), dtype=np.float32)
+    counts = np.diff(indptr[lo:hi + 1])
+    rows = np.flatnonzero(counts)
+    starts = indptr[lo:hi][rows] - e0
+    weighted = mats[bones[e0:e1]] * weights[e0:e1, None, None]
+    return rows + lo, np.add.reduceat(weighted, starts, axis=0)
+
+
+def skin(points, indptr, bones, weights, mats, chunk=None):
+    """Skin ``(K, V, 3)`` float32 *points* in place.
+
+    *indptr* (``V + 1``), *bones* and *weights* are the CSR weights -- weights
+    already normalised to sum to 1 per vertex; *mats* is the ``(B, 3, 4)``
+    bone stack.  Returns the number of vertices moved.
+    """
+    mats = np.ascontiguousarray(mats, dtype=np.float32)
+    weights = np.asarray(weights, dtype=np.float32)
+    sets, count = points.shape[0], points.shape[1]
+    chunk = chunk or chunk_size(sets)
+    moved = 0
+    for lo in range(0, count, chunk):
+        hi = min(count, lo + chunk)
+        idx, xf = blend(indptr, bones, weights, mats, lo, hi)
+        if not len(idx):
+            continue
+        moved += len(idx)
+        dense = len(idx) == hi - lo
+        sel = slice(lo, hi) if dense else idx
+        pts = points[:, sel, :]
+        # Row by row rather than one einsum: three broadcast multiply-adds run
+        # several times faster than einsum's generic loop here.
+        out = pts[..., 0:1] * xf[:, :, 0]
+        out += pts[..., 1:2] * xf[:, :, 1]
+        out += pts[..., 2:3] * xf[:, :, 2]
+        out += xf[:, :, 3]
+        points[:, sel, :] = out
+    return moved
@@ -0,0 +1,205 @@
+"""Content-addressed cache of composed slot textures, across Process runs.
+
+Every press of Process used to re-compose every slot, re-encode it and rewrite
+its ``.tex`` -- for a 30-material outfit, minutes spent reproducing files that
+are already sitting on disk, identical, from the last press.  This remembers
+each written ``.tex`` under a key that covers everything that decides its bytes:
+
+* every source image the slot's channel map reads, by ``(path, mtime_ns, size)``
+  -- the same stamp as mdf_generator_base._file_stamp, and the same caveat: a
+  rewrite within one timestamp tick that keeps the size is not seen.  A user
+  re-saving a texture from an image editor always moves one or the other.
+* the channel map itself, the channel selectors and invert flags of those
+  sources, ``normal_flip_g`` and the octahedral flag
+* DXGI format, mip setting, tex version, GDeflate level and the encoder (backend
+  and BC7 quality) -- the same inputs through a different encoder are different
+  bytes
+
+Next to an entry, ``<key>.px`` holds the digest of its composed pixels, and
+``<key>.alias`` names the key whose texture an identical slot was bound to
+instead of writing its own -- so pixel-level sharing (see
+mdf_tex_processor_base._ProcessRun) survives a run served from the cache.
+
+A hit copies the cached file into place.  Copied, not hard-linked: every writer
+in this addon opens its output with ``'wb'``, which truncates in place, so a
+later non-cached write to a linked destination would silently rewrite the
+cache entry under it.
+
+Entries live in Blender's config directory, sharded by key prefix, and the
+oldest are evicted past MAX_BYTES.  Free of ``bpy`` apart from locating that
+directory: callers off the main thread resolve ``cache_dir()`` beforehand and
+pass it as *root*.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+#: Bump when anything about how a slot's bytes are produced changes in a way the
+#: key below cannot see (a compose fix, an encoder fix), to orphan old entries.
+CACHE_VERSION = 2
+
+MAX_BYTES = 4 * 1024 ** 3
+
+
+def enabled():
+    """The addon preference; True outside Blender or before registration."""
+    from .addon_prefs import pref
+    return bool(pref('slot_texture_cache', True))
+
+
+def cache_dir():
+    """Where entries live; reads ``bpy``, so call it on the main thread."""
+    try:
+        import bpy
+        cfg = bpy.utils.user_resource("CONFIG")
+    except Exception:
+        cfg = os.path.expanduser("~")
+    return os.path.join(cfg, "modding_toolkit_slot_cache")
+
+
+def _source_stamp(path):
+    if not path:
+        return None
+    path = os.path.abspath(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return [path, None, None]
+    return [path, st.st_mtime_ns, st.st_size]
+
+
+def slot_key(slot_type, channel_map, pbr_paths, pbr_channels, pbr_inv, **settings):
+    """Hex key for one composed slot.
+
+    *channel_map* is the slot's own entry (``channel_maps[slot_type]``); only
+    the PBR types it reads contribute their stamp, selector and invert flag, so
+    changing the roughness map does not invalidate the albedo.  *settings*
+    holds the rest (normal_flip_g, octahedral, dds_fmt, mipmaps, tex_version,
+    gdeflate_level, encoder, ...) -- anything JSON-serialisable.
+    """
+    used = sorted({src[0] for src in (channel_map or {}).values()
+                   if isinstance(src, tuple) and src})
+    payload = {
+        'v': CACHE_VERSION,
+        'slot': slot_type,
+        'map': sorted((ch, repr(src)) for ch, src in (channel_map or {}).items()),
+        'sources': {pt: [_source_stamp(pbr_paths.get(pt)),
+                         pbr_channels.get(pt), bool(pbr_inv.get(pt))]
+                    for pt in used},
+        'settings': sorted(settings.items()),
+    }
+    blob = json.dumps(payload, sort_keys=True, default=repr).encode('utf-8')
+    return hashlib.sha256(blob).hexdigest()
+
+
+def direct_key(path, **settings):
+    """Hex key for a slot converted straight from one image (no channel map):
+    its stamp plus *settings*, as slot_key."""
+    payload = {
+        'v': CACHE_VERSION,
+        'direct': _source_stamp(path),
+        'settings': sorted(settings.items()),
+    }
+    blob = json.dumps(payload, sort_keys=True, default=repr).encode('utf-8')
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _entry_path(key, root=None, ext='.tex'):
+    return os.path.join(root or cache_dir(), key[:2], key + ext)
+
+
+def _write_note(key, ext, text, root=None):
+    entry = _entry_path(key, root, ext)
+    tmp = entry + '.part'
+    try:
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        with open(tmp, 'w', encoding='ascii') as f:
+            f.write(text)
+        os.replace(tmp, entry)
+    except OSError as err:
+        print(f"[Slot Cache] could not store {key[:12]}{ext}: {err}")
+
+
+def _read_note(key, ext, root=None):
+    try:
+        with open(_entry_path(key, root, ext), encoding='ascii') as f:
+            return f.read().strip() or None
+    except (OSError, ValueError):
+        return None
+
+
+def place(key, disk_path, root=None):
+    """Copy the cached ``.tex`` for *key* to *disk_path*; False on a miss."""
+    entry = _entry_path(key, root)
+    if not os.path.isfile(entry):
+        return False
+    os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+    shutil.copyfile(entry, disk_path)
+    try:
+        os.utime(entry)     # recency for eviction
+    except OSError:
+        pass
+    return True
+
+
+def store(key, disk_path, root=None, digest=None):
+    """Remember the just-written *disk_path* under *key*, with the *digest* of
+    its composed pixels when there is one.  Best effort: a cache that cannot be
+    written only costs the next run its speed-up."""
+    entry = _entry_path(key, root)
+    tmp = entry + '.part'
+    try:
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        shutil.copyfile(disk_path, tmp)
+        os.replace(tmp, entry)
+    except OSError as err:
+        print(f"[Slot Cache] could not store {os.path.basename(disk_path)}: {err}")
+        return
+    if digest:
+        _write_note(key, '.px', digest, root)
+
+
+def digest(key, root=None):
+    """The composed-pixel digest stored with *key*'s entry, or None."""
+    if not os.path.isfile(_entry_path(key, root)):
+        return None
+    return _read_note(key, '.px', root)
+
+
+def store_alias(key, owner_key, root=None):
+    """Remember that the slot keyed *key* came out identical to *owner_key*'s."""
+    _write_note(key, '.alias', owner_key, root)
+
+
+def alias(key, root=None):
+    """The key *key*'s slot was last found identical to, or None."""
+    return _read_note(key, '.alias', root)
+
+
+def prune(max_bytes=MAX_BYTES, root=None):
+    """Evict least-recently used entries until the cache fits in *max_bytes*.
+    Returns how many were removed."""
+    root = root or cache_dir()
+    entries = []
+    for dirpath, _dirs, files in os.walk(root):
+        for name in files:
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _m, size, _p in entries)
+    removed = 0
+    for _mtime, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
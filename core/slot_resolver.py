@@ -48,9 +48,17 @@ def write_slot_tex(src_img, disk_path, temp_dir, *,
 
     Creates the destination directory.  Raises FileNotFoundError if texconv
     produced nothing, so a silent zero-byte texture cannot reach the game.
+    The two halves are slot_dds and slot_tex, which core/tex_batch.py runs on
+    different threads.
     """
-    os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+    dds_path = slot_dds(src_img, temp_dir, dds_fmt=dds_fmt,
+                        generate_mipmaps=generate_mipmaps, image_to_dds=image_to_dds)
+    return slot_tex(src_img, dds_path, disk_path, dds_to_tex)
+
 
+def slot_dds(src_img, temp_dir, *, dds_fmt, generate_mipmaps, image_to_dds):
+    """The encode half of write_slot_tex: the DDS to pack for *src_img* --
+    *src_img* itself for a .dds, None for a .tex that is copied as is."""
     src_name  = os.path.basename(src_img)
     src_lower = src_img.lower()
 
@@ -59,11 +67,9 @@ def write_slot_tex(src_img, disk_path, temp_dir, *,
     # source like "foo.texture.png" is copied raw instead of converted; see the
     # note in the commit that introduced this module.
     if '.tex' in src_name.lower():
-        shutil.copy2(src_img, disk_path)
-        return src_img
+        return None
 
     if src_lower.endswith('.dds'):
-        dds_to_tex([src_img], disk_path)
         return src_img
 
     # texconv names its output after the input, in out_dir.  Callers that pull
@@ -74,5 +80,14 @@ def write_slot_tex(src_img, disk_path, temp_dir, *,
     image_to_dds([(src_img, dds_fmt)], temp_dir, generate_mipmaps)
     if not os.path.isfile(dds_path):
         raise FileNotFoundError(f"texconv output not found: {dds_path}")
+    return dds_path
+
+
+def slot_tex(src_img, dds_path, disk_path, dds_to_tex):
+    """The packing half of write_slot_tex, for slot_dds's *dds_path*."""
+    os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+    if dds_path is None:
+        shutil.copy2(src_img, disk_path)
+        return src_img
     dds_to_tex([dds_path], disk_path)
     return dds_path
@@ -0,0 +1,106 @@
+"""Constant-colour textures straight to DDS / .tex bytes.
+
+A slot whose every channel is a constant (metallic 0, AO 1, a flat albedo)
+used to become a solid PNG, then texconv's full encode and mip chain, then a
+.tex -- a quarter of a second or more for sixteen identical bytes repeated.
+Every 4x4 block of a constant image compresses to the same block, and every
+mip of it is the same constant, so the whole file follows from one block:
+
+* ``_unit`` encodes a single constant 4x4 tile with bcn_encode (one pixel's
+  bytes for the uncompressed formats), once per colour and format;
+* ``solid_dds`` repeats it for each mip, down to 1x1;
+* ``solid_tex`` packs that into .tex bytes, memoised on the quantised colour,
+  format, size, mip count and tex version.
+
+Values are quantised the way the PNG route stored them (8 bits, round half
+up), and sRGB formats are a tag only, as with texconv.  Free of ``bpy``.
+"""
+
+import functools
+import os
+
+import numpy as np
+
+from . import dxgi_format as dxgi
+
+
+def quantize(value):
+    """A scalar (grey, alpha 1) or an r, g, b[, a] sequence in 0..1 -> four
+    8-bit samples."""
+    if isinstance(value, (int, float)):
+        vals = [float(value)] * 3 + [1.0]
+    else:
+        vals = [float(c) for c in list(value)[:4]]
+        vals += [1.0] * (4 - len(vals))
+    return tuple(int(np.floor(min(max(v, 0.0), 1.0) * 255.0 + 0.5)) for v in vals)
+
+
+@functools.lru_cache(maxsize=None)
+def _unit(rgba8, fmt):
+    """The bytes one 4x4 block (block formats) or one pixel (the rest) of a
+    constant *rgba8* image encode to in *fmt*."""
+    from . import bcn_encode
+    tile = np.broadcast_to(np.array(rgba8, dtype=np.uint8), (4, 4, 4))
+    data = bcn_encode.encode_mip(tile, fmt, 'EXHAUSTIVE')
+    return data if dxgi.is_block_compressed(fmt) else data[:len(data) // 16]
+
+
+def solid_dds(value, dxgi_format_name, size, generate_mips=True):
+    """A dds_file.DDSFile of a constant *value*, *size* square (or a
+    ``(width, height)`` pair), with a full mip chain when *generate_mips*."""
+    return _build_dds(quantize(value), dxgi_format_name, size, generate_mips)
+
+
+def _build_dds(rgba8, dxgi_format_name, size, generate_mips):
+    from . import bcn_encode, dds_file, mip_chain
+
+    fmt = dxgi.DXGI_FORMAT[dxgi_format_name]
+    if not bcn_encode.can_encode(fmt):
+        raise ValueError(f"No constant-colour encoding for {dxgi_format_name}")
+    width, height = (size, size) if isinstance(size, int) else size
+    unit = _unit(rgba8, fmt)
+
+    dds = dds_file.DDSFile()
+    dds.width, dds.height, dds.dxgi_format = width, height, fmt
+    levels = mip_chain.mip_count(width, height) if generate_mips else 1
+    for level in range(levels):
+        w, h = max(1, width >> level), max(1, height >> level)
+        count = ((w + 3) // 4) * ((h + 3) // 4) if dxgi.is_block_compressed(fmt) else w * h
+        dds.mips.append(unit * count)
+    dds.mip_count = len(dds.mips)
+    return dds
+
+
+@functools.lru_cache(maxsize=64)
+def _tex_bytes(rgba8, dxgi_format_name, size, generate_mips, tex_version, gdeflate_level):
+    from . import tex_file
+    dds = _build_dds(rgba8, dxgi_format_name, size, generate_mips)
+    return tex_file.build_tex_from_dds(dds, tex_version, gdeflate_level)
+
+
+def solid_tex(value, dxgi_format_name, size, tex_version, generate_mips=True,
+              gdeflate_level=None):
+    """.tex file bytes for a constant *value* (see solid_dds).  Memoised:
+    every slot of a run with the same constant gets the same bytes back."""
+    if not isinstance(size, int):
+        size = tuple(size)
+    return _tex_bytes(quantize(value), dxgi_format_name, size, bool(generate_mips),
+                      tex_version, gdeflate_level)
+
+
+def write_solid_tex(disk_path, value, dxgi_format_name, size, tex_version,
+                    generate_mips=True, gdeflate_level=None):
+    """solid_tex, written to *disk_path* (its directory created)."""
+    data = solid_tex(value, dxgi_format_name, size, tex_version, generate_mips, gdeflate_level)
+    os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+    with open(disk_path, 'wb') as f:
+        f.write(data)
+    return disk_path
+
+
+def write_solid_dds(dds_path, value, dxgi_format_name, size, generate_mips=True):
+    """solid_dds, written to *dds_path* -- for containers built from a DDS
+    file (MHWI's .tex)."""
+    from . import dds_file
+    os.makedirs(os.path.dirname(dds_path) or '.', exist_ok=True)
+    return dds_file.write_dds(solid_dds(value, dxgi_format_name, size, generate_mips), dds_path)
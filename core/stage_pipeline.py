@@ -0,0 +1,114 @@
+"""Worker pool + single writer, with completions handed back to the main thread.
+
+Blender's API may only be touched from the main thread, but most of what the
+texture processor spends its time on -- compose, mip chain, block encode,
+GDeflate -- is NumPy and ctypes work that releases the GIL.  This splits a job
+into the stages that can run elsewhere:
+
+* ``work()``   on a pool of *workers* threads: the CPU-bound part
+* ``write(r)`` on one writer thread, in completion order: the disk part, so
+  encodes never wait on I/O and two writes never interleave on a slow disk
+* ``on_done(result, error)`` on whichever thread calls ``poll()`` -- the main
+  thread, where it is safe to write results back into bpy data
+
+Cancelling drops the jobs that have not started and skips the write of any
+that finish afterwards, so a file on disk is always either fully written or not
+touched.  A job already writing is let finish.
+
+Free of ``bpy``.
+"""
+
+import queue
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+
+class StagePipeline:
+
+    def __init__(self, workers):
+        self.workers = max(1, int(workers))
+        self._pool = ThreadPoolExecutor(max_workers=self.workers,
+                                        thread_name_prefix='mt-stage')
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mt-writer')
+        self._done = queue.SimpleQueue()
+        self._futures = set()
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self.pending = 0    # submitted and not yet handed to on_done
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def submit(self, work, write=None, on_done=None):
+        """Queue one job.  *write* receives work()'s result; on_done receives
+        write()'s (or work()'s, without a *write*) and the exception, if any,
+        from either stage -- CancelledError for a job cancel() dropped."""
+        self.pending += 1
+        fut = self._pool.submit(work)
+        with self._lock:
+            self._futures.add(fut)
+        fut.add_done_callback(lambda f: self._after_work(f, write, on_done))
+
+    def _after_work(self, fut, write, on_done):
+        with self._lock:
+            self._futures.discard(fut)
+        if fut.cancelled():
+            self._done.put((on_done, None, CancelledError()))
+            return
+        err = fut.exception()
+        if err is not None or write is None:
+            self._done.put((on_done, None if err else fut.result(), err))
+            return
+        result = fut.result()
+
+        def run_write():
+            if self._cancelled:
+                raise CancelledError()
+            return write(result)
+
+        self._writer.submit(run_write).add_done_callback(
+            lambda f: self._done.put((on_done, *_outcome(f))))
+
+    def poll(self, timeout=0.0):
+        """Run on_done for every finished job; waits up to *timeout* seconds
+        for the first one.  Returns how many were handled."""
+        handled = 0
+        try:
+            item = self._done.get(timeout=timeout) if timeout else self._done.get_nowait()
+        except queue.Empty:
+            return 0
+        while True:
+            on_done, result, err = item
+            self.pending -= 1
+            handled += 1
+            if on_done is not None:
+                on_done(result, err)
+            try:
+                item = self._done.get_nowait()
+            except queue.Empty:
+                return handled
+
+    def cancel(self):
+        """Drop every job that has not started; skip the write of the rest."""
+        self._cancelled = True
+        with self._lock:
+            futures = list(self._futures)
+        for fut in futures:
+            fut.cancel()
+
+    def drain(self):
+        """poll() until every submitted job has been handed to on_done."""
+        while self.pending > 0:
+            self.poll(timeout=0.1)
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+        self._writer.shutdown(wait=True)
+
+
+def _outcome(fut):
+    if fut.cancelled():
+        return None, CancelledError()
+    err = fut.exception()
+    return (None, err) if err is not None else (fut.result(), None)
@@ -715,6 +715,11 @@ class MODDER_OT_MergePhysicsWeights(bpy.types.Operator):
     bl_label = "Downgrade Physics Weights"
     bl_options = {'REGISTER', 'UNDO'}
 
+    dry_run: bpy.props.BoolProperty(
+        name="Dry Run",
+        description="Only report how much weight each physics bone would hand to its base bone; change nothing",
+        default=False)
+
     @classmethod
     def description(cls, context, properties):
         return T("core.standard_ops.merge_physics_weights_desc")
@@ -775,28 +780,32 @@ class MODDER_OT_MergePhysicsWeights(bpy.types.Operator):
             self.report({'INFO'}, T("core.standard_ops.no_physics_vgroups"))
             return {'FINISHED'}
         
-        # 对每个网格执行权重合并
+        # 对每个网格执行权重合并：物理骨→基础骨的映射一次建好，每个网格只读一次、
+        # 写一次（weight_utils.merge_vgroup_map），而不是每根物理骨各扫一遍全部顶点。
         bpy.ops.object.mode_set(mode='OBJECT')
         total_merged = 0
-        
+        moved = {}  # {physics_bone_name: [顶点数, 权重总量]}，跨网格累计
+
         for mesh_obj in selected_meshes:
-            vgs = mesh_obj.vertex_groups
-            merged_in_mesh = 0
-            
-            for phys_name, base_name in physics_to_base.items():
-                if phys_name not in vgs:
-                    continue  # 这个网格没有这根物理骨的权重
-                
-                # 确保基础骨骼的顶点组存在
-                if base_name not in vgs:
-                    vgs.new(name=base_name)
-                
-                # 合并权重
-                weight_utils.merge_vgroups_multi(mesh_obj, [phys_name], base_name)
-                merged_in_mesh += 1
-            
-            total_merged += merged_in_mesh
-        
+            per_mesh = weight_utils.merge_vgroup_map(
+                mesh_obj, physics_to_base, dry_run=self.dry_run)
+            total_merged += len(per_mesh)
+            for phys_name, (verts, mass) in per_mesh.items():
+                acc = moved.setdefault(phys_name, [0, 0.0])
+                acc[0] += verts
+                acc[1] += mass
+
+        if self.dry_run:
+            print("[Physics Downgrade] dry run -- nothing changed")
+            for phys_name, (verts, mass) in sorted(moved.items(), key=lambda kv: -kv[1][1]):
+                print(f"[Physics Downgrade]   {phys_name} -> {physics_to_base[phys_name]}: "
+                      f"{mass:.3f} over {verts} vertices")
+            self.report({'INFO'}, T("core.standard_ops.merge_physics_dry_run").format(
+                meshes=len(selected_meshes), groups=total_merged,
+                bases=len({physics_to_base[p] for p in moved}),
+                mass=sum(m for _v, m in moved.values())))
+            return {'FINISHED'}
+
         self.report({'INFO'}, T("core.standard_ops.merge_physics_done").format(
             meshes=len(selected_meshes), groups=total_merged))
         return {'FINISHED'}
@@ -0,0 +1,198 @@
+"""Whole-run .tex writing: queue every slot's texture, then encode them together.
+
+slot_resolver.write_slot_tex turns one image into one .tex, and the generators
+and the port called it slot by slot inside their material loops -- each texconv
+or NumPy encode blocking the next material's compose, and a source bound by
+several materials (a shared detail map, a placeholder) encoded once per
+material.  A TexBatch collects those writes as TexJobs instead and runs them
+once per operator run:
+
+* identical jobs -- same source file, DXGI format, mip flag and tex version --
+  are encoded once; every further destination gets a copy of the finished .tex;
+* the encodes are ordered largest source first, so a 4K map does not start
+  last and leave the other workers idle behind it;
+* they run on a StagePipeline (core/stage_pipeline.py): slot_resolver.slot_dds
+  on the workers, slot_resolver.slot_tex on its writer thread -- or on the
+  thread calling ``run()``, for a *dds_to_tex* not known to be thread-safe;
+* ``run()`` returns one TexResult per queued job, in queue order -- the
+  manifest callers count and report from.
+
+Sources must stay on disk until ``run()`` returns; callers queue files from
+their temp_dir and remove it afterwards.
+
+Free of ``bpy``: the encoder backend, BC7 quality and worker counts -- GDeflate's
+included, bound into *dds_to_tex* -- are read by the caller on the main thread
+and passed in.
+"""
+
+import functools
+import os
+import shutil
+import time
+
+from .stage_pipeline import StagePipeline
+
+
+class TexJob:
+    """One texture to write: *src* encoded as *dds_fmt* (mips or not) and
+    packed for *tex_version* at *disk_path*.  *label* is the caller's, for
+    reporting -- a material name, say."""
+
+    __slots__ = ('src', 'slot_type', 'dds_fmt', 'mipmaps', 'tex_version', 'disk_path', 'label')
+
+    def __init__(self, src, slot_type, dds_fmt, mipmaps, tex_version, disk_path, label=None):
+        self.src = src
+        self.slot_type = slot_type
+        self.dds_fmt = dds_fmt
+        self.mipmaps = bool(mipmaps)
+        self.tex_version = tex_version
+        self.disk_path = disk_path
+        self.label = label
+
+    @property
+    def key(self):
+        """Jobs with equal keys produce byte-identical files."""
+        return (os.path.normcase(os.path.abspath(self.src)), self.dds_fmt, self.mipmaps,
+                self.tex_version)
+
+
+class TexResult:
+    """How one TexJob went.  *error* is None on success; *copied_from* is the
+    file this one was copied from when an identical job did the encode."""
+
+    __slots__ = ('job', 'error', 'copied_from')
+
+    def __init__(self, job, error=None, copied_from=None):
+        self.job = job
+        self.error = error
+        self.copied_from = copied_from
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _source_pixels(path):
+    from . import tex_index
+    info = tex_index.read_header(path)
+    if info is not None and info.width:
+        return info.width * info.height
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+class TexBatch:
+    """TexJobs queued over a run and written by one ``run()``.
+
+    *dds_to_tex* is ``(dds_paths, tex_version, out_path)`` -- the RE games'
+    signature; bind MHWI's two-argument converter with a lambda.  It runs on
+    the pipeline's writer thread unless *threaded_tex* is False, when it runs
+    on the thread calling ``run()`` as each encode finishes -- for a third-party
+    converter.  *workers* defaults to 1; callers in Blender pass
+    mdf_tex_processor_base's texture_workers().
+    """
+
+    def __init__(self, temp_dir, dds_to_tex, workers=None, backend=None, quality=None,
+                 log_tag="Tex", threaded_tex=True):
+        self.temp_dir = temp_dir
+        self.dds_to_tex = dds_to_tex
+        self.threaded_tex = threaded_tex
+        self.workers = max(1, int(workers or 1))
+        self.backend = backend
+        self.quality = quality
+        self.log_tag = log_tag
+        self.jobs = []
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def add(self, src, slot_type, dds_fmt, mipmaps, tex_version, disk_path, label=None):
+        """Queue one texture; nothing is written before run()."""
+        job = TexJob(src, slot_type, dds_fmt, mipmaps, tex_version, disk_path, label)
+        self.jobs.append(job)
+        return job
+
+    def run(self, on_progress=None):
+        """Write every queued job.  Returns ``[TexResult]`` in queue order and
+        empties the queue.  *on_progress(done, total)* is called on this
+        thread as each distinct encode finishes."""
+        jobs, self.jobs = self.jobs, []
+        if not jobs:
+            return []
+        groups = {}
+        for job in jobs:
+            groups.setdefault(job.key, []).append(job)
+        order = sorted(groups.values(), key=lambda g: _source_pixels(g[0].src), reverse=True)
+
+        started = time.time()
+        results = {}
+        progress = {'done': 0}
+
+        def finished(group, dests, result, err):
+            if err is None and not self.threaded_tex:
+                try:
+                    self._write(group[0], dests, result)
+                except Exception as e:
+                    err = e
+            for job in group:
+                results[id(job)] = TexResult(
+                    job, err, None if job.disk_path == dests[0] else dests[0])
+            progress['done'] += 1
+            if on_progress is not None:
+                on_progress(progress['done'], len(order))
+
+        pipeline = StagePipeline(min(self.workers, len(order)))
+        try:
+            for i, group in enumerate(order):
+                dests = list(dict.fromkeys(job.disk_path for job in group))
+                job_dir = os.path.join(self.temp_dir, f"_tex_batch_{i}")
+                write = (functools.partial(self._write, group[0], dests)
+                         if self.threaded_tex else None)
+                pipeline.submit(functools.partial(self._encode, group[0], job_dir), write,
+                                functools.partial(finished, group, dests))
+            pipeline.drain()
+        finally:
+            pipeline.close()
+
+        manifest = [results[id(job)] for job in jobs]
+        failed = sum(1 for r in manifest if not r.ok)
+        print(f"[{self.log_tag}] {len(manifest)} texture(s), {len(order)} encoded, "
+              f"{failed} failed in {time.time() - started:.2f}s")
+        return manifest
+
+    # ── Stages ───────────────────────────────────────────────────────────────
+
+    def _encode(self, job, job_dir):
+        from .slot_resolver import slot_dds
+        os.makedirs(job_dir, exist_ok=True)
+        return slot_dds(job.src, job_dir, dds_fmt=job.dds_fmt, generate_mipmaps=job.mipmaps,
+                        image_to_dds=self._image_to_dds)
+
+    def _image_to_dds(self, items, out_dir, generate_mips):
+        # Unlike _ImageListToDDS, a failure propagates to the job's result.
+        from . import tex_encoder
+        for src, dds_fmt in items:
+            tex_encoder.convert_to_dds(src, dds_fmt, out_dir, generate_mips=generate_mips,
+                                       backend=self.backend, quality=self.quality)
+
+    def _write(self, job, dests, dds_path):
+        from .slot_resolver import slot_tex
+        slot_tex(job.src, dds_path, dests[0],
+                 lambda paths, out: self.dds_to_tex(paths, job.tex_version, out))
+        for dest in dests[1:]:
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            shutil.copy2(dests[0], dest)
+        return dests[0]
+
+
+def report_failures(manifest, log_tag):
+    """Print each failed job; the set of labels that had one."""
+    labels = set()
+    for r in manifest:
+        if not r.ok:
+            print(f"[{log_tag}] FAIL {r.job.slot_type} -> {os.path.basename(r.job.disk_path)}: "
+                  f"{r.error}")
+            labels.add(r.job.label)
+    return labels
@@ -230,8 +230,10 @@ def _on_src_a_update(self, context):
 
 
 # ── Output size ──────────────────────────────────────────────────────────────
-# Reading an image's dimensions means loading it, which is far too expensive to
-# repeat on every redraw, so results are memoised per path for the session.
+# Reading an image's dimensions used to mean loading it, which is far too
+# expensive to repeat on every redraw.  The header alone answers for every
+# format core/tex_index.py parses; Blender only loads the rest.  Either way the
+# result is memoised per path until the file's (mtime_ns, size) moves.
 _size_cache = {}
 
 
@@ -240,23 +242,33 @@ def image_size(path):
     if not path:
         return None
     abspath = bpy.path.abspath(path)
-    if not os.path.isfile(abspath):
-        return None
-    if abspath in _size_cache:
-        return _size_cache[abspath]
-    img = None
     try:
-        img = bpy.data.images.load(abspath, check_existing=False)
-        size = tuple(img.size)
-    except Exception:
-        size = None
-    finally:
-        if img is not None:
-            bpy.data.images.remove(img)
+        st = os.stat(abspath)
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _size_cache.get(abspath)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+
+    from . import tex_index
+    info = tex_index.read_header(abspath)
+    if info is not None:
+        size = (info.width, info.height)
+    else:
+        img = None
+        try:
+            img = bpy.data.images.load(abspath, check_existing=False)
+            size = tuple(img.size)
+        except Exception:
+            size = None
+        finally:
+            if img is not None:
+                bpy.data.images.remove(img)
     # Failures are cached too: draw() runs constantly, and a file Blender
     # cannot decode would otherwise be re-loaded on every redraw
-    _size_cache[abspath] = size if (size and size[0] and size[1]) else None
-    return _size_cache[abspath]
+    _size_cache[abspath] = (stamp, size if (size and size[0] and size[1]) else None)
+    return _size_cache[abspath][1]
 
 
 def is_power_of_two(v):
@@ -309,6 +321,27 @@ def _on_resize_toggle(self, context):
         self.out_height = snap_to_power_of_two(src[1])
 
 
+# ── Pixel I/O ──────────────────────────────────────────────────────────────
+# Straight between files and arrays (core/image_io.py), with no temporary
+# bpy.data.images datablock and no img.pixels round trip.  Sources are loaded
+# as native-type planes (core/channel_compose.py); results are produced in row
+# bands (core/row_bands.py) and streamed into the PNG, so an 8K image's float
+# temporaries cost a band rather than gigabytes.  Rows here are top row
+# first, file order.
+
+def _write_bands(out_path, width, height, kernel, dtype):
+    """Save the image *kernel* ``(r0, r1) -> (r1 - r0, width, 4)`` produces,
+    band by band, as a PNG -- 16-bit for uint16 results, 8-bit otherwise."""
+    import numpy as np
+    from . import image_io, row_bands
+
+    threads = os.cpu_count() or 1
+    depth = 16 if dtype == np.uint16 else 8
+    with image_io.PngWriter(out_path, width, height, 4, depth, threads=threads) as png:
+        row_bands.run(height, row_bands.band_rows(width), kernel, png.write, threads)
+    return out_path
+
+
 # ── Channel composition (generic 2-source version of mdf_tex_processor_base's
 # _compose_channels — that one is keyed by PBR type name, this one by 'A'/'B') ─
 
@@ -327,6 +360,8 @@ def _compose_channels(channel_map, path_a, path_b, out_dir, name_hint, encode_oc
     """
     import numpy as np
 
+    from . import channel_compose as cc
+
     sources = {}
     if path_a and os.path.isfile(path_a):
         sources['A'] = path_a
@@ -335,67 +370,58 @@ def _compose_channels(channel_map, path_a, path_b, out_dir, name_hint, encode_oc
     if not sources:
         return None
 
-    raw_imgs = {}
-    ref_w = ref_h = 0
-    for key, path in sources.items():
-        tmp_name = f"__tex_convert_tmp_{key}"
-        if tmp_name in bpy.data.images:
-            bpy.data.images.remove(bpy.data.images[tmp_name])
-        img = bpy.data.images.load(path, check_existing=False)
-        img.name = tmp_name
-        img.colorspace_settings.name = 'Non-Color'
-        iw, ih = img.size
-        if iw > ref_w:
-            ref_w, ref_h = iw, ih
-        raw_imgs[key] = img
-
-    if ref_w == 0:
-        ref_w = ref_h = 1024
-
-    loaded = {}
-    for key, img in raw_imgs.items():
-        iw, ih = img.size
-        if iw != ref_w or ih != ref_h:
-            img.scale(ref_w, ref_h)
-        loaded[key] = np.array(img.pixels[:], dtype=np.float32).reshape(ref_h, ref_w, 4)
-        bpy.data.images.remove(img)
-
-    result = np.zeros((ref_h, ref_w, 4), dtype=np.float32)
+    # Only the channels the map reads, in the file's own sample type -- see
+    # core/channel_compose.py.
+    read = {}
+    for src_key, ch_idx, _invert in channel_map.values():
+        read.setdefault(src_key, set()).add(ch_idx)
+    loaded = {key: cc.load_planes(path, read.get(key, ()))
+              for key, path in sources.items()}
+    planes = [p for chans in loaded.values() for p in chans.values()]
+    if planes:
+        ref_h, ref_w = max((p.shape for p in planes), key=lambda hw: hw[1])
+    else:
+        # An all-constant map still takes the widest source's size.
+        ref_w, ref_h = max((image_size(p) or (1, 1) for p in sources.values()),
+                           key=lambda wh: wh[0])
+    for chans in loaded.values():
+        for ch, plane in chans.items():
+            if plane.shape != (ref_h, ref_w):
+                chans[ch] = cc.resize(plane, ref_w, ref_h)
+    dtype = cc.common_dtype(planes)
+
+    plan = []
     for out_ch, (src_key, ch_idx, invert) in channel_map.items():
         oi = _CH[out_ch]
-        if src_key == 'CONST0':
-            result[:, :, oi] = 0.0
-            continue
         if src_key == 'CONST1':
-            result[:, :, oi] = 1.0
-            continue
-        arr = loaded.get(src_key)
-        if arr is None:
-            result[:, :, oi] = 0.0
-            continue
-        data = arr[:, :, ch_idx].copy()
-        if invert:
-            data = 1.0 - data
-        result[:, :, oi] = data
-
+            plan.append((oi, cc.constant(1.0, dtype), False))
+        elif src_key in loaded:
+            plan.append((oi, loaded[src_key][ch_idx], invert))
+        else:   # CONST0, or a source that was not given
+            plan.append((oi, cc.constant(0.0, dtype), False))
     if encode_octahedral:
         from .re_normal_pack import encode_normal_ga
-        g = result[:, :, _CH['G']]
-        a = result[:, :, _CH['A']]
-        result[:, :, _CH['G']], result[:, :, _CH['A']] = encode_normal_ga(g, a)
-
-    out_path = os.path.join(out_dir, f"{name_hint}_composed.png")
-    tmp_out = "__tex_convert_out"
-    if tmp_out in bpy.data.images:
-        bpy.data.images.remove(bpy.data.images[tmp_out])
-    out_img = bpy.data.images.new(tmp_out, width=ref_w, height=ref_h, alpha=True)
-    out_img.colorspace_settings.name = 'Non-Color'
-    out_img.pixels[:] = result.flatten().tolist()
-    out_img.filepath_raw = out_path
-    out_img.file_format = 'PNG'
-    out_img.save()
-    bpy.data.images.remove(out_img)
-    return out_path
+
+    def compose_band(r0, r1):
+        band = np.empty((r1 - r0, ref_w, 4), dtype=dtype)
+        for oi, src, invert in plan:
+            if not isinstance(src, np.ndarray):
+                band[:, :, oi] = src
+                continue
+            data = cc.convert(src[r0:r1], dtype)
+            if invert:
+                cc.invert(data, out=band[:, :, oi])
+            else:
+                band[:, :, oi] = data
+        if encode_octahedral:
+            g, a = encode_normal_ga(cc.to_float(band[:, :, _CH['G']]),
+                                    cc.to_float(band[:, :, _CH['A']]))
+            band[:, :, _CH['G']] = cc.from_float(g, dtype)
+            band[:, :, _CH['A']] = cc.from_float(a, dtype)
+        return band
+
+    return _write_bands(os.path.join(out_dir, f"{name_hint}_composed.png"),
+                        ref_w, ref_h, compose_band, dtype)
 
 
 # ── Detail normal map overlay (SINGLE mode only) ────────────────────────────
@@ -405,24 +431,30 @@ def _compose_channels(channel_map, path_a, path_b, out_dir, name_hint, encode_oc
 # detail normal map over a base normal map without renormalizing a full
 # vector sum, and it only needs the two channels the caller asked for.
 
-def _tile_sample_bilinear(arr, out_w, out_h, tiling_x, tiling_y):
-    """Wrap-sample `arr` (h, w, c) into an (out_h, out_w, c) array, repeating
-    it `tiling_x`/`tiling_y` times across the output — i.e. UV tiling."""
+def _tile_sample_bilinear(arr, out_w, out_h, tiling_x, tiling_y, rows=None):
+    """Wrap-sample `arr` (h, w, c) into an (out_h, out_w, c) float32 array,
+    repeating it `tiling_x`/`tiling_y` times across the output — i.e. UV
+    tiling.  `rows` = (r0, r1) samples only those output rows, so a caller
+    working in bands gathers a band's worth of `arr` rather than four
+    output-sized copies.  `arr` may be uint8/uint16 samples."""
     import numpy as np
+    from .channel_compose import to_float
 
+    r0, r1 = rows if rows is not None else (0, out_h)
     dh, dw = arr.shape[0], arr.shape[1]
     xs = np.mod((np.arange(out_w) + 0.5) / out_w * tiling_x, 1.0) * dw - 0.5
-    ys = np.mod((np.arange(out_h) + 0.5) / out_h * tiling_y, 1.0) * dh - 0.5
+    ys = np.mod((np.arange(r0, r1) + 0.5) / out_h * tiling_y, 1.0) * dh - 0.5
 
     x0 = np.floor(xs).astype(np.int64)
     y0 = np.floor(ys).astype(np.int64)
-    fx = (xs - x0)[None, :, None]
-    fy = (ys - y0)[:, None, None]
+    fx = (xs - x0).astype(np.float32)[None, :, None]
+    fy = (ys - y0).astype(np.float32)[:, None, None]
     x0m, x1m = np.mod(x0, dw), np.mod(x0 + 1, dw)
     y0m, y1m = np.mod(y0, dh), np.mod(y0 + 1, dh)
 
-    top = arr[y0m][:, x0m] * (1.0 - fx) + arr[y0m][:, x1m] * fx
-    bot = arr[y1m][:, x0m] * (1.0 - fx) + arr[y1m][:, x1m] * fx
+    near, far = arr[y0m], arr[y1m]
+    top = to_float(near[:, x0m]) * (1.0 - fx) + to_float(near[:, x1m]) * fx
+    bot = to_float(far[:, x0m]) * (1.0 - fx) + to_float(far[:, x1m]) * fx
     return top * (1.0 - fy) + bot * fy
 
 
@@ -431,48 +463,34 @@ def _blend_detail_normal(base_path, detail_path, tiling_x, tiling_y, out_dir, na
     only X/Y and re-deriving Z. Returns the output PNG path, or None on
     failure (e.g. unreadable detail image)."""
     import numpy as np
+    from . import channel_compose as cc
 
-    def _load_arr(path, tag):
-        tmp_name = f"__tex_convert_detail_{tag}"
-        if tmp_name in bpy.data.images:
-            bpy.data.images.remove(bpy.data.images[tmp_name])
-        img = bpy.data.images.load(path, check_existing=False)
-        img.name = tmp_name
-        img.colorspace_settings.name = 'Non-Color'
-        w, h = img.size
-        arr = np.array(img.pixels[:], dtype=np.float32).reshape(h, w, 4)
-        bpy.data.images.remove(img)
-        return arr
-
-    base_arr = _load_arr(base_path, "base")
-    detail_arr = _load_arr(detail_path, "detail")
-    h, w = base_arr.shape[0], base_arr.shape[1]
-
-    detail_tiled = _tile_sample_bilinear(detail_arr, w, h, tiling_x, tiling_y)
-
-    base_xy = base_arr[:, :, :2] * 2.0 - 1.0
-    detail_xy = detail_tiled[:, :, :2] * 2.0 - 1.0
-
-    xy = np.clip(base_xy + detail_xy, -1.0, 1.0)
-    z = np.sqrt(np.clip(1.0 - np.sum(xy * xy, axis=-1), 0.0, 1.0))
-
-    result = np.empty((h, w, 4), dtype=np.float32)
-    result[:, :, 0:2] = xy * 0.5 + 0.5
-    result[:, :, 2] = z * 0.5 + 0.5
-    result[:, :, 3] = base_arr[:, :, 3]
-
-    out_path = os.path.join(out_dir, f"{name_hint}.png")
-    tmp_out = "__tex_convert_detail_out"
-    if tmp_out in bpy.data.images:
-        bpy.data.images.remove(bpy.data.images[tmp_out])
-    out_img = bpy.data.images.new(tmp_out, width=w, height=h, alpha=True)
-    out_img.colorspace_settings.name = 'Non-Color'
-    out_img.pixels[:] = result.flatten().tolist()
-    out_img.filepath_raw = out_path
-    out_img.file_format = 'PNG'
-    out_img.save()
-    bpy.data.images.remove(out_img)
-    return out_path
+    base = cc.load_planes(base_path, (0, 1, 3))
+    detail = cc.load_planes(detail_path, (0, 1))
+    h, w = base[0].shape
+    # Bottom row first, as Blender hands pixels over: the tiling phase of a
+    # non-integer tiling factor depends on which edge row 0 is.
+    detail_arr = np.flipud(np.stack([detail[0], detail[1]], axis=-1))
+    del detail
+
+    def blend_band(r0, r1):
+        # File rows r0..r1 are Blender rows h - r1..h - r0, upside down.
+        detail_xy = np.flipud(_tile_sample_bilinear(
+            detail_arr, w, h, tiling_x, tiling_y, rows=(h - r1, h - r0))) * 2.0 - 1.0
+        base_xy = np.stack([cc.to_float(base[0][r0:r1]), cc.to_float(base[1][r0:r1])],
+                           axis=-1) * 2.0 - 1.0
+
+        xy = np.clip(base_xy + detail_xy, -1.0, 1.0)
+        z = np.sqrt(np.clip(1.0 - np.sum(xy * xy, axis=-1), 0.0, 1.0))
+
+        band = np.empty((r1 - r0, w, 4), dtype=np.float32)
+        band[:, :, 0:2] = xy * 0.5 + 0.5
+        band[:, :, 2] = z * 0.5 + 0.5
+        band[:, :, 3] = cc.to_float(base[3][r0:r1])
+        return band
+
+    return _write_bands(os.path.join(out_dir, f"{name_hint}.png"), w, h, blend_band,
+                        np.float32)
 
 
 # ── Color adjust (COLOR preset only) ────────────────────────────────────────
@@ -513,34 +531,23 @@ def _apply_color_adjust(rgb, exposure, saturation, vibrance):
 
 def _apply_color_adjustments(path, exposure, saturation, vibrance, out_dir, name_hint):
     """Load *path*, run _apply_color_adjust over its RGB (alpha untouched),
-    and save the result as a new PNG in out_dir. Mirrors the load/save pattern
-    _blend_detail_normal uses above."""
+    and save the result as a new PNG in out_dir, at the source's bit depth."""
     import numpy as np
+    from . import channel_compose as cc
 
-    tmp_name = "__tex_convert_coloradj"
-    if tmp_name in bpy.data.images:
-        bpy.data.images.remove(bpy.data.images[tmp_name])
-    img = bpy.data.images.load(path, check_existing=False)
-    img.name = tmp_name
-    img.colorspace_settings.name = 'Non-Color'
-    w, h = img.size
-    arr = np.array(img.pixels[:], dtype=np.float32).reshape(h, w, 4)
-    bpy.data.images.remove(img)
-
-    arr[:, :, :3] = _apply_color_adjust(arr[:, :, :3], exposure, saturation, vibrance)
-
-    out_path = os.path.join(out_dir, f"{name_hint}.png")
-    tmp_out = "__tex_convert_coloradj_out"
-    if tmp_out in bpy.data.images:
-        bpy.data.images.remove(bpy.data.images[tmp_out])
-    out_img = bpy.data.images.new(tmp_out, width=w, height=h, alpha=True)
-    out_img.colorspace_settings.name = 'Non-Color'
-    out_img.pixels[:] = arr.flatten().tolist()
-    out_img.filepath_raw = out_path
-    out_img.file_format = 'PNG'
-    out_img.save()
-    bpy.data.images.remove(out_img)
-    return out_path
+    planes = cc.load_planes(path, range(4))
+    h, w = planes[0].shape
+    dtype = cc.common_dtype(planes.values())
+
+    def adjust_band(r0, r1):
+        rgb = np.stack([cc.to_float(planes[c][r0:r1]) for c in range(3)], axis=-1)
+        band = np.empty((r1 - r0, w, 4), dtype=dtype)
+        band[:, :, :3] = cc.from_float(_apply_color_adjust(rgb, exposure, saturation, vibrance),
+                                       dtype)
+        band[:, :, 3] = cc.convert(planes[3][r0:r1], dtype)
+        return band
+
+    return _write_bands(os.path.join(out_dir, f"{name_hint}.png"), w, h, adjust_band, dtype)
 
 
 def _import_mhwtex_convert():
@@ -912,9 +919,9 @@ class MT_OT_TexConvertDialog(bpy.types.Operator):
                     png_path, s.adjust_exposure, s.adjust_saturation, s.adjust_vibrance,
                     temp_dir, "tex_convert_coloradj")
 
-            from . import texconv_native
+            from . import tex_encoder
             resize = (s.out_width, s.out_height) if s.resize_enabled else None
-            dds_path = texconv_native.convert_to_dds(
+            dds_path = tex_encoder.convert_to_dds(
                 png_path, s.format, temp_dir, generate_mips=s.generate_mipmaps,
                 size=resize)
 
@@ -951,6 +958,10 @@ class MT_OT_TexConvertDialog(bpy.types.Operator):
 # unrecognised filename falls back to BC7_UNORM_SRGB rather than linear:
 # a colour map wrongly tagged linear washes out visibly, while a mask wrongly
 # tagged sRGB is the quieter mistake to make.
+#
+# The files convert on a worker pool (core/batch_convert.py), as many at once
+# as the Texture Workers preference allows, with the operator running modal
+# so progress and failures show while it works and Esc stops the rest.
 _DROP_FALLBACK_FORMAT = 'BC7_UNORM_SRGB'
 
 _DROP_EXTENSIONS = ".png;.tga;.jpg;.jpeg;.bmp;.tif;.tiff;.dds"
@@ -961,12 +972,104 @@ class TexDropItem(bpy.types.PropertyGroup):
     format: bpy.props.EnumProperty(name="", items=get_format_items)
 
 
-class MT_OT_TexDropToDDS(bpy.types.Operator):
+class _TexDropBatch:
+    """Modal driving of a batch_convert.BatchRun, shared by both drop operators.
+    Each operator defines ``_batch_jobs(context)``, returning its BatchJobs."""
+
+    _done_key    = ""
+    _partial_key = ""
+
+    _run   = None
+    _timer = None
+    _seen  = 0
+
+    def execute(self, context):
+        from . import batch_convert
+        from .mdf_tex_processor_base import texture_workers
+
+        jobs = self._batch_jobs(context)
+        if not jobs:
+            self.report({'ERROR'}, T("core.tex_convert_base.drop_no_files"))
+            return {'CANCELLED'}
+        run = batch_convert.BatchRun(jobs, texture_workers())
+        if context.window is None:
+            # Scripted or background call: no event loop to go modal on.
+            try:
+                while run.step(0.25):
+                    run.pipeline.poll(timeout=0.05)
+            finally:
+                run.finish()
+            return self._report_run(run)
+
+        self._run = run
+        self._seen = 0
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, max(run.total, 1))
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        run = self._run
+        if event.type == 'ESC' and event.value == 'PRESS':
+            if not run.cancelled:
+                run.cancel()
+            return {'RUNNING_MODAL'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        running = run.step(0.05)
+        for job, err in run.results[self._seen:]:
+            if err is not None:
+                self.report({'WARNING'}, T("core.tex_convert_base.drop_file_failed").format(
+                    name=job.name, err=err))
+        self._seen = len(run.results)
+        if running:
+            context.window_manager.progress_update(run.handled)
+            last = run.last[0].name if run.last else ""
+            context.workspace.status_text_set(T("core.tex_convert_base.drop_progress").format(
+                done=run.handled, total=run.total, name=last))
+            return {'RUNNING_MODAL'}
+        self._end_modal(context)
+        return self._report_run(run)
+
+    def cancel(self, context):
+        # Blender tearing the operator down (window closed, file loaded).
+        if self._run is not None:
+            self._run.cancel()
+            self._end_modal(context)
+
+    def _end_modal(self, context):
+        wm = context.window_manager
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        if context.workspace is not None:
+            context.workspace.status_text_set(None)
+        self._run.finish()
+        self._run = None
+
+    def _report_run(self, run):
+        failed = "; ".join("%s (%s)" % (job.name, err) for job, err in run.failed)
+        if run.cancelled:
+            self.report({'WARNING'}, T("core.tex_convert_base.drop_cancelled").format(
+                n=run.done, total=run.total))
+        elif failed:
+            self.report({'WARNING'}, T(self._partial_key).format(n=run.done, failed=failed))
+        else:
+            self.report({'INFO'}, T(self._done_key).format(n=run.done))
+        return {'FINISHED'}
+
+
+class MT_OT_TexDropToDDS(_TexDropBatch, bpy.types.Operator):
     """Convert the dropped images to DDS"""
     bl_idname = "mt.tex_drop_to_dds"
     bl_label = "Convert to DDS"
     bl_options = {'REGISTER'}
 
+    _done_key    = "core.tex_convert_base.drop_done"
+    _partial_key = "core.tex_convert_base.drop_partial"
+
     directory: bpy.props.StringProperty(subtype='DIR_PATH', options={'SKIP_SAVE', 'HIDDEN'})
     files: bpy.props.CollectionProperty(type=bpy.types.OperatorFileListElement,
                                         options={'SKIP_SAVE', 'HIDDEN'})
@@ -1008,32 +1111,14 @@ class MT_OT_TexDropToDDS(bpy.types.Operator):
             row.prop(entry, "format", text="")
         layout.prop(self, "generate_mipmaps", text=T("core.tex_convert_base.generate_mipmaps_name"))
 
-    def execute(self, context):
-        from . import texconv_native
+    def _batch_jobs(self, context):
+        from . import batch_convert, tex_encoder
 
-        items = list(context.scene.tex_drop_items)
-        done, failed = 0, []
-        for entry in items:
-            src = entry.filepath
-            out_path = os.path.splitext(src)[0] + ".dds"
-            temp_dir = tempfile.mkdtemp(prefix="tex_drop_")
-            try:
-                dds_path = texconv_native.convert_to_dds(
-                    src, entry.format, temp_dir, generate_mips=self.generate_mipmaps)
-                shutil.copy2(dds_path, out_path)
-                done += 1
-            except Exception as err:
-                failed.append("%s (%s)" % (os.path.basename(src), err))
-            finally:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-
-        context.scene.tex_drop_items.clear()
-        if failed:
-            self.report({'WARNING'}, T("core.tex_convert_base.drop_partial").format(
-                n=done, failed="; ".join(failed)))
-        else:
-            self.report({'INFO'}, T("core.tex_convert_base.drop_done").format(n=done))
-        return {'FINISHED'}
+        items = context.scene.tex_drop_items
+        entries = [(entry.filepath, entry.format) for entry in items]
+        items.clear()
+        backend, quality = tex_encoder.preferences()
+        return batch_convert.dds_jobs(entries, self.generate_mipmaps, backend, quality)
 
 
 class MT_FH_TexDropToDDS(bpy.types.FileHandler):
@@ -1053,12 +1138,15 @@ class MT_FH_TexDropToDDS(bpy.types.FileHandler):
 # format choice is needed here (decoding always targets plain R8G8B8A8), so this
 # skips tex_drop_items and just lists the file names for confirmation.
 
-class MT_OT_TexDropToPNG(bpy.types.Operator):
+class MT_OT_TexDropToPNG(_TexDropBatch, bpy.types.Operator):
     """Decode the dropped DDS to PNG (stored bytes only, no gamma conversion)"""
     bl_idname = "mt.tex_drop_to_png"
     bl_label = "Convert to PNG"
     bl_options = {'REGISTER'}
 
+    _done_key    = "core.tex_convert_base.drop_png_done"
+    _partial_key = "core.tex_convert_base.drop_png_partial"
+
     directory: bpy.props.StringProperty(subtype='DIR_PATH', options={'SKIP_SAVE', 'HIDDEN'})
     files: bpy.props.CollectionProperty(type=bpy.types.OperatorFileListElement,
                                         options={'SKIP_SAVE', 'HIDDEN'})
@@ -1087,28 +1175,9 @@ class MT_OT_TexDropToPNG(bpy.types.Operator):
         for path in paths:
             box.label(text=os.path.basename(path))
 
-    def execute(self, context):
-        from . import texconv_native
-
-        done, failed = 0, []
-        for src in self._paths():
-            out_path = os.path.splitext(src)[0] + ".png"
-            temp_dir = tempfile.mkdtemp(prefix="tex_drop_png_")
-            try:
-                png_path = texconv_native.convert_to_png(src, temp_dir)
-                shutil.copy2(png_path, out_path)
-                done += 1
-            except Exception as err:
-                failed.append("%s (%s)" % (os.path.basename(src), err))
-            finally:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-
-        if failed:
-            self.report({'WARNING'}, T("core.tex_convert_base.drop_png_partial").format(
-                n=done, failed="; ".join(failed)))
-        else:
-            self.report({'INFO'}, T("core.tex_convert_base.drop_png_done").format(n=done))
-        return {'FINISHED'}
+    def _batch_jobs(self, context):
+        from . import batch_convert
+        return batch_convert.png_jobs(self._paths())
 
 
 class MT_FH_TexDropToPNG(bpy.types.FileHandler):
@@ -0,0 +1,208 @@
+"""Image -> DDS encoding with a choice of backend: texconv or NumPy.
+
+Every texture write used to call ``texconv_native.convert_to_dds`` directly, and
+that needs ``assets/bin/texconv/texconv.dll`` -- on Linux (a headless Blender on
+a farm machine, say) slot writes, the MDF texture processor and the conversion
+dialog could not produce anything at all.  This module sits where those calls
+were, with the same signature, and routes each one:
+
+* ``TEXCONV`` -- the DLL, exactly as before.
+* ``NUMPY``   -- ``core/bcn_encode.py``.  Formats it does not encode (BC2,
+  BC6H, ...) still go to texconv, which then fails the way it always did.
+* ``AUTO``    -- texconv when the DLL loads, NumPy otherwise.  The default,
+  so a Windows install keeps producing byte-identical output.
+
+The choice is made per call from the DXGI format name the callers already pass,
+so no caller needs to know which backend ran.  The backend and the NumPy BC7
+quality tier are addon preferences (``MT_Preferences``); outside Blender, or
+before the addon is registered, the defaults apply.
+"""
+
+import os
+
+from . import dxgi_format as dxgi
+
+BACKENDS = ('AUTO', 'TEXCONV', 'NUMPY')
+
+_texconv_ok = None
+
+
+def texconv_available():
+    """True when texconv's DLL can actually be loaded here.  Cached: whether
+    the DLL loads does not change within a session."""
+    global _texconv_ok
+    if _texconv_ok is None:
+        from . import texconv_native
+        try:
+            texconv_native._load_dll()
+            _texconv_ok = True
+        except (OSError, RuntimeError, AttributeError):
+            # AttributeError: ctypes has no windll off Windows.
+            _texconv_ok = False
+    return _texconv_ok
+
+
+def preferences():
+    """(backend, bc7 quality) from the addon preferences, or the defaults.
+    Reads ``bpy``: callers on a worker thread take these on the main thread
+    first and pass them in as *backend* / *quality*."""
+    from .addon_prefs import pref
+    return pref('texture_encoder', 'AUTO'), pref('numpy_bc7_quality', 'NORMAL')
+
+
+def pick_backend(dxgi_format_name, backend=None):
+    """'TEXCONV' or 'NUMPY' for one conversion to *dxgi_format_name*."""
+    from . import bcn_encode
+
+    backend = backend or preferences()[0]
+    fmt = dxgi.DXGI_FORMAT.get(dxgi_format_name)
+    if fmt is None or not bcn_encode.can_encode(fmt):
+        return 'TEXCONV'
+    if backend == 'NUMPY':
+        return 'NUMPY'
+    if backend == 'TEXCONV' or texconv_available():
+        return 'TEXCONV'
+    return 'NUMPY'
+
+
+def encoder_signature(dxgi_format_name, backend=None, quality=None):
+    """Which encoder, at which setting, would produce *dxgi_format_name* right
+    now -- for caches keyed on output bytes (core/slot_cache.py)."""
+    picked = pick_backend(dxgi_format_name, backend)
+    return picked if picked == 'TEXCONV' else f"NUMPY:{quality or preferences()[1]}"
+
+
+def convert_to_dds(filepath, dxgi_format_name, out_dir, generate_mips=True,
+                   image_filter="CUBIC", verbose=False, allow_slow_codec=False,
+                   size=None, backend=None, quality=None):
+    """texconv_native.convert_to_dds, on whichever backend pick_backend chooses.
+
+    Same contract either way: the result is ``<out_dir>/<input stem>.dds``
+    (slot_resolver.write_slot_tex looks for exactly that name), sRGB is a tag
+    only, and signed formats get the -x2bias mapping.  *backend* and *quality*
+    override the preferences for this one call.
+
+    Returns the path to the resulting .dds file.
+    """
+    if not dxgi.is_valid_format_name(dxgi_format_name):
+        raise ValueError(f"Not a known DXGI format: {dxgi_format_name}")
+
+    if pick_backend(dxgi_format_name, backend) == 'TEXCONV':
+        from . import texconv_native
+        return texconv_native.convert_to_dds(
+            filepath, dxgi_format_name, out_dir, generate_mips=generate_mips,
+            image_filter=image_filter, verbose=verbose,
+            allow_slow_codec=allow_slow_codec, size=size)
+
+    return _convert_numpy(filepath, dxgi_format_name, out_dir, generate_mips,
+                          image_filter, size, quality or preferences()[1])
+
+
+# ── NumPy backend ────────────────────────────────────────────────────────────
+
+def encode_array(pixels, dxgi_format_name, generate_mips=True, mip_filter='CUBIC',
+                 normal=None, quality=None):
+    """An in-memory ``(h, w, 4)`` image (top row first) -> a dds_file.DDSFile,
+    mips and all, with no file on either side.
+
+    The NumPy backend's whole pipeline, for callers that already hold the
+    pixels (the compose path) and would otherwise save a PNG only for it to be
+    read straight back.  *pixels* is float32 in 0..1, or uint8/uint16 as
+    the compose path produces it (core/channel_compose.py); uint8 goes to the
+    block encoder as is, and only the mips below it are filtered in float.
+    *mip_filter* and *normal* go to mip_chain.build_mip_chain.
+    """
+    import numpy as np
+
+    from . import bcn_encode, channel_compose, dds_file, mip_chain
+
+    fmt = dxgi.DXGI_FORMAT[dxgi_format_name]
+    if not bcn_encode.can_encode(fmt):
+        raise ValueError(f"The NumPy encoder does not support {dxgi_format_name}")
+    quality = quality or preferences()[1]
+
+    dds = dds_file.DDSFile()
+    dds.height, dds.width = pixels.shape[:2]
+    dds.dxgi_format = fmt
+    if pixels.dtype.kind in 'ui':
+        top = np.ascontiguousarray(channel_compose.convert(pixels, np.uint8))
+        dds.mips = [bcn_encode.encode_mip(top, fmt, quality)]
+        del top
+        if generate_mips:
+            levels = mip_chain.build_mip_chain(channel_compose.to_float(pixels), mip_filter,
+                                               normal=normal)
+            del levels[0]
+        else:
+            levels = []
+    else:
+        levels = (mip_chain.build_mip_chain(pixels, mip_filter, normal=normal)
+                  if generate_mips else [pixels])
+        dds.mips = []
+    dds.mips += [bcn_encode.encode_mip(np.rint(np.clip(level, 0.0, 1.0) * 255.0).astype(np.uint8),
+                                       fmt, quality)
+                 for level in levels]
+    dds.mip_count = len(dds.mips)
+    return dds
+
+
+def _convert_numpy(filepath, dxgi_format_name, out_dir, generate_mips, image_filter,
+                   size, quality):
+    from . import dds_file, mip_chain
+
+    pixels = load_rgba(filepath, size)
+    mip_filter = mip_chain.TEXCONV_FILTER_NAMES.get((image_filter or 'CUBIC').upper(), 'CUBIC')
+    dds = encode_array(pixels, dxgi_format_name, generate_mips, mip_filter, quality=quality)
+
+    out_dir = out_dir or '.'
+    os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, os.path.splitext(os.path.basename(filepath))[0] + '.dds')
+    dds_file.write_dds(dds, out_path)
+    return out_path
+
+
+def load_rgba(filepath, size=None, blender=True):
+    """A source image as ``(h, w, 4)`` float32 in 0..1, top row first.
+
+    DDS sources are decoded by core/bcn_decode.py and PNG/TGA by
+    core/image_io.py; anything else (JPG/BMP/TIFF, an interlaced PNG) goes
+    through Blender's own image loader.  Every route hands back the stored
+    values regardless of any colour-space tag -- the same never-gamma-convert
+    rule convert_to_dds keeps.  Only the Blender route needs the main thread;
+    ``blender=False`` raises image_io.UnsupportedImage instead of taking it.
+    """
+    import numpy as np
+
+    if filepath.lower().endswith('.dds'):
+        from . import bcn_decode, dds_file
+        return _fit(bcn_decode.decode_dds(dds_file.read_dds(filepath)), size)
+
+    from . import image_io
+    if image_io.can_read(filepath):
+        try:
+            pix = image_io.read_rgba(filepath)
+        except image_io.UnsupportedImage:
+            if not blender:
+                raise
+        else:
+            return _fit(pix, size)
+    if not blender:
+        raise image_io.UnsupportedImage(f"Needs Blender's image loader: {filepath}")
+
+    import bpy
+    from .mdf_tex_processor_base import image_to_array
+
+    img = bpy.data.images.load(filepath, check_existing=False)
+    try:
+        img.colorspace_settings.name = 'Non-Color'
+        pix = image_to_array(img)
+    finally:
+        bpy.data.images.remove(img)
+    return _fit(np.ascontiguousarray(np.flipud(pix)), size)
+
+
+def _fit(pix, size):
+    """*pix* resized to *size* ``(width, height)``; as is without one."""
+    if size and (int(size[0]), int(size[1])) != (pix.shape[1], pix.shape[0]):
+        from . import mip_chain
+        pix = mip_chain.resize(pix, int(size[0]), int(size[1]))
+    return pix
@@ -13,8 +13,13 @@ format — this writer structurally can't have that bug since there's only one
 representation of the format, end to end.
 """
 
+import io
+import mmap
+import os
 import struct
 
+import numpy as np
+
 from . import dxgi_format as dxgi
 from . import gdeflate_native
 
@@ -43,162 +48,260 @@ def _pad_to_256(pitch):
     return ((pitch + 255) // 256) * 256
 
 
-def _build_uncompressed(dds, tex_version):
-    """Build the plain (pre-GDeflate) .tex byte layout: header + mip table + padded pixel data.
-    Returns (header_bytes, mip_table_bytes, mip_records, body_bytes) where mip_records
-    is a list of (offset, pitch, size) describing each mip's position within the full file.
-    """
-    mip_count = len(dds.mips)
-    mip_header_size = mip_count * MIP_HEADER_SIZE
-
-    header_bytes = _HEADER_STRUCT.pack(
-        TEX_MAGIC, tex_version, dds.width, dds.height, 1,   # depth = 1 (no volume textures)
-        1, mip_header_size,                                  # imageCount = 1 (no arrays)
-        dds.dxgi_format, -1, 0, 0,                            # format, swizzleControl=-1, cubemapMarker=0, flags=0
-        0, 0, 0, 0, 0,                                        # modern trailer fields, all 0
-    )
-    data_start = len(header_bytes) + mip_header_size
-
-    body = bytearray()
-    mip_records = []
-    w, h = dds.width, dds.height
-    for level in range(mip_count):
+def _mip_layout(dds):
+    """[(pitch, padded_pitch, padded_size)] per mip, from the DDS header and mip
+    lengths alone -- enough to write the whole mip table before any pixel data
+    is touched."""
+    layout = []
+    w = dds.width
+    for raw in dds.mips:
         w = max(1, w)
-        h = max(1, h)
-        raw = dds.mips[level]
         real_pitch = dxgi.get_pitch(dds.dxgi_format, w)
         padded_pitch = _pad_to_256(real_pitch)
-        pad = padded_pitch - real_pitch
-
-        mip_start = len(body)
-        if pad == 0:
-            body += raw
-        else:
-            for row_start in range(0, len(raw), real_pitch):
-                body += raw[row_start:row_start + real_pitch]
-                body += b'\x00' * pad
-        mip_size = len(body) - mip_start
-
-        mip_records.append((data_start + mip_start, padded_pitch, mip_size))
+        rows = -(-len(raw) // real_pitch)
+        layout.append((real_pitch, padded_pitch, len(raw) + rows * (padded_pitch - real_pitch)))
         w >>= 1
-        h >>= 1
+    return layout
 
-    mip_table_bytes = b''.join(_MIP_HEADER_STRUCT.pack(off, pitch, size) for off, pitch, size in mip_records)
-    return header_bytes, mip_table_bytes, mip_records, bytes(body)
 
+def _padded_mip(raw, real_pitch, padded_pitch):
+    """*raw* with every row zero-padded from *real_pitch* to *padded_pitch* bytes.
 
-def _apply_gdeflate(header_bytes, mip_table_bytes, mip_records, body, level=gdeflate_native.BEST_RATIO):
-    """Recompress the mip data section with GDeflate, matching REE-Content-Editor's
-    TextureLoader.SaveTo: every mip is compressed individually, falling back to storing
-    it raw only if compression yields nothing."""
-    data_start = mip_records[0][0]  # == len(header_bytes) + len(mip_table_bytes)
+    Returned as is when no row needs padding (every BC7 mip 64 px wide or more),
+    otherwise copied once: the rows land in the padded buffer through a strided
+    view in a single assignment, not a Python loop over them.
+    """
+    if padded_pitch == real_pitch:
+        return raw
+    rows, tail = divmod(len(raw), real_pitch)
+    out = np.zeros(len(raw) + (rows + bool(tail)) * (padded_pitch - real_pitch), dtype=np.uint8)
+    src = np.frombuffer(raw, dtype=np.uint8)
+    body = rows * padded_pitch
+    out[:body].reshape(rows, padded_pitch)[:, :real_pitch] = src[:rows * real_pitch].reshape(rows, real_pitch)
+    if tail:
+        out[body:body + tail] = src[rows * real_pitch:]
+    return out.data
+
+
+def gdeflate_workers():
+    """Thread count for GDeflate: the addon preference, 0 meaning one per CPU
+    core (the default outside Blender too)."""
+    from .addon_prefs import pref
+    workers = pref('gdeflate_threads', 0)
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def _resolve_level(level):
+    """A GDeflate level as an int; accepts gdeflate_native.LEVELS names. None
+    is BEST_RATIO, what every MHWS/RE9 export used before the level became a
+    setting."""
+    if level is None:
+        return gdeflate_native.BEST_RATIO
+    if isinstance(level, str):
+        return gdeflate_native.LEVELS[level]
+    return int(level)
+
+
+def write_tex(f, dds, tex_version, gdeflate_level=None, workers=None):
+    """Stream a dds_file.DDSFile to the binary file object *f* as an RE Engine .tex.
+
+    Header and mip table go out first -- the table is computed up front from
+    the pitches -- then each mip, padded on its own, so beyond the DDS itself
+    at most one padded mip (or, for GDeflate, the mips in flight on the pool)
+    is held at a time.  Nothing builds the whole file in memory.
+
+    gdeflate_level / workers only matter for GDEFLATE_VERSIONS: the level as
+    an int or a gdeflate_native.LEVELS name (default BEST_RATIO), and the
+    thread count (default gdeflate_workers()).  *f* must be seekable for
+    those: the compressed-size table precedes the data it describes, so it is
+    reserved, and filled in once the last mip is out.
+    """
+    layout = _mip_layout(dds)
+    mip_header_size = len(layout) * MIP_HEADER_SIZE
 
+    f.write(_HEADER_STRUCT.pack(
+        TEX_MAGIC, tex_version, dds.width, dds.height, 1,   # depth = 1 (no volume textures)
+        1, mip_header_size,                                  # imageCount = 1 (no arrays)
+        dds.dxgi_format, -1, 0, 0,                            # format, swizzleControl=-1, cubemapMarker=0, flags=0
+        0, 0, 0, 0, 0,                                        # modern trailer fields, all 0
+    ))
+    offset = _HEADER_STRUCT.size + mip_header_size
+    for _real_pitch, padded_pitch, size in layout:
+        f.write(_MIP_HEADER_STRUCT.pack(offset, padded_pitch, size))
+        offset += size
+
+    def padded_mips():
+        for raw, (real_pitch, padded_pitch, _size) in zip(dds.mips, layout):
+            yield _padded_mip(raw, real_pitch, padded_pitch)
+
+    if tex_version not in GDEFLATE_VERSIONS:
+        for mip in padded_mips():
+            f.write(mip)
+        return
+
+    # Matching REE-Content-Editor's TextureLoader.SaveTo: every mip is
+    # compressed individually, falling back to storing it raw only if
+    # compression yields nothing (or the codec is unavailable).
+    table_pos = f.tell()
+    f.write(bytes(len(layout) * _COMPRESSED_MIP_HEADER_STRUCT.size))
     compressed_headers = []
-    compressed_chunks = []
     running_offset = 0
-    for (off, _pitch, size) in mip_records:
-        rel_start = off - data_start
-        raw_mip = body[rel_start:rel_start + size]
-        try:
-            comp = gdeflate_native.compress(raw_mip, level=level)
-        except Exception:
-            comp = b''
+    chunks = gdeflate_native.compress_iter(
+        padded_mips(), level=_resolve_level(gdeflate_level),
+        workers=gdeflate_workers() if workers is None else workers, skip_errors=True)
+    for level, comp in enumerate(chunks):
         if not comp:
-            comp = raw_mip
-        compressed_headers.append((len(comp), running_offset))
-        compressed_chunks.append(comp)
-        running_offset += len(comp)
-
-    compressed_header_bytes = b''.join(
-        _COMPRESSED_MIP_HEADER_STRUCT.pack(size, off) for size, off in compressed_headers
-    )
-    return header_bytes + mip_table_bytes + compressed_header_bytes + b''.join(compressed_chunks)
-
-
-def build_tex_from_dds(dds, tex_version):
-    """Pack a dds_file.DDSFile into RE Engine .tex container bytes for tex_version."""
-    header_bytes, mip_table_bytes, mip_records, body = _build_uncompressed(dds, tex_version)
-    if tex_version in GDEFLATE_VERSIONS:
-        return _apply_gdeflate(header_bytes, mip_table_bytes, mip_records, body)
-    return header_bytes + mip_table_bytes + body
-
-
-def write_tex_from_dds(dds_filepath, tex_version, out_path):
+            real_pitch, padded_pitch, _size = layout[level]
+            comp = _padded_mip(dds.mips[level], real_pitch, padded_pitch)
+        size = memoryview(comp).nbytes
+        f.write(comp)
+        compressed_headers.append(_COMPRESSED_MIP_HEADER_STRUCT.pack(size, running_offset))
+        running_offset += size
+    end = f.tell()
+    f.seek(table_pos)
+    f.write(b''.join(compressed_headers))
+    f.seek(end)
+
+
+def build_tex_from_dds(dds, tex_version, gdeflate_level=None, workers=None):
+    """Pack a dds_file.DDSFile into RE Engine .tex container bytes for tex_version.
+    write_tex into memory; prefer write_tex itself when the bytes are headed for
+    a file anyway."""
+    buf = io.BytesIO()
+    write_tex(buf, dds, tex_version, gdeflate_level, workers)
+    return buf.getvalue()
+
+
+def write_tex_from_dds(dds_filepath, tex_version, out_path, gdeflate_level=None, workers=None):
     """Read a DX10 DDS file and write it out as an RE Engine .tex file."""
     from . import dds_file
     dds = dds_file.read_dds(dds_filepath)
-    data = build_tex_from_dds(dds, tex_version)
     with open(out_path, 'wb') as f:
-        f.write(data)
+        write_tex(f, dds, tex_version, gdeflate_level, workers)
     return out_path
 
 
-def read_tex_to_dds(filepath, all_mips=False):
-    """Read an RE Engine .tex file into a dds_file.DDSFile.
+class MappedTex:
+    """An RE Engine .tex file mapped into memory rather than read into it.
 
-    Mip 0 only by default -- the texture repack works at full resolution and
-    regenerates mips on write, same as the existing compose path
-    (mdf_tex_processor_base._compose_channels + write_slot_tex), so reading the
-    rest would only be thrown away.  ``all_mips=True`` reads the whole chain,
-    which is what carrying a texture across unchanged needs: re-deriving mips
-    from mip 0 would replace the ones the author shipped.
+    Header fields are there on open (a page read); ``mip(level)`` hands out one
+    mip at a time as a memoryview, inflating only that mip's GDeflate chunk and
+    stripping write_tex's 256-byte row padding only when there is any -- a
+    plain unpadded mip is a view straight into the file.  Context manager, or
+    close(); same lifetime rule as dds_file.MappedDDS.
 
-    Inverse of build_tex_from_dds, but not a strict mirror of it:
-    build_tex_from_dds starts from a dds_file.DDSFile, this starts from raw
-    container bytes, so it has to parse the header instead of assuming the
-    layout it just wrote.
+    Raises ValueError for anything that is not a .tex.
     """
-    from . import dds_file
-
-    with open(filepath, 'rb') as f:
-        data = f.read()
-
-    (magic, version, width, height, _depth, _image_count, mip_header_size,
-     dxgi_fmt, _swizzle_control, _cubemap_marker, _flags,
-     _swizzle_h, _swizzle_w, _null1, _seven, _one) = _HEADER_STRUCT.unpack_from(data, 0)
-    if magic != TEX_MAGIC:
-        raise ValueError(f"Not a .tex file: {filepath}")
-
-    header_size = _HEADER_STRUCT.size
-    mip_count = mip_header_size // MIP_HEADER_SIZE
-    if mip_count < 1:
-        raise ValueError(f".tex file has no mips: {filepath}")
 
-    data_start = header_size + mip_header_size
-    gdeflate = version in GDEFLATE_VERSIONS
-    chunk_start = data_start + mip_count * _COMPRESSED_MIP_HEADER_STRUCT.size
-
-    def read_mip(level):
+    def __init__(self, filepath):
+        with open(filepath, 'rb') as f:
+            # ValueError for an empty file, same as a bad magic would be.
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+        try:
+            self._parse(filepath)
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self, filepath):
+        (magic, version, width, height, _depth, _image_count, mip_header_size,
+         dxgi_fmt, _swizzle_control, _cubemap_marker, _flags,
+         _swizzle_h, _swizzle_w, _null1, _seven, _one) = _HEADER_STRUCT.unpack_from(self._view, 0)
+        if magic != TEX_MAGIC:
+            raise ValueError(f"Not a .tex file: {filepath}")
+        mip_count = mip_header_size // MIP_HEADER_SIZE
+        if mip_count < 1:
+            raise ValueError(f".tex file has no mips: {filepath}")
+
+        self.version = version
+        self.width = width
+        self.height = height
+        self.mip_count = mip_count
+        self.dxgi_format = dxgi_fmt
+        self.gdeflate = version in GDEFLATE_VERSIONS
+        self._data_start = _HEADER_STRUCT.size + mip_header_size
+        self._chunk_start = self._data_start + mip_count * _COMPRESSED_MIP_HEADER_STRUCT.size
+
+    @property
+    def is_srgb(self):
+        return dxgi.is_srgb(self.dxgi_format)
+
+    def mip(self, level):
+        """Mip *level*'s pixel data, unpadded, as a memoryview."""
+        if not 0 <= level < self.mip_count:
+            raise IndexError(f"mip {level} out of range (0..{self.mip_count - 1})")
+        data = self._view
         offset, pitch, size = _MIP_HEADER_STRUCT.unpack_from(
-            data, header_size + level * MIP_HEADER_SIZE)
-        if gdeflate:
+            data, _HEADER_STRUCT.size + level * MIP_HEADER_SIZE)
+        if self.gdeflate:
             comp_size, comp_off = _COMPRESSED_MIP_HEADER_STRUCT.unpack_from(
-                data, data_start + level * _COMPRESSED_MIP_HEADER_STRUCT.size)
-            chunk = data[chunk_start + comp_off: chunk_start + comp_off + comp_size]
+                data, self._data_start + level * _COMPRESSED_MIP_HEADER_STRUCT.size)
+            chunk = data[self._chunk_start + comp_off: self._chunk_start + comp_off + comp_size]
             try:
-                raw = gdeflate_native.decompress(chunk)
+                raw = memoryview(gdeflate_native.decompress(chunk))
             except Exception:
-                # compress() stores a mip raw when GDeflate saves nothing (common
+                # write_tex stores a mip raw when GDeflate saves nothing (common
                 # for already-compressed BC7 data) -- comp_size then equals the raw
                 # padded mip size and chunk already *is* the mip.
                 raw = chunk
         else:
             raw = data[offset: offset + size]
 
-        # Strip the 256-byte row padding _build_uncompressed added on write.
-        real_pitch = dxgi.get_pitch(dxgi_fmt, max(1, width >> level))
+        real_pitch = dxgi.get_pitch(self.dxgi_format, max(1, self.width >> level))
         if pitch != real_pitch:
             rows = len(raw) // pitch
-            raw = b''.join(raw[r * pitch: r * pitch + real_pitch] for r in range(rows))
+            padded = np.frombuffer(raw, dtype=np.uint8, count=rows * pitch).reshape(rows, pitch)
+            raw = memoryview(np.ascontiguousarray(padded[:, :real_pitch])).cast('B')
         return raw
 
-    levels = range(mip_count) if all_mips else range(1)
-    mips = [read_mip(i) for i in levels]
+    def to_dds(self, levels=None):
+        """A dds_file.DDSFile holding copies of *levels* (default: every mip)."""
+        from . import dds_file
+
+        levels = range(self.mip_count) if levels is None else levels
+        dds = dds_file.DDSFile()
+        dds.width = self.width
+        dds.height = self.height
+        dds.dxgi_format = self.dxgi_format
+        dds.mips = [bytes(self.mip(i)) for i in levels]
+        dds.mip_count = len(dds.mips)
+        return dds
+
+    def close(self):
+        self._view.release()
+        try:
+            self._mm.close()
+        except BufferError:
+            pass    # a mip view is still out there; the mapping goes with it
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_tex(filepath):
+    """A MappedTex for *filepath*."""
+    return MappedTex(filepath)
 
-    dds = dds_file.DDSFile()
-    dds.width = width
-    dds.height = height
-    dds.mip_count = len(mips)
-    dds.dxgi_format = dxgi_fmt
-    dds.mips = mips
-    return dds
+
+def read_tex_to_dds(filepath, all_mips=False):
+    """Read an RE Engine .tex file into a dds_file.DDSFile.
+
+    Mip 0 only by default -- the texture repack works at full resolution and
+    regenerates mips on write, same as the existing compose path
+    (mdf_tex_processor_base._compose_channels + write_slot_tex), so reading the
+    rest would only be thrown away.  ``all_mips=True`` reads the whole chain,
+    which is what carrying a texture across unchanged needs: re-deriving mips
+    from mip 0 would replace the ones the author shipped.
+
+    Inverse of build_tex_from_dds, but not a strict mirror of it:
+    build_tex_from_dds starts from a dds_file.DDSFile, this starts from raw
+    container bytes, so it has to parse the header instead of assuming the
+    layout it just wrote.  MappedTex does the parsing; with mip 0 only, the
+    rest of the file is never read at all.
+    """
+    with MappedTex(filepath) as mapped:
+        return mapped.to_dds(None if all_mips else range(1))
@@ -0,0 +1,315 @@
+"""Header-only index of the textures under a mod root.
+
+The pre-export check stats every binding's ``.tex`` one ``os.path.isfile`` at a
+time, and the size readouts load whole images through Blender just to learn
+their dimensions -- none of it remembered between redraws, let alone between
+sessions.  On a mod tree of tens of thousands of files that is the slow part of
+the panel.
+
+This keeps, per root, every ``.tex.<version>`` / ``.dds`` / image file's width,
+height, DXGI format and mip count, read from the file header alone
+(tex_file.MappedTex / dds_file.MappedDDS for the containers, a few bytes for
+PNG/TGA/JPG/BMP).  Entries are keyed by path plus ``(mtime_ns, size)`` -- the
+same stamp, for the same reason, as mdf_generator_base._file_stamp -- and
+persisted to a small SQLite file in Blender's config directory, so a second
+session starts warm.
+
+``refresh()`` is incremental: a directory whose own mtime has not moved since the
+last scan is not re-listed (adding, removing or renaming a file moves it), so a
+rescan of an unchanged tree is one ``stat`` per directory.  A file rewritten in
+place does not move its directory's mtime; ``info(..., verify=True)`` re-stats
+that one file for callers that must not see a stale answer.
+
+Free of ``bpy`` apart from locating the config directory.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import struct
+from collections import namedtuple
+
+#: width/height are 0 when the header could not be read; dxgi_format is None
+#: for plain images.
+TexInfo = namedtuple('TexInfo', 'width height dxgi_format mip_count')
+
+_TEX_NAME = re.compile(r'\.tex\.\d+$', re.IGNORECASE)
+_IMAGE_EXTS = {'.png', '.tga', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.exr', '.hdr'}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    root TEXT, rel TEXT, mtime_ns INTEGER, subdirs TEXT,
+    PRIMARY KEY (root, rel));
+CREATE TABLE IF NOT EXISTS files (
+    root TEXT, rel TEXT, dir TEXT, mtime_ns INTEGER, size INTEGER,
+    width INTEGER, height INTEGER, dxgi_format INTEGER, mip_count INTEGER,
+    PRIMARY KEY (root, rel));
+"""
+
+
+def is_texture_name(name):
+    """True for the files the index tracks."""
+    lower = name.lower()
+    return (bool(_TEX_NAME.search(lower)) or lower.endswith('.dds')
+            or os.path.splitext(lower)[1] in _IMAGE_EXTS)
+
+
+# ── Header readers ───────────────────────────────────────────────────────────
+
+def _png_header(head):
+    if head[:8] != b'\x89PNG\r\n\x1a\n' or head[12:16] != b'IHDR':
+        return None
+    w, h = struct.unpack('>II', head[16:24])
+    return TexInfo(w, h, None, 1)
+
+
+def _tga_header(head):
+    if len(head) < 18:
+        return None
+    w, h = struct.unpack('<HH', head[12:16])
+    return TexInfo(w, h, None, 1)
+
+
+def _bmp_header(head):
+    if head[:2] != b'BM' or len(head) < 26:
+        return None
+    w, h = struct.unpack('<ii', head[18:26])
+    return TexInfo(abs(w), abs(h), None, 1)
+
+
+def _jpeg_header(f):
+    """Dimensions from the first SOFn marker; walks segment headers only."""
+    if f.read(2) != b'\xff\xd8':
+        return None
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            continue
+        seg_len = f.read(2)
+        if len(seg_len) < 2:
+            return None
+        length = struct.unpack('>H', seg_len)[0]
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            sof = f.read(5)
+            if len(sof) < 5:
+                return None
+            h, w = struct.unpack('>HH', sof[1:5])
+            return TexInfo(w, h, None, 1)
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def read_header(path):
+    """TexInfo for the texture or image at *path* from its header alone, or
+    None when the header is unreadable or the format is not one this parses."""
+    name = path.lower()
+    try:
+        if _TEX_NAME.search(name):
+            from .tex_file import MappedTex
+            with MappedTex(path) as t:
+                return TexInfo(t.width, t.height, t.dxgi_format, t.mip_count)
+        if name.endswith('.dds'):
+            from .dds_file import MappedDDS
+            with MappedDDS(path) as d:
+                return TexInfo(d.width, d.height, d.dxgi_format, d.mip_count)
+        ext = os.path.splitext(name)[1]
+        with open(path, 'rb') as f:
+            if ext in ('.jpg', '.jpeg'):
+                return _jpeg_header(f)
+            head = f.read(32)
+        if ext == '.png':
+            return _png_header(head)
+        if ext == '.tga':
+            return _tga_header(head)
+        if ext == '.bmp':
+            return _bmp_header(head)
+    except (OSError, ValueError, struct.error):
+        return None
+    return None
+
+
+# ── Index ────────────────────────────────────────────────────────────────────
+
+def _default_db_path():
+    try:
+        import bpy
+        cfg = bpy.utils.user_resource("CONFIG")
+    except Exception:
+        cfg = os.path.expanduser("~")
+    return os.path.join(cfg, "modding_toolkit_tex_index.sqlite")
+
+
+def _norm(rel):
+    return rel.replace('\\', '/').lower()
+
+
+class TextureIndex:
+    """Every texture under *root*, by root-relative path (case-insensitive,
+    forward slashes -- how MDF bindings spell them)."""
+
+    def __init__(self, root, db_path=None):
+        self.root = os.path.normpath(os.path.abspath(root))
+        self._key = os.path.normcase(self.root)
+        self._db = sqlite3.connect(db_path or _default_db_path())
+        self._db.executescript(_SCHEMA)
+        # Directory paths keep their real case -- they are walked again on the
+        # next refresh -- while file lookups go through the _norm'd key.
+        self._files = {}    # key -> (mtime_ns, size, TexInfo, rel)
+        self._by_dir = {}   # rel dir -> {key}
+        self._dirs = {}     # rel dir -> (mtime_ns, [subdir rel])
+        for rel, mtime, subdirs in self._db.execute(
+                "SELECT rel, mtime_ns, subdirs FROM dirs WHERE root = ?", (self._key,)):
+            self._dirs[rel] = (mtime, json.loads(subdirs))
+        for rel, rel_dir, mtime, size, w, h, fmt, mips in self._db.execute(
+                "SELECT rel, dir, mtime_ns, size, width, height, dxgi_format, mip_count "
+                "FROM files WHERE root = ?", (self._key,)):
+            self._files[_norm(rel)] = (mtime, size, TexInfo(w, h, fmt, mips), rel)
+            self._by_dir.setdefault(rel_dir, set()).add(_norm(rel))
+
+    def close(self):
+        self._db.close()
+
+    def __len__(self):
+        return len(self._files)
+
+    # ── Scanning ──
+
+    def refresh(self, full=False):
+        """Bring the index up to date with the disk; returns how many directories
+        were re-listed.  *full* re-lists every directory, not just the ones
+        whose mtime moved."""
+        relisted = 0
+        seen = set()
+        # Symlinked directories are followed.  Each directory carries the
+        # (st_dev, st_ino) of its ancestors, so a link back up the tree is cut
+        # instead of recursing forever; a directory linked from two places is
+        # still indexed under both paths.
+        stack = [('', frozenset())]
+        while stack:
+            rel_dir, ancestors = stack.pop()
+            abs_dir = os.path.join(self.root, *rel_dir.split('/')) if rel_dir else self.root
+            try:
+                st = os.stat(abs_dir)
+            except OSError:
+                continue
+            ident = (st.st_dev, st.st_ino)
+            if ident in ancestors:
+                continue
+            seen.add(rel_dir)
+            ancestors |= {ident}
+            mtime = st.st_mtime_ns
+            known = self._dirs.get(rel_dir)
+            if known is not None and known[0] == mtime and not full:
+                stack.extend((sub, ancestors) for sub in known[1])
+                continue
+            relisted += 1
+            stack.extend((sub, ancestors) for sub in self._relist(rel_dir, abs_dir, mtime))
+        for gone in set(self._dirs) - seen:
+            self._forget_dir(gone)
+        self._db.commit()
+        return relisted
+
+    def _relist(self, rel_dir, abs_dir, mtime):
+        subdirs = []
+        present = set()
+        try:
+            entries = list(os.scandir(abs_dir))
+        except OSError:
+            entries = []
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                if entry.is_dir():
+                    subdirs.append(rel)
+                    continue
+                if not is_texture_name(entry.name):
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            key = _norm(rel)
+            present.add(key)
+            known = self._files.get(key)
+            if known is None or known[:2] != (st.st_mtime_ns, st.st_size):
+                self._store(rel, rel_dir, st.st_mtime_ns, st.st_size, entry.path)
+        for key in self._by_dir.get(rel_dir, set()) - present:
+            self._drop(key)
+        self._dirs[rel_dir] = (mtime, subdirs)
+        self._db.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?)",
+                         (self._key, rel_dir, mtime, json.dumps(subdirs)))
+        return subdirs
+
+    def _store(self, rel, rel_dir, mtime, size, abs_path):
+        info = read_header(abs_path) or TexInfo(0, 0, None, 0)
+        key = _norm(rel)
+        self._files[key] = (mtime, size, info, rel)
+        self._by_dir.setdefault(rel_dir, set()).add(key)
+        self._db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                         (self._key, rel, rel_dir, mtime, size, *info))
+
+    def _drop(self, key):
+        known = self._files.pop(key, None)
+        if known is None:
+            return
+        rel = known[3]
+        self._by_dir.get(rel.rpartition('/')[0], set()).discard(key)
+        self._db.execute("DELETE FROM files WHERE root = ? AND rel = ?", (self._key, rel))
+
+    def _forget_dir(self, rel_dir):
+        self._dirs.pop(rel_dir, None)
+        self._db.execute("DELETE FROM dirs WHERE root = ? AND rel = ?", (self._key, rel_dir))
+        for key in list(self._by_dir.pop(rel_dir, ())):
+            self._drop(key)
+
+    # ── Lookups ──
+
+    def _lookup_key(self, path):
+        if os.path.isabs(path):
+            try:
+                path = os.path.relpath(path, self.root)
+            except ValueError:
+                return None     # another drive
+        return _norm(path).lstrip('/')
+
+    def contains(self, path):
+        """Whether *path* (absolute, or relative to the root) was there at the
+        last refresh."""
+        return self._lookup_key(path) in self._files
+
+    def info(self, path, verify=False):
+        """TexInfo for *path*, or None if the index has no such file.
+        *verify* re-stats the file and re-reads a header whose stamp moved."""
+        key = self._lookup_key(path)
+        known = self._files.get(key)
+        if known is None or not verify:
+            return known[2] if known else None
+        rel = known[3]
+        abs_path = os.path.join(self.root, *rel.split('/'))
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            self._drop(key)
+            self._db.commit()
+            return None
+        if known[:2] != (st.st_mtime_ns, st.st_size):
+            self._store(rel, rel.rpartition('/')[0], st.st_mtime_ns, st.st_size, abs_path)
+            self._db.commit()
+        return self._files[key][2]
+
+
+_INDEXES = {}
+
+
+def get_index(root, refresh=True):
+    """The session's TextureIndex for *root*, brought up to date unless
+    *refresh* is False."""
+    key = os.path.normcase(os.path.normpath(os.path.abspath(root)))
+    index = _INDEXES.get(key)
+    if index is None:
+        index = _INDEXES[key] = TextureIndex(root)
+    if refresh:
+        index.refresh()
+    return index
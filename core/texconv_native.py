@@ -10,11 +10,16 @@ import ctypes
 import os
 import struct
 import tempfile
+import threading
 import zlib
 
 from . import dxgi_format as dxgi
 
 _DLL = None
+# texconv.dll is a command-line tool's main() behind a C export: nothing in it
+# promises reentrancy, and it already spreads BC6H/BC7 work over every core.
+# Calls from the processor's worker pool go through one at a time.
+_CALL_LOCK = threading.Lock()
 
 # PNG colour-space chunks that make WIC report the image as sRGB-encoded, which
 # in turn makes DirectXTex gamma-convert the pixels on load.  See
@@ -138,7 +143,8 @@ def _run_texconv(dll, file, args, out_dir, verbose=False, allow_slow_codec=False
 
     args_p = (ctypes.c_wchar_p * len(args))(*[ctypes.c_wchar_p(a) for a in args])
     err_buf = ctypes.create_unicode_buffer(512)
-    result = dll.texconv(len(args), args_p, verbose, False, allow_slow_codec, err_buf, 512)
+    with _CALL_LOCK:
+        result = dll.texconv(len(args), args_p, verbose, False, allow_slow_codec, err_buf, 512)
     if result != 0:
         raise RuntimeError(err_buf.value)
 
@@ -0,0 +1,185 @@
+"""The bundled vanilla texture-path lists as mmap-able sorted hash tables.
+
+``assets/<game>/vanilla_tex_paths.txt`` is one normalised path per line --
+46k of them, 3.4 MB, for MHWilds.  Reading one into a frozenset took tens of
+MB of Python strings and a visible stall on first use, per game, and every
+caller only ever asks ``path in vanilla``.
+
+``build()`` turns a list into ``<list>.idx``:
+
+* a 16-byte header: magic ``MTVI``, format version, entry count, blob size;
+* the entries' 64-bit path hashes (blake2b-64, little-endian), sorted;
+* ``count + 1`` uint32 offsets into the string blob, in hash order;
+* the UTF-8 paths themselves, concatenated in the same order.
+
+``VanillaIndex`` maps that file and answers membership with one
+``np.searchsorted`` over the hash column plus a byte comparison of the
+candidates, so a hash collision cannot make a custom path look vanilla.
+Nothing is read up front beyond the header.
+
+``load()`` builds the index beside the list the first time it is missing or
+older than the list, and falls back to building it in memory when the asset
+directory cannot be written.  Run as a script to rebuild the shipped lists::
+
+    python core/vanilla_index.py assets/*/vanilla_tex_paths.txt
+
+Free of ``bpy``.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b'MTVI'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<4sIII')
+
+
+def normalize(path):
+    """The form paths are stored and looked up in: forward slashes, lower case."""
+    return path.strip().replace('\\', '/').lower()
+
+
+def path_hash(norm):
+    """64-bit hash of an already-normalised path."""
+    return int.from_bytes(hashlib.blake2b(norm.encode('utf-8'), digest_size=8).digest(),
+                          'little')
+
+
+def index_path(list_path):
+    return list_path + '.idx'
+
+
+# ── Building ─────────────────────────────────────────────────────────────────
+
+def build_bytes(paths):
+    """The .idx image for an iterable of paths."""
+    entries = sorted({normalize(p) for p in paths if p.strip()},
+                     key=lambda n: (path_hash(n), n))
+    encoded = [n.encode('utf-8') for n in entries]
+    hashes = np.array([path_hash(n) for n in entries], dtype='<u8')
+    offsets = np.zeros(len(encoded) + 1, dtype='<u4')
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    blob = b''.join(encoded)
+    return b''.join((_HEADER.pack(MAGIC, FORMAT_VERSION, len(encoded), len(blob)),
+                     hashes.tobytes(), offsets.tobytes(), blob))
+
+
+def build(list_path, out_path=None):
+    """Write the index for the list at *list_path* (default ``<list>.idx``),
+    via a temporary name so a reader never maps half a file."""
+    out_path = out_path or index_path(list_path)
+    with open(list_path, encoding='utf-8') as f:
+        data = build_bytes(f)
+    tmp = out_path + '.part'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, out_path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return out_path
+
+
+# ── Lookup ───────────────────────────────────────────────────────────────────
+
+class VanillaIndex:
+    """Membership over a built index, from a file (mapped) or a bytes image.
+    Takes normalised paths, like the frozenset it replaces."""
+
+    def __init__(self, source):
+        self._file = self._map = None
+        if isinstance(source, (bytes, bytearray)):
+            buf = source
+        else:
+            self._file = open(source, 'rb')
+            try:
+                buf = self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # An empty file cannot be mapped; the header check rejects it.
+                buf = b''
+        if len(buf) < _HEADER.size:
+            self.close()
+            raise ValueError("Not a vanilla path index: too short")
+        magic, version, count, blob_size = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError("Not a vanilla path index, or an older format")
+        self._count = count
+        self._hashes = np.frombuffer(buf, dtype='<u8', count=count, offset=_HEADER.size)
+        off = _HEADER.size + 8 * count
+        self._offsets = np.frombuffer(buf, dtype='<u4', count=count + 1, offset=off)
+        self._blob = memoryview(buf)[off + 4 * (count + 1):off + 4 * (count + 1) + blob_size]
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, norm):
+        if not isinstance(norm, str) or not self._count:
+            return False
+        h = np.uint64(path_hash(norm))
+        i = int(np.searchsorted(self._hashes, h, side='left'))
+        key = norm.encode('utf-8')
+        while i < self._count and self._hashes[i] == h:
+            start, end = int(self._offsets[i]), int(self._offsets[i + 1])
+            if self._blob[start:end] == key:
+                return True
+            i += 1
+        return False
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield bytes(self._blob[int(self._offsets[i]):int(self._offsets[i + 1])]).decode('utf-8')
+
+    def close(self):
+        # The arrays are views of the map; drop them before unmapping.
+        self._hashes = self._offsets = self._blob = None
+        self._count = 0
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _fresh(list_path, idx_path):
+    try:
+        return os.path.getmtime(idx_path) >= os.path.getmtime(list_path)
+    except OSError:
+        return False
+
+
+def load(list_path):
+    """A VanillaIndex for the list at *list_path*, building ``<list>.idx`` if
+    it is missing or stale.  Raises OSError when the list cannot be read."""
+    idx_path = index_path(list_path)
+    if _fresh(list_path, idx_path):
+        try:
+            return VanillaIndex(idx_path)
+        except (OSError, ValueError):
+            pass
+    try:
+        build(list_path, idx_path)
+        return VanillaIndex(idx_path)
+    except OSError:
+        # No writable index beside the list -- denied, a read-only filesystem
+        # (EROFS), a full disk: the same table, held in memory for the session.
+        with open(list_path, encoding='utf-8') as f:
+            return VanillaIndex(build_bytes(f))
+
+
+if __name__ == '__main__':
+    for arg in sys.argv[1:]:
+        print(build(arg))
@@ -0,0 +1,279 @@
+"""A mesh's deform weights as one sparse vertex x group matrix.
+
+The weight helpers used to talk to Blender a vertex at a time --
+``vg.weight(i)`` in a try/except for every vertex of every source group, then
+``vg.add([i], w)`` per entry -- so merging a physics hierarchy into its base
+bones cost (groups x vertices) Python calls plus an exception for each vertex
+outside a group.  A WeightMatrix reads every ``vert.groups`` entry once into
+CSR arrays:
+
+* ``indptr``  -- row start per vertex, ``len(vertices) + 1`` long
+* ``indices`` -- the column (vertex-group slot) of each entry
+* ``data``    -- its weight, float32 like Blender's
+
+and merges, renames, scales, clamps and prunes columns as array operations.
+``apply()`` writes back only the columns that changed: one ``remove`` of the
+old members and one ``add`` per distinct weight value, each with the whole
+index list, so a column of painted weights costs as many calls as it has
+distinct values, not as many as it has vertices.
+
+Columns keep their slot for the matrix's lifetime; a removed or merged-away
+column stays as a ``None`` name.  Free of ``bpy``: it only touches the
+object it is handed.
+"""
+
+import numpy as np
+
+
+class WeightMatrix:
+
+    def __init__(self, indptr, indices, data, names):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.data = np.asarray(data, dtype=np.float32)
+        self.names = list(names)        # current name per column; None once removed
+        self._rebase()
+
+    # ── Reading ──────────────────────────────────────────────────────────────
+
+    @classmethod
+    def from_object(cls, obj):
+        """Every deform weight of mesh object *obj*, in one pass over its
+        vertices."""
+        counts, cols, weights = [], [], []
+        for v in obj.data.vertices:
+            groups = v.groups
+            counts.append(len(groups))
+            for g in groups:
+                cols.append(g.group)
+                weights.append(g.weight)
+        indptr = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(indptr, cols, weights, [vg.name for vg in obj.vertex_groups])
+
+    @property
+    def vertex_count(self):
+        return len(self.indptr) - 1
+
+    def __contains__(self, name):
+        return name is not None and name in self.names
+
+    def col(self, name):
+        """Column slot of group *name*, or None."""
+        try:
+            return self.names.index(name) if name is not None else None
+        except ValueError:
+            return None
+
+    def rows(self):
+        """The vertex index of every entry."""
+        return np.repeat(np.arange(self.vertex_count, dtype=np.int64), np.diff(self.indptr))
+
+    def column(self, name):
+        """``(vertex_indices, weights)`` of group *name*; empty when it has none."""
+        c = self.col(name)
+        if c is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        mask = self.indices == c
+        return self.rows()[mask], self.data[mask]
+
+    def has_weights(self, name, threshold=0.0):
+        c = self.col(name)
+        return c is not None and bool(np.any(self.data[self.indices == c] > threshold))
+
+    def dense(self, name):
+        """Group *name* as a per-vertex float32 array, 0 outside the group."""
+        out = np.zeros(self.vertex_count, dtype=np.float32)
+        rows, weights = self.column(name)
+        out[rows] = weights
+        return out
+
+    # ── Editing ──────────────────────────────────────────────────────────────
+
+    def add_column(self, name):
+        """Slot for group *name*, created (empty) when it does not exist."""
+        c = self.col(name)
+        if c is None:
+            self.names.append(name)
+            self._source.append(None)
+            c = len(self.names) - 1
+            self._dirty.add(c)
+        return c
+
+    def merge(self, sources, target, keep_zero=False):
+        """Fold the groups named in *sources* into *target*, summing and
+        capping at 1.0, and drop them.  Returns the number merged."""
+        return self.merge_map({s: target for s in sources}, keep_zero)
+
+    def merge_map(self, mapping, keep_zero=False):
+        """``{source: target}`` merges in one pass.  A target that is itself a
+        source is followed to its final target.  A zero source weight adds
+        nothing to the target unless *keep_zero*, when the vertex still becomes
+        a member.  Returns the number of source groups merged."""
+        pairs = [(self.col(src), dst) for src, dst in mapping.items()
+                 if src != dst and src in self.names]
+        if not pairs:
+            return 0
+        pairs = [(s, self.add_column(dst)) for s, dst in pairs]
+        remap = np.arange(len(self.names), dtype=np.int32)
+        for s, t in pairs:
+            remap[s] = t
+        for _ in range(len(remap)):
+            chased = remap[remap]
+            if np.array_equal(chased, remap):
+                break
+            remap = chased
+
+        moved = np.flatnonzero(remap != np.arange(len(remap)))
+        targets = np.unique(remap[moved])
+        if not keep_zero:
+            self._keep(~(np.isin(self.indices, moved) & (self.data <= 0.0)))
+        self.indices = remap[self.indices]
+        self._coalesce()
+        hit = np.isin(self.indices, targets)
+        np.minimum(self.data, 1.0, out=self.data, where=hit)
+        for c in moved:
+            self.names[c] = None
+        self._dirty.update(int(c) for c in targets)
+        return len(pairs)
+
+    def rename(self, old, new):
+        """Rename group *old* to *new*, merging into *new* when that already
+        exists.  False when there is no *old*."""
+        c = self.col(old)
+        if c is None:
+            return False
+        if old == new:
+            return True
+        if new in self.names:
+            self.merge([old], new)
+        else:
+            self.names[c] = new
+        return True
+
+    def remove(self, name):
+        c = self.col(name)
+        if c is None:
+            return False
+        self._keep(self.indices != c)
+        self.names[c] = None
+        return True
+
+    def scale(self, name, factor):
+        c = self.col(name)
+        if c is None:
+            return
+        hit = self.indices == c
+        self.data[hit] *= np.float32(factor)
+        self._dirty.add(c)
+
+    def clamp(self, lo=0.0, hi=1.0, names=None):
+        """Clip weights into ``[lo, hi]`` -- every group, or just *names*."""
+        hit = self._select(names)
+        clipped = np.clip(self.data, lo, hi)
+        changed = hit & (clipped != self.data)
+        self.data[changed] = clipped[changed]
+        self._dirty.update(int(c) for c in np.unique(self.indices[changed]))
+
+    def prune(self, threshold=0.0, names=None):
+        """Drop entries at or below *threshold*, leaving those vertices out of
+        the group altogether.  Returns the number dropped."""
+        drop = self._select(names) & (self.data <= threshold)
+        if not drop.any():
+            return 0
+        self._dirty.update(int(c) for c in np.unique(self.indices[drop]))
+        self._keep(~drop)
+        return int(drop.sum())
+
+    # ── Writing back ─────────────────────────────────────────────────────────
+
+    def apply(self, obj):
+        """Write the changes since reading (or the last apply) into *obj*'s
+        vertex groups."""
+        vgs = obj.vertex_groups
+        for name, source in zip(self.names, self._source):
+            if name is None and source is not None:
+                vg = vgs.get(source)
+                if vg is not None:
+                    vgs.remove(vg)
+        # Rename in two passes, every source to a free placeholder first: a
+        # swap (g1 <-> g2) or a chain (g1 -> g2 -> g3) applied one at a time
+        # would land on a name still in use and Blender would suffix it.
+        renames = [(vgs.get(source), name)
+                   for name, source in zip(self.names, self._source)
+                   if name is not None and source is not None and name != source]
+        renames = [(vg, name) for vg, name in renames if vg is not None]
+        serial = 0
+        for vg, _ in renames:
+            while f"~wm{serial}" in vgs:
+                serial += 1
+            vg.name = f"~wm{serial}"
+            serial += 1
+        for vg, name in renames:
+            vg.name = name
+
+        dirty = sorted(c for c in self._dirty if self.names[c] is not None)
+        if dirty:
+            rows = self.rows()
+            order = np.argsort(self.indices, kind='stable')
+            cols, rows, data = self.indices[order], rows[order], self.data[order]
+            base_order = np.argsort(self._base_cols, kind='stable')
+            base_cols, base_rows = self._base_cols[base_order], self._base_rows[base_order]
+            for c in dirty:
+                name = self.names[c]
+                vg = vgs.get(name) or vgs.new(name=name)
+                if self._source[c] is not None:
+                    lo, hi = np.searchsorted(base_cols, [c, c + 1])
+                    if hi > lo:
+                        vg.remove(base_rows[lo:hi].tolist())
+                lo, hi = np.searchsorted(cols, [c, c + 1])
+                add_grouped(vg, rows[lo:hi], data[lo:hi])
+        self._rebase()
+
+    # ── Internals ────────────────────────────────────────────────────────────
+
+    def _rebase(self):
+        self._source = list(self.names)
+        self._base_rows = self.rows()
+        self._base_cols = self.indices.copy()
+        self._dirty = set()
+
+    def _select(self, names):
+        if names is None:
+            return np.ones(len(self.data), dtype=bool)
+        cols = [c for c in (self.col(n) for n in names) if c is not None]
+        return np.isin(self.indices, cols)
+
+    def _keep(self, mask):
+        rows = self.rows()[mask]
+        self.indices = self.indices[mask]
+        self.data = self.data[mask]
+        self.indptr = np.zeros(self.vertex_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(self.indptr) - 1), out=self.indptr[1:])
+
+    def _coalesce(self):
+        """Sum entries that now share a (vertex, column) cell."""
+        width = np.int64(len(self.names))
+        keys = self.rows() * width + self.indices
+        uniq, inverse = np.unique(keys, return_inverse=True)
+        if len(uniq) == len(keys):
+            return
+        self.data = np.bincount(inverse, weights=self.data, minlength=len(uniq)).astype(np.float32)
+        self.indices = (uniq % width).astype(np.int32)
+        rows = uniq // width
+        self.indptr = np.zeros(self.vertex_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(self.indptr) - 1), out=self.indptr[1:])
+
+
+def add_grouped(vg, rows, weights):
+    """One ``vg.add`` per distinct weight, each over every vertex carrying it."""
+    if not len(rows):
+        return
+    values, inverse = np.unique(weights, return_inverse=True)
+    order = np.argsort(inverse.reshape(-1), kind='stable')
+    ends = np.cumsum(np.bincount(inverse.reshape(-1), minlength=len(values))).tolist()
+    idx = rows[order].tolist()
+    start = 0
+    for value, end in zip(values.tolist(), ends):
+        vg.add(idx[start:end], value, 'REPLACE')
+        start = end
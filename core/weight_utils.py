@@ -1,6 +1,9 @@
 import bpy
+import numpy as np
 from mathutils import Vector
 
+from .weight_matrix import WeightMatrix, add_grouped
+
 def merge_weights_and_delete_bones(armature_obj, bone_pairs):
     """
     bone_pairs: List of (keep_bone_name, delete_bone_name)
@@ -49,38 +52,16 @@ def merge_weights_and_delete_bones(armature_obj, bone_pairs):
     # 数」这个量级，而且一次异常都不抛。实测（荒野女性参考模型，32,291 顶点，合并
     # 370 根表情骨）：旧写法 40 根就要 1.32 秒（370 根按线性外推约 12 秒），新写法
     # 40 根 0.11 秒、**370 根 0.18 秒** —— 耗时几乎不再随合并骨数增长。
+    #
+    # 现在交给 WeightMatrix（core/weight_matrix.py）：整张网格的权重一次读成 CSR 数组，
+    # 合并是数组运算，写回时每个目标组按相同权重值成批 add，不再逐条目调用。
     for obj in mesh_objects:
-        vg = obj.vertex_groups
-        # 组索引 -> 目标组，一次解析好；顺带按需新建目标组
-        targets = {}
-        for delete, final_target in merge_map.items():
-            delete_vg = vg.get(delete)
-            if delete_vg is None:
-                continue
-            targets[delete_vg.index] = vg.get(final_target) or vg.new(name=final_target)
-        if not targets:
+        if not any(vg.name in delete_names for vg in obj.vertex_groups):
             continue
-
-        # 先收集再写入：写入会改变顶点的所属组，边遍历 vert.groups 边写有可能读到
-        # 正在变动的集合。
-        pending = {}
-        for vert in obj.data.vertices:
-            for g in vert.groups:
-                target_vg = targets.get(g.group)
-                if target_vg is not None and g.weight:
-                    pending.setdefault(target_vg.index, []).append((vert.index, g.weight))
-
-        for target_index, entries in pending.items():
-            target_vg = vg[target_index]
-            for vert_index, weight in entries:
-                # 'ADD' 累加到已有权重（顶点原本不在组里时等同于赋值），Blender 自己
-                # 把结果钳在 [0, 1]，与原先显式 min(..., 1.0) 的行为一致。
-                target_vg.add([vert_index], weight, 'ADD')
-
-        for delete in merge_map:
-            delete_vg = vg.get(delete)
-            if delete_vg is not None:
-                vg.remove(delete_vg)
+        weights = WeightMatrix.from_object(obj)
+        # 'ADD' 语义：累加到已有权重并钳在 1.0，与原先逐条 add 的结果一致。
+        weights.merge_map(merge_map)
+        weights.apply(obj)
 
     # 3. 删除骨骼
     bpy.context.view_layer.objects.active = armature_obj
@@ -98,36 +79,42 @@ def merge_weights_and_delete_bones(armature_obj, bone_pairs):
     
 def merge_vgroups_multi(obj, source_names, target_name):
     """
-    将多个源顶点组权重合并到目标组（单次顶点遍历，上限1.0），合并后删除源组。
+    将多个源顶点组权重合并到目标组（上限1.0），合并后删除源组。
     obj: Mesh 对象
     source_names: 源顶点组名列表
     target_name: 目标顶点组名
     """
-    target_vg = obj.vertex_groups.get(target_name)
-    if target_vg is None:
-        target_vg = obj.vertex_groups.new(name=target_name)
-
-    active_sources = [vg for vg in (obj.vertex_groups.get(n) for n in source_names) if vg is not None]
-    if not active_sources:
+    if obj.vertex_groups.get(target_name) is None:
+        obj.vertex_groups.new(name=target_name)
+    if not any(obj.vertex_groups.get(n) is not None for n in source_names if n != target_name):
         return
 
-    for vert in obj.data.vertices:
-        total_src_w = 0.0
-        for src_vg in active_sources:
-            try:
-                total_src_w += src_vg.weight(vert.index)
-            except RuntimeError:
-                pass
-        if total_src_w <= 0.0:
-            continue
-        try:
-            tgt_w = target_vg.weight(vert.index)
-        except RuntimeError:
-            tgt_w = 0.0
-        target_vg.add([vert.index], min(tgt_w + total_src_w, 1.0), 'REPLACE')
+    weights = WeightMatrix.from_object(obj)
+    weights.merge(source_names, target_name)
+    weights.apply(obj)
 
-    for src_vg in active_sources:
-        obj.vertex_groups.remove(src_vg)
+
+def merge_vgroup_map(obj, mapping, dry_run=False):
+    """
+    按 {源组名: 目标组名} 一次性合并多个顶点组（读一次、写一次，上限1.0），合并后删除源组。
+    dry_run=True 时只统计、不改动网格。
+    返回 {源组名: (顶点数, 权重总量)}，只含网格上实际存在的源组。
+    """
+    weights = WeightMatrix.from_object(obj)
+    # 所有列的统计一次算完，不逐个源组扫描全部非零项
+    size = len(weights.names)
+    mass = np.bincount(weights.indices, weights=weights.data, minlength=size)
+    verts = np.bincount(weights.indices[weights.data > 0], minlength=size)
+    cols = {name: c for c, name in enumerate(weights.names) if name is not None}
+    moved = {}
+    for src, dst in mapping.items():
+        c = cols.get(src)
+        if c is not None and src != dst:
+            moved[src] = (int(verts[c]), float(mass[c]))
+    if moved and not dry_run:
+        weights.merge_map({src: mapping[src] for src in moved})
+        weights.apply(obj)
+    return moved
 
 
 def rename_or_merge_vgroup(obj, old_name, new_name):
@@ -138,24 +125,201 @@ def rename_or_merge_vgroup(obj, old_name, new_name):
     old_vg = obj.vertex_groups.get(old_name)
     if old_vg is None:
         return False
-    existing_vg = obj.vertex_groups.get(new_name)
-    if existing_vg is None:
+    if obj.vertex_groups.get(new_name) is None:
         old_vg.name = new_name
         return True
-    for vert in obj.data.vertices:
-        try:
-            old_w = old_vg.weight(vert.index)
-        except RuntimeError:
-            continue
-        try:
-            existing_w = existing_vg.weight(vert.index)
-        except RuntimeError:
-            existing_w = 0.0
-        existing_vg.add([vert.index], min(existing_w + old_w, 1.0), 'REPLACE')
-    obj.vertex_groups.remove(old_vg)
+    weights = WeightMatrix.from_object(obj)
+    # 旧组里权重为 0 的顶点也成为目标组成员，与逐顶点 add 的旧实现一致
+    weights.merge([old_name], new_name, keep_zero=True)
+    weights.apply(obj)
     return True
 
 
+# 形态键转权重的拓扑部分（接缝分簇、邻接表）只取决于网格本身，与形态键和平滑参数无关。
+# 缓存最近一次的结果：重做面板改一个参数再执行、或者同一网格连续转换多个形态键时，
+# 不必重新建拓扑。键是顶点坐标、法线、边表的摘要，网格一变就失效。
+_topology_cache = {}
+
+def _ranges(starts, counts):
+    """拼接若干段连续下标 [starts[i], starts[i] + counts[i]) 为一个数组。"""
+    total = int(counts.sum())
+    if not total:
+        return np.empty(0, dtype=np.int64)
+    ends = np.cumsum(counts)
+    return np.repeat(starts - ends + counts, counts) + np.arange(total)
+
+
+class _Topology:
+    """
+    形态键转权重用到的网格拓扑：按顶点排序的邻接表（nb_src / nb_starts / degree）和
+    接缝簇（seam_labels 为每个顶点的簇号，不在接缝上为 -1；seam_verts 按簇排序）。
+
+    平滑只在「会被波及的区域」上做：权重每一遍只向外扩散一圈邻居（外加接缝同步），
+    所以迭代 k 遍后，离非零权重超过 k 圈的顶点必然仍是 0。先按邻接表和接缝簇从非零
+    顶点向外扩 k 圈得到区域，再在区域内的子图上迭代 —— 一个只动眼皮的表情不必每遍
+    扫全脸。结果与全网格迭代一致（区域外邻居的权重恒为 0，度数仍按全网格计）。
+    """
+    __slots__ = ('n', 'edges', 'degree', 'nb_src', 'nb_starts',
+                 'seam_labels', 'seam_verts', 'seam_starts', 'seam_counts')
+
+    def __init__(self, n, edges, seam_labels):
+        self.n = n
+        self.edges = edges
+        dst = np.concatenate((edges[:, 0], edges[:, 1]))
+        src = np.concatenate((edges[:, 1], edges[:, 0]))
+        self.nb_src = src[np.argsort(dst, kind='stable')]
+        self.degree = np.bincount(dst, minlength=n)
+        self.nb_starts = np.zeros(n, dtype=np.int64)
+        np.cumsum(self.degree[:-1], out=self.nb_starts[1:])
+
+        self.seam_labels = None
+        if seam_labels is not None and (seam_labels >= 0).any():
+            verts = np.flatnonzero(seam_labels >= 0)
+            verts = verts[np.argsort(seam_labels[verts], kind='stable')]
+            labels = seam_labels[verts]
+            first = np.ones(len(verts), dtype=bool)
+            first[1:] = labels[1:] != labels[:-1]
+            self.seam_starts = np.flatnonzero(first)
+            self.seam_counts = np.diff(np.append(self.seam_starts, len(verts)))
+            self.seam_verts = verts
+            self.seam_labels = np.full(n, -1, dtype=np.int64)
+            self.seam_labels[verts] = np.repeat(np.arange(len(self.seam_starts)), self.seam_counts)
+
+    def _close_seams(self, mask, added):
+        """added 中落在接缝簇上的顶点，把整簇标进 mask；返回新标进的顶点。"""
+        if self.seam_labels is None or not len(added):
+            return added
+        clusters = self.seam_labels[added]
+        clusters = np.unique(clusters[clusters >= 0])
+        if not len(clusters):
+            return added
+        mates = self.seam_verts[_ranges(self.seam_starts[clusters], self.seam_counts[clusters])]
+        mates = mates[~mask[mates]]
+        mask[mates] = True
+        return np.concatenate((added, mates))
+
+    def reach(self, weights, iters, sync_seams):
+        """迭代 iters 遍后权重可能非零的顶点（升序下标）。"""
+        mask = weights > 0
+        frontier = np.flatnonzero(mask)
+        if sync_seams:
+            frontier = self._close_seams(mask, frontier)
+        for _ in range(iters):
+            if not len(frontier):
+                break
+            nbs = self.nb_src[_ranges(self.nb_starts[frontier], self.degree[frontier])]
+            nbs = np.unique(nbs[~mask[nbs]])
+            mask[nbs] = True
+            frontier = self._close_seams(mask, nbs) if sync_seams else nbs
+        return np.flatnonzero(mask)
+
+    def sync_seams(self, weights):
+        """接缝簇内的顶点取簇平均权重（原地修改）。"""
+        if self.seam_labels is None:
+            return
+        sums = np.add.reduceat(weights[self.seam_verts], self.seam_starts)
+        weights[self.seam_verts] = np.repeat(sums / self.seam_counts, self.seam_counts)
+
+    def smooth(self, weights, factor, iters, sync_seams):
+        """
+        拉普拉斯平滑 iters 遍：w = w·(1-f) + 邻居均值·f，每遍后按需同步接缝。
+        只在 reach() 给出的区域上迭代，原地写回 weights。
+        """
+        if iters <= 0:
+            return
+        verts = self.reach(weights, iters, sync_seams)
+        m = len(verts)
+        if not m:
+            return
+        local = np.full(self.n, -1, dtype=np.int64)
+        local[verts] = np.arange(m)
+        a, b = local[self.edges[:, 0]], local[self.edges[:, 1]]
+        inside = (a >= 0) & (b >= 0)
+        a, b = a[inside], b[inside]
+        degree = self.degree[verts]
+        has_nb = degree > 0
+        inv_deg = np.zeros(m, dtype=np.float64)
+        inv_deg[has_nb] = 1.0 / degree[has_nb]
+
+        seam = None
+        if sync_seams and self.seam_labels is not None:
+            labels = self.seam_labels[verts]
+            on = np.flatnonzero(labels >= 0)
+            if len(on):
+                _, inverse, counts = np.unique(labels[on], return_inverse=True,
+                                               return_counts=True)
+                seam = (on, inverse.reshape(-1), counts)
+
+        x = weights[verts].astype(np.float64)
+        for _ in range(iters):
+            nb_sum = (np.bincount(a, weights=x[b], minlength=m)
+                      + np.bincount(b, weights=x[a], minlength=m))
+            x = np.where(has_nb, x * (1.0 - factor) + nb_sum * inv_deg * factor, x)
+            if seam is not None:
+                on, inverse, counts = seam
+                sums = np.bincount(inverse, weights=x[on], minlength=len(counts))
+                x[on] = sums[inverse] / counts[inverse]
+        weights[verts] = x
+
+
+def _mesh_topology(mesh, sync_seams):
+    """网格拓扑（_Topology），按网格内容缓存最近一次的结果。"""
+    import hashlib
+    vertices, mesh_edges = mesh.vertices, mesh.edges
+    n = len(vertices)
+    co = np.empty(n * 3, dtype=np.float32)
+    vertices.foreach_get('co', co)
+    edges = np.empty(len(mesh_edges) * 2, dtype=np.int32)
+    mesh_edges.foreach_get('vertices', edges)
+    normals = None
+    digest = hashlib.blake2b(co.tobytes(), digest_size=16)
+    digest.update(edges.tobytes())
+    if sync_seams:
+        normals = np.empty(n * 3, dtype=np.float32)
+        vertices.foreach_get('normal', normals)
+        digest.update(normals.tobytes())
+    key = (n, len(edges), bool(sync_seams), digest.digest())
+    cached = _topology_cache.get('last')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    seam_labels = _seam_clusters(co.reshape(-1, 3), normals.reshape(-1, 3)) if sync_seams else None
+    topology = _Topology(n, edges.reshape(-1, 2), seam_labels)
+    _topology_cache['last'] = (key, topology)
+    return topology
+
+
+def _seam_clusters(co, normals):
+    """
+    按坐标（5 位小数）把重合顶点分组，组内再按法线相似度（点积 > 0.9）拆开：真正的
+    UV 接缝重复点法线几乎一致，而只是碰在一起的两片几何（例如闭嘴时的上下唇）法线相反，
+    不能平均。拆分规则与逐点贪心一致：每轮取组内第一个未归类顶点为首，与它相似的都归入它。
+    返回每个顶点的簇首下标，簇大小为 1 的顶点为 -1。
+    """
+    n = len(co)
+    labels = np.full(n, -1, dtype=np.int64)
+    _, group, counts = np.unique(np.round(co.astype(np.float64), 5), axis=0,
+                                 return_inverse=True, return_counts=True)
+    group = group.reshape(-1)
+    members = np.flatnonzero(counts[group] > 1)
+    if not len(members):
+        return labels
+    # 组内按顶点下标排序，与原先按顶点顺序遍历一致
+    members = members[np.lexsort((members, group[members]))]
+    pending = members
+    while len(pending):
+        g = group[pending]
+        first = np.ones(len(pending), dtype=bool)
+        first[1:] = g[1:] != g[:-1]
+        leader = pending[np.maximum.accumulate(np.where(first, np.arange(len(pending)), 0))]
+        joins = first | (np.einsum('ij,ij->i', normals[pending], normals[leader]) > 0.9)
+        labels[pending[joins]] = leader[joins]
+        pending = pending[~joins]
+    sizes = np.bincount(labels[labels >= 0], minlength=n)
+    labels[(labels >= 0) & (sizes[np.maximum(labels, 0)] < 2)] = -1
+    return labels
+
+
 def shape_key_to_weights(obj, active_kb, basis_kb, ignore_threshold=0.001,
                          weight_strength=1.0, smooth_factor=0.5,
                          smooth_iters=10, sync_seams=True, direction=None,
@@ -172,101 +336,110 @@ def shape_key_to_weights(obj, active_kb, basis_kb, ignore_threshold=0.001,
     This lets you split a single shape key (e.g. blink) into per-direction groups
     (upper eyelid vs lower eyelid) by running the operator twice with opposite signs.
 
+    A one-job shape_keys_to_weights; see there for how it is computed.
+
     Returns the number of affected vertices, or None if no valid displacement is found.
     """
-    vertices = obj.data.vertices
-    v_count = len(vertices)
-    raw_weights = [0.0] * v_count
-    max_val = 0.0
-    valid_count = 0
+    job = ShapeKeyWeightJob(active_kb, direction, vg_name, ignore_threshold=ignore_threshold,
+                            weight_strength=weight_strength, smooth_factor=smooth_factor,
+                            smooth_iters=smooth_iters)
+    return shape_keys_to_weights(obj, basis_kb, [job], sync_seams=sync_seams)[0]
 
-    filter_dir = Vector(direction).normalized() if direction is not None else None
-    world_mat3 = obj.matrix_world.to_3x3() if filter_dir is not None else None
 
-    seam_groups = []
-    if sync_seams:
-        coincident = {}
-        for i, v in enumerate(vertices):
-            key = (round(v.co.x, 5), round(v.co.y, 5), round(v.co.z, 5))
-            coincident.setdefault(key, []).append(i)
-        # Split coincident groups by normal similarity: true UV-seam duplicates share
-        # nearly identical normals, while touching-but-separate geometry (e.g. upper/lower
-        # lip when mouth is closed) faces opposite directions and must not be averaged.
-        for group in coincident.values():
-            if len(group) < 2:
-                continue
-            sub: list[list[int]] = []
-            for v_idx in group:
-                n = vertices[v_idx].normal
-                for sg in sub:
-                    if vertices[sg[0]].normal.dot(n) > 0.9:
-                        sg.append(v_idx)
-                        break
-                else:
-                    sub.append([v_idx])
-            seam_groups.extend(sg for sg in sub if len(sg) > 1)
-
-    for i in range(v_count):
-        disp = active_kb.data[i].co - basis_kb.data[i].co
-        if filter_dir is not None:
-            val = (world_mat3 @ disp).dot(filter_dir)
-            if val <= ignore_threshold:
-                continue
+class ShapeKeyWeightJob:
+    """
+    shape_keys_to_weights 的一项：把 key_block 转成名为 vg_name（默认取形态键名）的顶点组，
+    direction 为可选的方向过滤轴，其余参数与 shape_key_to_weights 同名参数一致。
+    """
+    __slots__ = ('key_block', 'direction', 'vg_name', 'ignore_threshold',
+                 'weight_strength', 'smooth_factor', 'smooth_iters')
+
+    def __init__(self, key_block, direction=None, vg_name=None, ignore_threshold=0.001,
+                 weight_strength=1.0, smooth_factor=0.5, smooth_iters=10):
+        self.key_block = key_block
+        self.direction = direction
+        self.vg_name = vg_name or key_block.name
+        self.ignore_threshold = ignore_threshold
+        self.weight_strength = weight_strength
+        self.smooth_factor = smooth_factor
+        self.smooth_iters = smooth_iters
+
+
+def shape_keys_to_weights(obj, basis_kb, jobs, sync_seams=True):
+    """
+    Convert several shape keys to vertex groups in one run (ShapeKeyWeightJob list).
+
+    The basis and each distinct key block are read once with foreach_get, and the
+    mesh topology (seam clusters, adjacency) is built once and cached per mesh.  Each
+    job's weights are one row of a (jobs x vertices) array, smoothed by an edge-list
+    Laplacian (neighbour sums via bincount) over only the vertices its weights can
+    reach in its iteration count (see _Topology).  The groups are written at the end,
+    one add per distinct weight value.
+
+    Returns, per job, the number of affected vertices, or None when that key has no
+    valid displacement (its group is then left untouched).
+    """
+    mesh = obj.data
+    v_count = len(mesh.vertices)
+    if not jobs:
+        return []
+
+    def read(kb):
+        co = np.empty(v_count * 3, dtype=np.float32)
+        kb.data.foreach_get('co', co)
+        return co.reshape(-1, 3)
+
+    basis_co = read(basis_kb)
+    disps = {}
+    world_mat3 = None
+    weights = np.zeros((len(jobs), v_count), dtype=np.float64)
+    factors = np.zeros(len(jobs), dtype=np.float64)
+    iters = np.zeros(len(jobs), dtype=np.int64)
+    results = []
+
+    for col, job in enumerate(jobs):
+        kb = job.key_block
+        disp = disps.get(kb.name)
+        if disp is None:
+            disp = disps[kb.name] = (read(kb) - basis_co).astype(np.float64)
+        if job.direction is not None:
+            if world_mat3 is None:
+                world_mat3 = np.array(obj.matrix_world.to_3x3(), dtype=np.float64)
+            filter_dir = np.array(Vector(job.direction).normalized(), dtype=np.float64)
+            values = (disp @ world_mat3.T) @ filter_dir
         else:
-            val = disp.length
-            if val <= ignore_threshold:
-                continue
-        if val > max_val:
-            max_val = val
-        raw_weights[i] = val
-        valid_count += 1
-
-    if valid_count == 0 or max_val == 0:
-        return None
-
-    for i in range(v_count):
-        if raw_weights[i] > 0:
-            raw_weights[i] = min(1.0, (raw_weights[i] / max_val) * weight_strength)
-
-    for group in seam_groups:
-        avg = sum(raw_weights[idx] for idx in group) / len(group)
-        for idx in group:
-            raw_weights[idx] = avg
-
-    if smooth_iters > 0:
-        adj = {i: [] for i in range(v_count)}
-        for edge in obj.data.edges:
-            adj[edge.vertices[0]].append(edge.vertices[1])
-            adj[edge.vertices[1]].append(edge.vertices[0])
-
-        for _ in range(smooth_iters):
-            new_weights = raw_weights.copy()
-            for i in range(v_count):
-                neighbors = adj[i]
-                if not neighbors:
-                    continue
-                avg_n = sum(raw_weights[n] for n in neighbors) / len(neighbors)
-                new_weights[i] = (raw_weights[i] * (1.0 - smooth_factor)
-                                  + avg_n * smooth_factor)
-            if sync_seams:
-                for group in seam_groups:
-                    avg = sum(new_weights[idx] for idx in group) / len(group)
-                    for idx in group:
-                        new_weights[idx] = avg
-            raw_weights = new_weights
-
-    if vg_name is None:
-        vg_name = active_kb.name
-    existing = obj.vertex_groups.get(vg_name)
-    if existing:
-        obj.vertex_groups.remove(existing)
-    vg = obj.vertex_groups.new(name=vg_name)
-
-    for i, w in enumerate(raw_weights):
-        if w > 0.001:
-            vg.add([i], min(1.0, w), 'REPLACE')
-
-    return valid_count
+            values = np.sqrt(np.einsum('ij,ij->i', disp, disp))
+        valid = values > job.ignore_threshold
+        valid_count = int(valid.sum())
+        max_val = float(values[valid].max()) if valid_count else 0.0
+        if max_val == 0:
+            results.append(None)
+            continue
+        weights[col, valid] = np.minimum(1.0, values[valid] / max_val * job.weight_strength)
+        factors[col] = job.smooth_factor
+        iters[col] = job.smooth_iters
+        results.append(valid_count)
+
+    live = [col for col, r in enumerate(results) if r is not None]
+    if not live:
+        return results
+
+    topology = _mesh_topology(mesh, sync_seams)
+    for col in live:
+        if sync_seams:
+            topology.sync_seams(weights[col])
+        topology.smooth(weights[col], factors[col], iters[col], sync_seams)
+
+    for col in live:
+        vg_name = jobs[col].vg_name
+        existing = obj.vertex_groups.get(vg_name)
+        if existing:
+            obj.vertex_groups.remove(existing)
+        vg = obj.vertex_groups.new(name=vg_name)
+        keep = np.flatnonzero(weights[col] > 0.001)
+        add_grouped(vg, keep, np.minimum(1.0, weights[col, keep]).astype(np.float32))
+
+    return results
 
 
 def bone_has_weights(bone_name, mesh_objects):
@@ -275,12 +448,11 @@ def bone_has_weights(bone_name, mesh_objects):
         vg = obj.vertex_groups.get(bone_name)
         if vg is None:
             continue
-        for v in obj.data.vertices:
-            try:
-                if vg.weight(v.index) > 0:
-                    return True
-            except RuntimeError:
-                pass
+        # 只看顶点真正所属的组条目，不靠 vg.weight() 抛异常判断「不在组里」。
+        index = vg.index
+        if any(g.group == index and g.weight > 0
+               for v in obj.data.vertices for g in v.groups):
+            return True
     return False
 
 
@@ -12,21 +12,24 @@ from ...core.mdf_generator_base import (
     packed_shader_strategies,
     _get_pbr_paths, _slugify, _strip_blender_suffix, _separate_mesh_by_material,
     _emissive_strength_is_zero, _is_emissive_slot, _is_albedo_slot,
-    _make_source_id, _try_downgrade_slot, _generate_solid_texture_path,
+    _make_source_id, _try_downgrade_slot,
     _detect_max_tex_size, _find_meshes_by_material,
     load_mhwi_preset_enum_items,
     _import_mhwi_tex_convert, _call_mhwi_read_preset, _import_mhwi_create_collection,
-    BAKE_SIZE_DEFAULT,
+    BAKE_SIZE_DEFAULT, SOLID_SLOT_SIZE,
 )
 from ...core.mdf_tex_processor_base import (
     _import_tex_utils, _compose_channels, channel_maps_consume_ao, _CH_ENUM_ITEMS,
+    texture_workers,
 )
 from ...core.slot_sources import (
     find_slot_sources, stage_source_file,
     find_shader_socket_image, find_shader_socket_value,
     find_shader_slot_supplies, shader_pbr_contributions,
 )
-from ...core.slot_resolver import resolve_dds_format, write_slot_tex
+from ...core.slot_resolver import resolve_dds_format
+from ...core import solid_tex, tex_encoder
+from ...core.tex_batch import TexBatch, report_failures
 from .mrl3_tex_processor import (
     MHWI_SLOT_CHANNEL_MAPS, MHWI_NULL_TEX,
     MHWI_SRGB_SLOT_TYPES,
@@ -241,6 +244,15 @@ class MHWI_OT_Mrl3GenProcess(bpy.types.Operator):
         temp_dir = tempfile.mkdtemp(prefix="mhwi_mrl3_gen_")
         comp_cache = {}  # (slot_type, source_ids, pbr_channels) → (composed, disk, binding)
         export_count = fail_count = 0
+        # Slot textures are queued and written in one pass at the end
+        # (core/tex_batch.py).  MHWI's .tex has no version to bind, and MHW
+        # Model Editor's converter stays on this thread: only the DDS encodes
+        # go to the workers.
+        backend, quality = tex_encoder.preferences()
+        tex_writes = TexBatch(temp_dir, lambda paths, _version, out: ConvertDDSToTex(paths, out),
+                              workers=texture_workers(), backend=backend, quality=quality,
+                              log_tag=self._log_tag, threaded_tex=False)
+        exported = set()
 
         try:
             for mat_entry in settings.material_list:
@@ -250,15 +262,20 @@ class MHWI_OT_Mrl3GenProcess(bpy.types.Operator):
                         context, mat_entry, settings, mrl3_col,
                         natives_root, base_path, temp_dir,
                         ImageListToDDS, ConvertDDSToTex, mod3_col,
-                        comp_cache,
+                        comp_cache, tex_writes,
                     )
                     export_count += 1
+                    exported.add(mat_entry.blender_material)
                     print(f"[{self._log_tag}] OK: {mat_entry.blender_material} ({time.time() - _t_mat:.2f}s)")
                 except Exception as e:
                     import traceback
                     print(f"[{self._log_tag}] FAIL {mat_entry.blender_material}: {e}")
                     traceback.print_exc()
                     fail_count += 1
+
+            broken = report_failures(tex_writes.run(), self._log_tag) & exported
+            export_count -= len(broken)
+            fail_count += len(broken)
         finally:
             shutil.rmtree(temp_dir, ignore_errors=True)
 
@@ -311,7 +328,7 @@ class MHWI_OT_Mrl3GenProcess(bpy.types.Operator):
     def _process_one_material(self, context, mat_entry, settings, mrl3_col,
                                natives_root, base_path, temp_dir,
                                ImageListToDDS, ConvertDDSToTex, mod3_col,
-                               comp_cache):
+                               comp_cache, tex_writes):
         mat_name = mat_entry.blender_material
         mat = bpy.data.materials.get(mat_name)
         if not mat:
@@ -460,14 +477,9 @@ class MHWI_OT_Mrl3GenProcess(bpy.types.Operator):
                 # temp_dir, and texconv names its output after the input.
                 staged = stage_source_file(
                     direct_src, temp_dir, tex_name, slot_type)
-                write_slot_tex(
-                    staged, disk_path, temp_dir,
-                    dds_fmt=resolve_dds_format(
-                        slot_type, MHWI_SRGB_SLOT_TYPES),
-                    generate_mipmaps=effective_mipmaps,
-                    image_to_dds=ImageListToDDS,
-                    dds_to_tex=ConvertDDSToTex,
-                )
+                tex_writes.add(staged, slot_type,
+                               resolve_dds_format(slot_type, MHWI_SRGB_SLOT_TYPES),
+                               effective_mipmaps, None, disk_path, label=mat_name)
 
                 binding = _mhwi_tex_binding(base_path, tex_name, slot_type)
                 slot_binding_values[slot_type] = binding
@@ -519,23 +531,21 @@ class MHWI_OT_Mrl3GenProcess(bpy.types.Operator):
                 # Only attempt downgrade for cacheable slots (no BAKE involved)
                 rgba = _try_downgrade_slot(slot_type, strategies, pbr_channels, MHWI_SLOT_CHANNEL_MAPS)
                 if rgba is not None:
+                    # A constant: the DDS follows from one encoded block,
+                    # no image or encoder pass (core/solid_tex.py).
                     hint = f"{tex_name}_{slot_type.lower()}_dg"
-                    composed = _generate_solid_texture_path(rgba, temp_dir, hint, size=256)
-                    if composed:
-                        disk_path = _mhwi_disk_path(natives_root, base_path, tex_name, slot_type)
-                        write_slot_tex(
-                            composed, disk_path, temp_dir,
-                            dds_fmt=resolve_dds_format(
-                                slot_type, MHWI_SRGB_SLOT_TYPES),
-                            generate_mipmaps=effective_mipmaps,
-                            image_to_dds=ImageListToDDS,
-                            dds_to_tex=ConvertDDSToTex,
-                        )
-
-                        binding = _mhwi_tex_binding(base_path, tex_name, slot_type)
-                        slot_binding_values[slot_type] = binding
-                        comp_cache[cache_key] = (composed, disk_path, binding)
-                        continue
+                    composed = solid_tex.write_solid_dds(
+                        os.path.join(temp_dir, f"_solid_{hint}.dds"), rgba,
+                        resolve_dds_format(slot_type, MHWI_SRGB_SLOT_TYPES),
+                        SOLID_SLOT_SIZE, generate_mips=effective_mipmaps)
+                    disk_path = _mhwi_disk_path(natives_root, base_path, tex_name, slot_type)
+                    os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+                    ConvertDDSToTex([composed], disk_path)
+
+                    binding = _mhwi_tex_binding(base_path, tex_name, slot_type)
+                    slot_binding_values[slot_type] = binding
+                    comp_cache[cache_key] = (composed, disk_path, binding)
+                    continue
 
             # --- full composition path ---
             _t_comp = time.time()
@@ -552,14 +562,9 @@ class MHWI_OT_Mrl3GenProcess(bpy.types.Operator):
 
             if composed:
                 disk_path = _mhwi_disk_path(natives_root, base_path, tex_name, slot_type)
-                write_slot_tex(
-                    composed, disk_path, temp_dir,
-                    dds_fmt=resolve_dds_format(
-                        slot_type, MHWI_SRGB_SLOT_TYPES),
-                    generate_mipmaps=effective_mipmaps,
-                    image_to_dds=ImageListToDDS,
-                    dds_to_tex=ConvertDDSToTex,
-                )
+                tex_writes.add(composed, slot_type,
+                               resolve_dds_format(slot_type, MHWI_SRGB_SLOT_TYPES),
+                               effective_mipmaps, None, disk_path, label=mat_name)
 
                 binding = _mhwi_tex_binding(base_path, tex_name, slot_type)
                 slot_binding_values[slot_type] = binding
@@ -598,25 +603,12 @@ class MHWI_OT_Mrl3GenProcess(bpy.types.Operator):
                     'snow_Col_CMM.tex',
                 )
                 os.makedirs(os.path.dirname(snow_disk), exist_ok=True)
-                # RGB white + alpha black (fully transparent); must use alpha=True
-                # so the PNG is saved as RGBA rather than RGB-only
-                _snow_img_name = '__gen_solid_snow_Col_CMM'
-                if _snow_img_name in bpy.data.images:
-                    bpy.data.images.remove(bpy.data.images[_snow_img_name])
-                _snow_img = bpy.data.images.new(
-                    _snow_img_name, width=256, height=256, alpha=True)
-                _snow_img.pixels[:] = [1.0, 1.0, 1.0, 0.0] * (256 * 256)
-                snow_png = os.path.join(temp_dir, '_solid_snow_Col_CMM.png')
-                _snow_img.filepath_raw = snow_png
-                _snow_img.file_format  = 'PNG'
-                _snow_img.save()
-                bpy.data.images.remove(_snow_img)
-                snow_dds = os.path.join(temp_dir, '_solid_snow_Col_CMM.dds')
-                ImageListToDDS([(snow_png, 'BC7_UNORM_SRGB')], temp_dir,
-                               effective_mipmaps)
-                if os.path.isfile(snow_dds):
-                    ConvertDDSToTex([snow_dds], snow_disk)
-                    print(f"[{self._log_tag}]   AlbedoBlendMap (snow) -> {os.path.basename(snow_disk)}")
+                # RGB white + alpha black (fully transparent)
+                snow_dds = solid_tex.write_solid_dds(
+                    os.path.join(temp_dir, '_solid_snow_Col_CMM.dds'), (1.0, 1.0, 1.0, 0.0),
+                    'BC7_UNORM_SRGB', SOLID_SLOT_SIZE, generate_mips=effective_mipmaps)
+                ConvertDDSToTex([snow_dds], snow_disk)
+                print(f"[{self._log_tag}]   AlbedoBlendMap (snow) -> {os.path.basename(snow_disk)}")
 
         _t = time.time()
         mat_obj = _call_mhwi_read_preset(preset_path, mrl3_col)
@@ -4,6 +4,7 @@ from ...core.mdf_tex_processor_base import (
     BASE_SLOT_CHANNEL_MAPS, BASE_NULL_TEX_BY_TYPE, BASE_TEXTURE_TYPE_ABBREV,
     _CH_ENUM_ITEMS,
     octahedral_normals_prop,
+    gdeflate_level_prop,
 )
 from ...core.mdf_generator_base import (
     get_shader_source_items, shader_source_update,
@@ -107,6 +108,7 @@ def _on_mhws_mesh_collection_update(self, context):
 
 class MhwsGenSettings(bpy.types.PropertyGroup):
     octahedral_normals: octahedral_normals_prop()
+    gdeflate_level: gdeflate_level_prop()
     mesh_collection: bpy.props.PointerProperty(
         name="Mesh Collection",
         type=bpy.types.Collection,
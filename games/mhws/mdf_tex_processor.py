@@ -12,6 +12,7 @@ from ...core.mdf_tex_processor_base import (
     MdfTexCopyMaterialBase, MdfTexPasteMaterialBase,
     MdfTexProcessBase,
     octahedral_normals_prop,
+    gdeflate_level_prop,
 )
 
 # ── MHWS Constants ─────────────────────────────────────────────────────────────
@@ -31,6 +32,7 @@ _on_mhws_collection_update = make_collection_update_cb(_is_null_mhws)
 
 class MdfTexProcessorSettings(bpy.types.PropertyGroup):
     octahedral_normals: octahedral_normals_prop()
+    gdeflate_level: gdeflate_level_prop()
     mdf_collection: bpy.props.PointerProperty(
         name="MDF Collection",
         type=bpy.types.Collection,
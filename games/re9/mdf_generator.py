@@ -1,7 +1,8 @@
 import bpy
 
 from ...core.i18n import T
-from ...core.mdf_tex_processor_base import _CH_ENUM_ITEMS, octahedral_normals_prop
+from ...core.mdf_tex_processor_base import (
+    _CH_ENUM_ITEMS, octahedral_normals_prop, gdeflate_level_prop)
 from .mdf_tex_processor import (
     RE9_SLOT_CHANNEL_MAPS, RE9_NULL_TEX_BY_TYPE, RE9_TEXTURE_TYPE_ABBREV,
     RE9_TEX_VERSION,
@@ -95,6 +96,7 @@ def _on_re9_mesh_collection_update(self, context):
 
 class RE9GenSettings(bpy.types.PropertyGroup):
     octahedral_normals: octahedral_normals_prop()
+    gdeflate_level: gdeflate_level_prop()
     mesh_collection: bpy.props.PointerProperty(
         name="Mesh Collection",
         type=bpy.types.Collection,
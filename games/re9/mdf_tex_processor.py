@@ -12,6 +12,7 @@ from ...core.mdf_tex_processor_base import (
     MdfTexCopyMaterialBase, MdfTexPasteMaterialBase,
     MdfTexProcessBase,
     octahedral_normals_prop,
+    gdeflate_level_prop,
 )
 
 # ── RE9 Constants ──────────────────────────────────────────────────────────────
@@ -55,6 +56,7 @@ _on_re9_collection_update = make_collection_update_cb(_is_null_re9)
 
 class RE9MdfTexProcessorSettings(bpy.types.PropertyGroup):
     octahedral_normals: octahedral_normals_prop()
+    gdeflate_level: gdeflate_level_prop()
     mdf_collection: bpy.props.PointerProperty(
         name="MDF Collection",
         type=bpy.types.Collection,
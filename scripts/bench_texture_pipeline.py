@@ -0,0 +1,342 @@
+"""Benchmarks for the texture pipeline's hot paths, against a saved baseline.
+
+The speed claims in this addon mostly live in comments -- the foreach_get note
+in mdf_tex_processor_base, the row-band and PNG-writer numbers in commit
+messages -- and nothing re-measures them.  This times the paths those claims
+are about on deterministic synthetic textures and writes the numbers as JSON,
+so a regression shows up as a ratio against the last good run:
+
+* ``compose/<slot>/<layout>/<size>`` -- mdf_tex_processor_base._compose_channels
+  from PNG sources to a PNG, for 8-bit RGBA / RGB / grey and 16-bit RGBA colour.
+* ``normal_ga/{encode,decode}/<size>`` -- re_normal_pack on float32 planes.
+* ``tex/build/<version>/<size>`` -- tex_file.build_tex_from_dds for a BC7 chain,
+  plain and GDeflate (MHWilds) containers.
+* ``tex/read/<size>`` -- tex_file.read_tex_to_dds of the whole chain.
+* ``gdeflate/roundtrip/<size>`` -- gdeflate_native compress + decompress of mip 0.
+
+Cases whose dependencies are missing are reported as skipped with the reason:
+compose needs ``bpy`` (run it through Blender), GDeflate its native library.
+
+Usage, from the repository root::
+
+    python scripts/bench_texture_pipeline.py --out bench.json
+    python scripts/bench_texture_pipeline.py --baseline bench.json --out now.json
+    blender -b --factory-startup --python scripts/bench_texture_pipeline.py -- \\
+        --sizes 1024,4096 --baseline bench.json
+
+With ``--baseline`` every case is compared on its best time, and the exit
+status is 1 when any is slower than ``1 + --threshold`` times the baseline.
+Timings only compare across runs on the same machine.
+"""
+
+import argparse
+import datetime
+import fnmatch
+import importlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RE4_TEX_VERSION = 143221013
+MHWS_TEX_VERSION = 241106027
+
+#: layout -> (channels, dtype name)
+LAYOUTS = {
+    'rgba8': (4, 'uint8'),
+    'rgb8': (3, 'uint8'),
+    'grey8': (1, 'uint8'),
+    'rgba16': (4, 'uint16'),
+}
+
+
+# ── Loading the addon's modules ──────────────────────────────────────────────
+
+def _load_core():
+    """The addon's ``core`` package.  Inside Blender the addon imports as
+    usual; outside it the package is entered without running its
+    ``__init__`` (which registers Blender classes), so the bpy-free modules
+    still load."""
+    name = os.path.basename(ROOT)
+    parent = os.path.dirname(ROOT)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    try:
+        import bpy  # noqa: F401
+    except ImportError:
+        if name not in sys.modules:
+            pkg = types.ModuleType(name)
+            pkg.__path__ = [ROOT]
+            sys.modules[name] = pkg
+    return importlib.import_module(f"{name}.core")
+
+
+def _module(core, name):
+    return importlib.import_module(f"{core.__name__}.{name}")
+
+
+# ── Fixtures ─────────────────────────────────────────────────────────────────
+
+def fixture(size, layout, seed=0):
+    """A deterministic ``(size, size, C)`` image: gradients plus noise, so it
+    compresses and filters like a texture rather than like white noise."""
+    import numpy as np
+    channels, dtype = LAYOUTS[layout]
+    top = np.iinfo(dtype).max
+    rng = np.random.default_rng(seed)
+    ramp = np.linspace(0.0, 1.0, size, dtype=np.float32)
+    out = np.empty((size, size, channels), dtype=dtype)
+    for c in range(channels):
+        base = ramp[None, :] if c % 2 == 0 else ramp[:, None]
+        noise = rng.random((size, size), dtype=np.float32) * 0.125
+        plane = (base * 0.875 + noise) * top
+        out[..., c] = plane.astype(dtype)
+    return out
+
+
+def bc7_dds(core, size, seed=0):
+    """A BC7 DDSFile with a full chain of random block data -- the container
+    code never looks inside the blocks."""
+    import numpy as np
+    dds_file, dxgi, mip_chain = (_module(core, n) for n in ('dds_file', 'dxgi_format',
+                                                            'mip_chain'))
+    rng = np.random.default_rng(seed)
+    dds = dds_file.DDSFile()
+    dds.width = dds.height = size
+    dds.dxgi_format = dxgi.DXGI_FORMAT['BC7_UNORM_SRGB']
+    for level in range(mip_chain.mip_count(size, size)):
+        s = max(1, size >> level)
+        dds.mips.append(rng.integers(0, 256, dxgi.get_image_size(dds.dxgi_format, s, s),
+                                     dtype=np.uint8).tobytes())
+    dds.mip_count = len(dds.mips)
+    return dds
+
+
+# ── Timing ───────────────────────────────────────────────────────────────────
+
+class Skip(Exception):
+    """A case that cannot run here; the message says why."""
+
+
+def measure(fn, repeat, warmup):
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return {'best': min(times), 'median': statistics.median(times), 'runs': repeat}
+
+
+# ── Cases ────────────────────────────────────────────────────────────────────
+# Each yields (name, pixels per run or None, setup) where setup() returns the
+# callable to time, or raises Skip.
+
+def compose_cases(core, sizes, work_dir):
+    def setup(slot, layout, size):
+        def prepare():
+            try:
+                base = _module(core, 'mdf_tex_processor_base')
+            except ImportError as e:
+                raise Skip(f"needs Blender ({e})")
+            image_io = _module(core, 'image_io')
+            d = os.path.join(work_dir, f"compose_{slot}_{layout}_{size}")
+            os.makedirs(d, exist_ok=True)
+            main, second = (('color', 'metallic') if slot == 'BaseDielectricMap'
+                            else ('normal', 'roughness'))
+            paths = {main: image_io.write_png(os.path.join(d, f"{main}.png"),
+                                              fixture(size, layout, 1)),
+                     second: image_io.write_png(os.path.join(d, f"{second}.png"),
+                                                fixture(size, 'grey8', 2))}
+            return lambda: base._compose_channels(slot, paths, {}, d, 'bench')
+        return prepare
+
+    for size in sizes:
+        for layout in LAYOUTS:
+            yield (f"compose/BaseDielectricMap/{layout}/{size}", size * size,
+                   setup('BaseDielectricMap', layout, size))
+        yield (f"compose/NormalRoughnessMap/rgb8/{size}", size * size,
+               setup('NormalRoughnessMap', 'rgb8', size))
+
+
+def normal_cases(core, sizes):
+    def setup(size, decode):
+        def prepare():
+            import numpy as np
+            pack = _module(core, 're_normal_pack')
+            planes = fixture(size, 'rgba8', 3)[..., :2].astype(np.float32) / 255.0
+            g, a = planes[..., 0], planes[..., 1]
+            fn = pack.decode_normal_ga if decode else pack.encode_normal_ga
+            return lambda: fn(g, a)
+        return prepare
+
+    for size in sizes:
+        yield f"normal_ga/encode/{size}", size * size, setup(size, False)
+        yield f"normal_ga/decode/{size}", size * size, setup(size, True)
+
+
+def _need_gdeflate(core):
+    try:
+        _module(core, 'gdeflate_native')._load_dll()
+    except (OSError, RuntimeError, AttributeError) as e:
+        raise Skip(f"GDeflate library unavailable ({e})")
+
+
+def tex_cases(core, sizes, work_dir):
+    def build(size, version):
+        def prepare():
+            tex_file = _module(core, 'tex_file')
+            if version in tex_file.GDEFLATE_VERSIONS:
+                _need_gdeflate(core)
+            dds = bc7_dds(core, size)
+            return lambda: tex_file.build_tex_from_dds(dds, version)
+        return prepare
+
+    def read(size):
+        def prepare():
+            tex_file = _module(core, 'tex_file')
+            path = os.path.join(work_dir, f"read_{size}.tex.{RE4_TEX_VERSION}")
+            with open(path, 'wb') as f:
+                tex_file.write_tex(f, bc7_dds(core, size), RE4_TEX_VERSION)
+            return lambda: tex_file.read_tex_to_dds(path, all_mips=True)
+        return prepare
+
+    def roundtrip(size):
+        def prepare():
+            _need_gdeflate(core)
+            gd = _module(core, 'gdeflate_native')
+            data = bc7_dds(core, size).mips[0]
+            return lambda: gd.decompress(gd.compress(data))
+        return prepare
+
+    for size in sizes:
+        yield f"tex/build/{RE4_TEX_VERSION}/{size}", size * size, build(size, RE4_TEX_VERSION)
+        yield f"tex/build/{MHWS_TEX_VERSION}/{size}", size * size, build(size, MHWS_TEX_VERSION)
+        yield f"tex/read/{size}", size * size, read(size)
+        yield f"gdeflate/roundtrip/{size}", size * size, roundtrip(size)
+
+
+# ── Reporting ────────────────────────────────────────────────────────────────
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', '-C', ROOT, 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def metadata():
+    import numpy as np
+    meta = {
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+    try:
+        import bpy
+        meta['blender'] = bpy.app.version_string
+    except ImportError:
+        meta['blender'] = None
+    return meta
+
+
+def compare(results, baseline, threshold):
+    """``[(name, base best, now best, ratio, regressed)]`` for the cases both
+    runs timed."""
+    rows = []
+    old = baseline.get('results', {})
+    for name, now in results.items():
+        then = old.get(name)
+        if not then or 'best' not in then or 'best' not in now:
+            continue
+        ratio = now['best'] / then['best'] if then['best'] > 0 else float('inf')
+        rows.append((name, then['best'], now['best'], ratio, ratio > 1.0 + threshold))
+    return rows
+
+
+def _args(argv):
+    if '--' in argv:
+        argv = argv[argv.index('--') + 1:]   # under Blender
+    elif argv and os.path.basename(argv[0]).lower().startswith('blender'):
+        argv = []
+    else:
+        argv = argv[1:]
+    p = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    p.add_argument('--sizes', default='1024,2048',
+                   help="comma-separated square sizes (default 1024,2048; up to 8192)")
+    p.add_argument('--repeat', type=int, default=3, help="timed runs per case")
+    p.add_argument('--warmup', type=int, default=1, help="untimed runs per case")
+    p.add_argument('--only', action='append', default=[],
+                   help="fnmatch pattern on case names; repeatable")
+    p.add_argument('--out', default='bench_results.json', help="JSON results file")
+    p.add_argument('--baseline', help="earlier results to compare against")
+    p.add_argument('--threshold', type=float, default=0.15,
+                   help="allowed slowdown before a case counts as a regression")
+    return p.parse_args(argv)
+
+
+def main(argv):
+    args = _args(argv)
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    core = _load_core()
+    work_dir = tempfile.mkdtemp(prefix='mt_bench_')
+    results = {}
+    try:
+        cases = [*compose_cases(core, sizes, work_dir), *normal_cases(core, sizes),
+                 *tex_cases(core, sizes, work_dir)]
+        for name, pixels, prepare in cases:
+            if args.only and not any(fnmatch.fnmatch(name, pat) for pat in args.only):
+                continue
+            try:
+                run = prepare()
+            except Skip as e:
+                results[name] = {'skipped': str(e)}
+                print(f"{name:48s} skipped: {e}")
+                continue
+            r = measure(run, max(1, args.repeat), max(0, args.warmup))
+            if pixels:
+                r['mpix_per_s'] = pixels / r['best'] / 1e6 if r['best'] > 0 else None
+            results[name] = r
+            print(f"{name:48s} best {r['best'] * 1000:9.2f} ms  median {r['median'] * 1000:9.2f} ms")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    report = {'meta': metadata(), 'settings': vars(args), 'results': results}
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline, args.threshold)
+        report['baseline'] = {'path': args.baseline, 'meta': baseline.get('meta'),
+                              'threshold': args.threshold,
+                              'ratios': {name: ratio for name, _b, _n, ratio, _r in rows}}
+        print(f"\nagainst {args.baseline} (regression above x{1 + args.threshold:.2f}):")
+        for name, then, now, ratio, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{name:48s} {then * 1000:9.2f} -> {now * 1000:9.2f} ms  x{ratio:.2f}{flag}")
+        regressions = [row[0] for row in rows if row[4]]
+        report['baseline']['regressions'] = regressions
+        status = 1 if regressions else 0
+
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"\nwrote {args.out}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))